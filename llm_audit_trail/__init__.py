@@ -15,31 +15,58 @@ from .core import (
     SCHEMA_VERSION,
     AuditLogError,
     AuditLogger,
+    Durability,
     iter_events,
+    iter_verification,
     read_anchor,
     read_head,
     verify_log,
     write_anchor,
 )
-from .datasets import dataset_attestation, register_dataset
+from .binary import BinaryStorage
+from .blobs import BlobError, BlobStore
+from .events import Event
+from .datasets import dataset_attestation, register_dataset, registered_manifest
 from .decisions import record_approval, record_attestation, record_waiver
+from .governance import governance_state
+from .hashing import hash_dataset
 from .registry import EventTypes
+from .replication import replicate
+from .storage import SQLiteStorage, convert_ledger
+from .timeline import ChainError, merge_events
+from .validation import SchemaValidationError, validate_log
 
 __all__ = [
     "__version__",
     "AuditLogger",
     "AuditLogError",
+    "Durability",
     "verify_log",
+    "iter_verification",
     "iter_events",
+    "Event",
     "read_head",
     "write_anchor",
     "read_anchor",
+    "BlobStore",
+    "BlobError",
+    "SQLiteStorage",
+    "BinaryStorage",
+    "convert_ledger",
+    "merge_events",
+    "replicate",
+    "ChainError",
     "register_dataset",
+    "registered_manifest",
     "dataset_attestation",
+    "hash_dataset",
+    "governance_state",
     "record_approval",
     "record_waiver",
     "record_attestation",
     "EventTypes",
+    "SchemaValidationError",
+    "validate_log",
     "DEFAULT_LOG_PATH",
     "SCHEMA_VERSION",
     "GENESIS",
@@ -0,0 +1,692 @@
+"""Compact binary encoding of ledger events.
+
+JSON lines repeat every field name, spell digests as 64 hex characters and
+must be parsed in full before anything can be checked. A ledger whose path
+ends in ``.alog`` (or whose file starts with :data:`MAGIC`) stores each event
+as a binary record instead::
+
+    u32 length | body | curr_hash (32 raw bytes) | u32 length
+
+The body is the event's deterministic binary form: a fixed header (format
+version, a mask saying which fixed slots are filled, hash algorithm code,
+``seq`` as i64, ``timestamp`` as i64 microseconds since the epoch,
+``prev_hash`` as 32 raw bytes, ``event_id`` as 16 raw bytes), then the
+string fields as length-prefixed UTF-8 with the library's event types
+reduced to one-byte codes, then ``details`` as canonical JSON. Anything the
+fixed slots cannot hold exactly — an unexpected field, a ``seq`` that is not
+an integer, a timestamp in another format — goes into a trailing canonical
+JSON object, so every event converts to and from JSON losslessly.
+
+Events written to a binary ledger use ``hash_alg`` ``"sha256-bin"`` (or
+``"hmac-sha256-bin"``): ``curr_hash`` is the digest of the body itself,
+which already contains the previous hash. Verifying one reads the body
+bytes and hashes them, with no JSON work at all. The same events converted
+to JSON lines still verify, by re-encoding them to the body; events that
+came from a JSON ledger keep their JSON hash algorithm inside a binary one.
+
+Readers share the JSONL semantics: a record is committed once it is
+complete, so an incomplete final record is left out as pending, and
+appends refuse to continue past one until :meth:`AuditLogger.recover
+<llm_audit_trail.AuditLogger.recover>` quarantines it. A final record whose
+bytes are all there but whose lengths disagree was not torn but damaged:
+verification reports it and recovery leaves it in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import re
+import struct
+import threading
+import uuid
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .registry import EventTypes
+from .storage import Builder, LedgerStorage
+
+__all__ = [
+    "MAGIC",
+    "BINARY_SUFFIXES",
+    "SHA256_BIN",
+    "HMAC_SHA256_BIN",
+    "BinaryRecord",
+    "BinaryStorage",
+    "encode_body",
+    "decode_body",
+    "encode_record",
+    "chain_digest",
+    "is_binary_ledger",
+]
+
+MAGIC = b"LLMAUDB1"
+BINARY_SUFFIXES = (".alog",)
+FORMAT_VERSION = 1
+
+SHA256_BIN = "sha256-bin"
+HMAC_SHA256_BIN = "hmac-sha256-bin"
+BINARY_ALGS = (SHA256_BIN, HMAC_SHA256_BIN)
+
+# Hash algorithm codes. Append only: codes are part of the hashed bytes.
+_ALGS = ("sha256", "hmac-sha256", SHA256_BIN, HMAC_SHA256_BIN)
+_OTHER_ALG = 255
+
+# Event types with a one-byte code. Append only, for the same reason.
+INTERNED_EVENT_TYPES = (
+    EventTypes.APPROVAL,
+    EventTypes.RISK_WAIVER,
+    EventTypes.ATTESTATION,
+    EventTypes.DATASET_REGISTERED,
+    EventTypes.DATASET_ATTESTATION,
+    EventTypes.FINE_TUNE_START,
+    EventTypes.FINE_TUNE_END,
+    EventTypes.EPOCH_END,
+    EventTypes.EVALUATION,
+    EventTypes.CHECKPOINT,
+    EventTypes.CHECKPOINT_HASHED,
+    EventTypes.RANK_SUMMARY,
+    EventTypes.STEP_SUMMARY,
+    EventTypes.INFERENCE_REQUEST,
+    EventTypes.INFERENCE_RESPONSE,
+    EventTypes.RECOVERY_PERFORMED,
+)
+_EVENT_CODES = {name: code for code, name in enumerate(INTERNED_EVENT_TYPES)}
+
+_GENESIS = "GENESIS"
+_HEADER = struct.Struct("<BHBqq32s16s")  # version, mask, alg, seq, µs, prev, id
+_LENGTH = struct.Struct("<I")
+_FRAMING = 2 * _LENGTH.size + 32
+# Larger length prefixes are damage, not a record still being written.
+_MAX_RECORD = 1 << 30
+
+# mask bits: which fixed slots hold the event's value
+_SEQ = 1 << 0
+_TIMESTAMP = 1 << 1
+_PREV = 1 << 2
+_PREV_GENESIS = 1 << 3
+_EVENT_ID = 1 << 4
+_ALG = 1 << 5
+_STRINGS = (
+    "schema_version",
+    "event_type",
+    "actor",
+    "system",
+    "model_id",
+    "dataset_id",
+    "deployment_id",
+)
+_STRING_BITS = tuple(1 << (6 + i) for i in range(len(_STRINGS)))
+_DETAILS = 1 << 13
+_SLOTS = frozenset(
+    ("seq", "timestamp", "prev_hash", "event_id", "hash_alg", "details", "curr_hash")
+    + _STRINGS
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_TIMESTAMP_FORMAT = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z")
+
+
+def is_binary_ledger(path: str) -> bool:
+    if path.lower().endswith(BINARY_SUFFIXES):
+        return True
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# --------------------------------------------------------------------------
+# canonical body
+# --------------------------------------------------------------------------
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _timestamp_us(value: Any) -> Optional[int]:
+    """Microseconds since the epoch, if ``value`` is in the ledger's format."""
+    if not isinstance(value, str) or not _TIMESTAMP_FORMAT.fullmatch(value):
+        return None
+    try:
+        moment = datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(value[20:26]),
+        )
+    except ValueError:
+        return None
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _format_us(micros: int) -> str:
+    return (_EPOCH + micros * _MICROSECOND).isoformat(timespec="microseconds") + "Z"
+
+
+def _digest_bytes(value: Any) -> Optional[bytes]:
+    if isinstance(value, str) and len(value) == 64 and value == value.lower():
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _uuid_bytes(value: Any) -> Optional[bytes]:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = uuid.UUID(value)
+    except ValueError:
+        return None
+    return parsed.bytes if str(parsed) == value else None
+
+
+def _text(value: Optional[str]) -> bytes:
+    if value is None:
+        return b"\0"
+    data = value.encode("utf-8")
+    return _varint(len(data) + 1) + data
+
+
+def encode_body(event: Dict[str, Any]) -> bytes:
+    """The canonical binary body of ``event`` (``curr_hash`` is left out).
+
+    Raises:
+        ValueError: if ``event`` has values JSON cannot represent.
+    """
+    from .core import _stable_json
+
+    mask = 0
+    extras = {k: v for k, v in event.items() if k not in _SLOTS}
+
+    seq = event.get("seq", 0)
+    if "seq" in event:
+        if type(seq) is int and -(1 << 63) <= seq < (1 << 63):
+            mask |= _SEQ
+        else:
+            extras["seq"], seq = seq, 0
+
+    micros = 0
+    if "timestamp" in event:
+        found = _timestamp_us(event["timestamp"])
+        if found is not None and -(1 << 63) <= found < (1 << 63):
+            mask |= _TIMESTAMP
+            micros = found
+        else:
+            extras["timestamp"] = event["timestamp"]
+
+    prev = bytes(32)
+    if "prev_hash" in event:
+        value = event["prev_hash"]
+        raw = _digest_bytes(value)
+        if value == _GENESIS:
+            mask |= _PREV_GENESIS
+        elif raw is not None:
+            mask |= _PREV
+            prev = raw
+        else:
+            extras["prev_hash"] = value
+
+    event_id = bytes(16)
+    if "event_id" in event:
+        raw = _uuid_bytes(event["event_id"])
+        if raw is not None:
+            mask |= _EVENT_ID
+            event_id = raw
+        else:
+            extras["event_id"] = event["event_id"]
+
+    alg = _OTHER_ALG
+    if "hash_alg" in event:
+        if event["hash_alg"] in _ALGS:
+            mask |= _ALG
+            alg = _ALGS.index(event["hash_alg"])
+        else:
+            extras["hash_alg"] = event["hash_alg"]
+
+    parts = [b""]
+    for name, bit in zip(_STRINGS, _STRING_BITS):
+        if name not in event:
+            continue
+        value = event[name]
+        if value is not None and not isinstance(value, str):
+            extras[name] = value
+            continue
+        mask |= bit
+        if name == "event_type" and value in _EVENT_CODES:
+            parts.append(_varint(_EVENT_CODES[value] + 2))
+        elif name == "event_type":
+            parts.append(b"\1" + _text(value) if value is not None else b"\0")
+        else:
+            parts.append(_text(value))
+
+    if "details" in event:
+        mask |= _DETAILS
+        data = _stable_json(event["details"]).encode("utf-8")  # type: ignore[arg-type]
+        parts.append(_varint(len(data)) + data)
+
+    data = _stable_json(extras).encode("utf-8") if extras else b""
+    parts.append(_varint(len(data)) + data)
+
+    parts[0] = _HEADER.pack(FORMAT_VERSION, mask, alg, seq, micros, prev, event_id)
+    return b"".join(parts)
+
+
+def _read_text(body: bytes, pos: int) -> Tuple[Optional[str], int]:
+    size, pos = _read_varint(body, pos)
+    if size == 0:
+        return None, pos
+    end = pos + size - 1
+    if end > len(body):
+        raise ValueError("string runs past the end of the record")
+    return body[pos:end].decode("utf-8"), end
+
+
+def decode_body(
+    body: bytes,
+    *,
+    details: bool = True,
+    object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> Dict[str, Any]:
+    """The event encoded in ``body``, without ``curr_hash``.
+
+    ``details=False`` skips decoding ``details`` (and leaves the key out).
+
+    Raises:
+        ValueError: if ``body`` is not a well-formed body.
+    """
+    try:
+        version, mask, alg, seq, micros, prev, event_id = _HEADER.unpack_from(body, 0)
+    except struct.error as exc:
+        raise ValueError(f"record too short: {exc}") from None
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unknown binary record version {version}")
+    event: Dict[str, Any] = {}
+    if mask & _SEQ:
+        event["seq"] = seq
+    if mask & _TIMESTAMP:
+        event["timestamp"] = _format_us(micros)
+    if mask & _PREV_GENESIS:
+        event["prev_hash"] = _GENESIS
+    elif mask & _PREV:
+        event["prev_hash"] = prev.hex()
+    if mask & _EVENT_ID:
+        event["event_id"] = str(uuid.UUID(bytes=event_id))
+    if mask & _ALG:
+        if alg >= len(_ALGS):
+            raise ValueError(f"unknown hash algorithm code {alg}")
+        event["hash_alg"] = _ALGS[alg]
+
+    try:
+        pos = _HEADER.size
+        for name, bit in zip(_STRINGS, _STRING_BITS):
+            if not mask & bit:
+                continue
+            if name == "event_type":
+                code, pos = _read_varint(body, pos)
+                if code == 0:
+                    event[name] = None
+                elif code == 1:
+                    event[name], pos = _read_text(body, pos)
+                else:
+                    event[name] = INTERNED_EVENT_TYPES[code - 2]
+            else:
+                event[name], pos = _read_text(body, pos)
+        if mask & _DETAILS:
+            size, pos = _read_varint(body, pos)
+            if details:
+                event["details"] = json.loads(body[pos : pos + size], object_hook=object_hook)
+            pos += size
+        size, pos = _read_varint(body, pos)
+        if size:
+            event.update(json.loads(body[pos : pos + size]))
+            pos += size
+    except IndexError:
+        raise ValueError("record ends mid-field") from None
+    if pos != len(body):
+        raise ValueError("unexpected bytes after the last field")
+    return event
+
+
+def chain_digest(body: bytes, key: Optional[bytes]) -> str:
+    """``curr_hash`` for a ``*-bin`` event: the digest of its body."""
+    if key is not None:
+        return hmac.new(key, body, hashlib.sha256).hexdigest()
+    return hashlib.sha256(body).hexdigest()
+
+
+def encode_record(body: bytes, curr_hash: str) -> bytes:
+    """Frame a body and its hash as one ledger record."""
+    digest = _digest_bytes(curr_hash)
+    if digest is None:
+        raise ValueError(f"curr_hash is not a lowercase SHA-256 hex digest: {curr_hash!r}")
+    size = _LENGTH.pack(len(body))
+    return size + body + digest + size
+
+
+class BinaryRecord:
+    """One framed record as read from a binary ledger."""
+
+    __slots__ = ("body", "digest", "error")
+
+    def __init__(self, body: bytes, digest: bytes, error: Optional[str] = None) -> None:
+        self.body = body
+        self.digest = digest
+        self.error = error  # set when the framing itself is damaged
+
+    @property
+    def curr_hash(self) -> str:
+        return self.digest.hex()
+
+    def decode(
+        self,
+        *,
+        details: bool = True,
+        object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        event = decode_body(self.body, details=details, object_hook=object_hook)
+        event["curr_hash"] = self.curr_hash
+        return event
+
+    @property
+    def has_details(self) -> bool:
+        return bool(_HEADER.unpack_from(self.body, 0)[1] & _DETAILS)
+
+    def chain_fields(self) -> Optional[Dict[str, Any]]:
+        """``seq``, ``prev_hash``, ``hash_alg``, ``event_id`` and ``curr_hash``
+        from the fixed header alone, or None if any of the first three is
+        not held there (decode the record instead).
+        """
+        _, mask, alg, seq, _, prev, event_id = _HEADER.unpack_from(self.body, 0)
+        if not (mask & _SEQ and mask & _ALG and mask & (_PREV | _PREV_GENESIS)):
+            return None
+        if alg >= len(_ALGS):
+            return None
+        fields = {
+            "seq": seq,
+            "prev_hash": _GENESIS if mask & _PREV_GENESIS else prev.hex(),
+            "hash_alg": _ALGS[alg],
+            "curr_hash": self.digest.hex(),
+        }
+        if mask & _EVENT_ID:
+            fields["event_id"] = str(uuid.UUID(bytes=event_id))
+        return fields
+
+    def timestamp_us(self) -> Optional[int]:
+        """The fixed-slot timestamp, without decoding anything else."""
+        _, mask, _, _, micros, _, _ = _HEADER.unpack_from(self.body, 0)
+        return micros if mask & _TIMESTAMP else None
+
+
+# --------------------------------------------------------------------------
+# files
+# --------------------------------------------------------------------------
+
+
+class _Records:
+    """``(offset, BinaryRecord)`` for each complete record of a handle.
+
+    Like :class:`~llm_audit_trail.core._CommittedLines`, an incomplete final
+    record is counted in ``pending_bytes`` rather than yielded. A record
+    whose framing is inconsistent (including a final one whose leading
+    length overshoots while its trailing length spans exactly to the end)
+    is yielded with ``error`` set, and ends the iteration: nothing after it
+    can be located.
+    """
+
+    def __init__(self, fh: Any, start: int = len(MAGIC)) -> None:
+        self.fh = fh
+        self.start = start
+        self.pending_bytes = 0
+        self.end = start
+
+    def __iter__(self) -> Iterator[Tuple[int, BinaryRecord]]:
+        fh = self.fh
+        size = os.fstat(fh.fileno()).st_size
+        fh.seek(0)
+        if size and fh.read(len(MAGIC)) != MAGIC:
+            yield 0, BinaryRecord(b"", b"", "not a binary ledger")
+            return
+        pos = self.start
+        fh.seek(pos)
+        while pos < size:
+            head = fh.read(_LENGTH.size)
+            if len(head) < _LENGTH.size:
+                self.pending_bytes = size - pos
+                return
+            (length,) = _LENGTH.unpack(head)
+            if length > _MAX_RECORD:
+                yield pos, BinaryRecord(b"", b"", f"implausible record length {length}")
+                return
+            rest = fh.read(length + 32 + _LENGTH.size)
+            if len(rest) < length + 32 + _LENGTH.size:
+                if _spans_to_end(fh, pos, size):
+                    # all there, but the leading length was altered
+                    yield pos, BinaryRecord(b"", b"", "record framing is inconsistent")
+                    return
+                self.pending_bytes = size - pos
+                return
+            if rest[-_LENGTH.size :] != head:
+                yield pos, BinaryRecord(b"", b"", "record framing is inconsistent")
+                return
+            yield pos, BinaryRecord(rest[:length], rest[length : length + 32])
+            pos += length + _FRAMING
+            self.end = pos
+
+
+def _spans_to_end(fh: Any, pos: int, size: int) -> bool:
+    """Whether the trailing length at ``size`` frames a record starting at ``pos``."""
+    if size - pos < _FRAMING:
+        return False
+    fh.seek(size - _LENGTH.size)
+    (length,) = _LENGTH.unpack(fh.read(_LENGTH.size))
+    return pos + _FRAMING + length == size
+
+
+def _last_record(fh: Any, size: int) -> Tuple[Optional[BinaryRecord], bool]:
+    """The final record, read backwards from ``size``; and whether it is intact."""
+    if size <= len(MAGIC):
+        return None, size == len(MAGIC)
+    if size < len(MAGIC) + _FRAMING:
+        return None, False
+    fh.seek(size - _LENGTH.size)
+    tail = fh.read(_LENGTH.size)
+    (length,) = _LENGTH.unpack(tail)
+    start = size - _FRAMING - length
+    if length > _MAX_RECORD or start < len(MAGIC):
+        return None, False
+    fh.seek(start)
+    raw = fh.read(_FRAMING + length)
+    if raw[: _LENGTH.size] != tail:
+        return None, False
+    return BinaryRecord(raw[_LENGTH.size : _LENGTH.size + length], raw[-36:-4]), True
+
+
+def _scan_tail(fh: Any) -> Tuple[int, bool]:
+    """Where the readable records end, and whether what follows is torn.
+
+    Bytes after the last readable record are a torn write only if they fall
+    short of the record they begin. A final record whose bytes are all there
+    but whose framing does not add up was damaged after it was written.
+    """
+    records = _Records(fh)
+    for _ in records:
+        pass
+    return records.end, records.pending_bytes > 0
+
+
+def _damaged_tail(path: str, offset: int) -> str:
+    return (
+        f"{path}: the record at byte {offset} is complete but its framing is "
+        f"damaged; it is not a torn write and was left in place (see `llm-audit verify`)"
+    )
+
+
+class BinaryStorage(LedgerStorage):
+    """A binary ledger file (see the module docstring).
+
+    Appends take the same thread and file locks as JSONL appends and write
+    each batch of records in one call, so readers never see a record half
+    way through except at the very end of the file.
+
+    Args:
+        path: Ledger file.
+        create: Create it if missing. Otherwise it must exist.
+    """
+
+    binary = True
+
+    def __init__(self, path: str, *, create: bool = False) -> None:
+        self.path = path
+        if create:
+            from .core import _file_lock
+
+            with open(path, "ab") as fh, _file_lock(fh):
+                if fh.tell() == 0:
+                    fh.write(MAGIC)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+        elif not os.path.exists(path):
+            raise FileNotFoundError(f"no such ledger: {path}")
+        self._lock = threading.Lock()
+
+    def head(self) -> Optional[Dict[str, Any]]:
+        with open(self.path, "rb") as fh:
+            record, intact = _last_record(fh, os.fstat(fh.fileno()).st_size)
+            if not intact:
+                # a write in flight: fall back to the last complete record
+                for _, record in _Records(fh):  # noqa: B007
+                    pass
+        if record is None or record.error:
+            return None
+        event = record.decode(details=False)
+        return {
+            "seq": event.get("seq"),
+            "hash": record.curr_hash,
+            "timestamp": event.get("timestamp"),
+        }
+
+    def lines(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        match: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Tuple[int, BinaryRecord]]:
+        return _StoredRecords(self.path, since, until)
+
+    def append(
+        self,
+        build: Builder,
+        durability: str,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        from .core import AuditLogError, Durability, _file_lock, _open_ledger, _sync, _write_lines
+
+        timings = {} if timings is None else timings
+        with self._lock, _open_ledger(self.path) as fh, _file_lock(fh):
+            size = os.fstat(fh.fileno()).st_size
+            record, intact = _last_record(fh, size)
+            if not intact:
+                offset, torn = _scan_tail(fh)
+                if not torn:
+                    raise AuditLogError(_damaged_tail(self.path, offset))
+                raise AuditLogError(
+                    f"{self.path}: final record is incomplete, probably a torn write "
+                    f"from a crash; run `llm-audit recover` (or pass auto_recover=True) "
+                    f"to quarantine it"
+                )
+            previous = None
+            if record is not None:
+                previous = record.chain_fields() or record.decode(details=False)
+            events, lines = build(previous)
+            mark = perf_counter()
+            _write_lines(fh, lines)
+            now = perf_counter()
+            timings["write"] = now - mark
+            if durability != Durability.WRITTEN:
+                _sync(fh, "fsync")
+                timings["fsync"] = perf_counter() - now
+        return events
+
+    def quarantine_torn_tail(self) -> Optional[Tuple[int, bytes, str]]:
+        """Move an incomplete final record aside; ``(offset, bytes, side_path)``.
+
+        Raises:
+            AuditLogError: if the final record is complete but damaged. It
+                is committed, so it stays where verification will report it.
+        """
+        from .core import AuditLogError, _file_lock, _open_ledger
+
+        with self._lock, _open_ledger(self.path) as fh, _file_lock(fh):
+            size = os.fstat(fh.fileno()).st_size
+            if _last_record(fh, size)[1]:
+                return None
+            offset, torn = _scan_tail(fh)
+            if not torn:
+                if offset == size:
+                    return None
+                raise AuditLogError(_damaged_tail(self.path, offset))
+            fh.seek(offset)
+            tail = fh.read()
+            side_path = f"{self.path}.torn-{offset}"
+            with open(side_path, "ab") as side:
+                side.write(tail)
+                side.flush()
+                os.fsync(side.fileno())
+            fh.truncate(offset)
+            os.fsync(fh.fileno())
+        return offset, tail, side_path
+
+
+class _StoredRecords:
+    """Iterable of a binary ledger's records within a time window."""
+
+    def __init__(self, path: str, since: Optional[str], until: Optional[str]) -> None:
+        self.path = path
+        self.since = _timestamp_us(since) if since is not None else None
+        self.until = _timestamp_us(until) if until is not None else None
+        self.pending_bytes = 0
+
+    def __iter__(self) -> Iterator[Tuple[int, BinaryRecord]]:
+        with open(self.path, "rb") as fh:
+            records = _Records(fh)
+            for pos, record in records:
+                if not record.error and (self.since is not None or self.until is not None):
+                    micros = record.timestamp_us()
+                    if micros is not None:
+                        if self.until is not None and micros >= self.until:
+                            break
+                        if self.since is not None and micros < self.since:
+                            continue
+                yield pos, record
+            self.pending_bytes = records.pending_bytes
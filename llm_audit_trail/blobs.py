@@ -0,0 +1,143 @@
+"""Content-addressed storage for large event ``details``.
+
+Full training arguments, evaluation reports and long previews make every
+ledger line heavy, and identical payloads (the same ``FineTuneStart``
+config run after run) are written again each time. A logger created with
+``blob_dir=`` writes any ``details`` whose canonical JSON exceeds
+``blob_threshold`` bytes to a :class:`BlobStore` instead and chains a
+reference in its place::
+
+    {"$blob": "sha256:<hex>", "bytes": <size>}
+
+The digest is part of the hashed event, so the chain still commits to the
+content: a blob that is altered no longer matches its reference. Blobs are
+stored once per digest under ``<dir>/<first two hex digits>/<rest>`` and are
+never modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional, Union
+
+__all__ = ["BlobStore", "BlobError", "BLOB_KEY", "is_blob_ref"]
+
+BLOB_KEY = "$blob"
+_PREFIX = "sha256:"
+
+
+class BlobError(RuntimeError):
+    """A referenced blob is missing or does not match its digest."""
+
+    def __init__(self, code: str, digest: str, detail: str) -> None:
+        super().__init__(f"{digest}: {detail}")
+        self.code = code
+        self.digest = digest
+
+
+def is_blob_ref(details: Any) -> bool:
+    """Whether ``details`` is a reference written in place of a stored blob."""
+    return isinstance(details, dict) and isinstance(details.get(BLOB_KEY), str)
+
+
+class BlobStore:
+    """A directory of immutable blobs named by their SHA-256.
+
+    Args:
+        root: Directory holding the blobs. Created on first write.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def path_for(self, digest: str) -> str:
+        if not digest.startswith(_PREFIX) or len(digest) != len(_PREFIX) + 64:
+            raise ValueError(f"not a sha256 blob digest: {digest!r}")
+        hexdigest = digest[len(_PREFIX) :]
+        return os.path.join(self.root, hexdigest[:2], hexdigest[2:])
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` unless it is already there; return its digest."""
+        digest = _PREFIX + hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            return digest  # same digest, same bytes: nothing to write
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # every writer gets its own temporary file: threads and processes
+        # storing the same payload at once must not share one
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with open(fd, "wb") as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            if not os.path.exists(path):  # else another writer stored it first
+                # a blob must be durable before an event referencing it can be
+                os.replace(tmp, path)
+                tmp = None
+        finally:
+            if tmp is not None:
+                os.unlink(tmp)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """The blob's bytes, checked against ``digest``.
+
+        Raises:
+            BlobError: ``blob_missing`` or ``blob_mismatch``.
+        """
+        try:
+            with open(self.path_for(digest), "rb") as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            raise BlobError("blob_missing", digest, "not in the blob store") from None
+        if _PREFIX + hashlib.sha256(data).hexdigest() != digest:
+            raise BlobError(
+                "blob_mismatch", digest, "stored bytes do not match the digest"
+            )
+        return data
+
+    def check(self, digest: str) -> Optional[str]:
+        """Error code for a missing or altered blob, or None if it is intact."""
+        try:
+            self.get(digest)
+        except BlobError as exc:
+            return exc.code
+        except ValueError:
+            return "blob_missing"  # not even a well-formed digest
+        return None
+
+    def store_details(self, encoded: bytes) -> Dict[str, Any]:
+        """Store canonical ``details`` JSON; return the reference to chain instead."""
+        return {BLOB_KEY: self.put(encoded), "bytes": len(encoded)}
+
+    def load_details(
+        self, ref: Dict[str, Any], object_hook: Optional[Callable[[Dict], Any]] = None
+    ) -> Any:
+        """The ``details`` a reference stands for."""
+        return json.loads(self.get(ref[BLOB_KEY]), object_hook=object_hook)
+
+    def resolve(
+        self,
+        event: Dict[str, Any],
+        object_hook: Optional[Callable[[Dict], Any]] = None,
+    ) -> Dict[str, Any]:
+        """``event`` with a blob reference in ``details`` swapped for its content."""
+        details = event.get("details")
+        if not is_blob_ref(details):
+            return event
+        return dict(event, details=self.load_details(details, object_hook))
+
+
+BlobSource = Union[str, BlobStore, None]
+
+
+def as_blob_store(blobs: BlobSource) -> Optional[BlobStore]:
+    """Accept a directory or a store wherever a blob store is expected."""
+    if blobs is None or isinstance(blobs, BlobStore):
+        return blobs
+    return BlobStore(blobs)
@@ -15,21 +15,50 @@ Threat model (read this before relying on the chain):
 
 from __future__ import annotations
 
+import atexit
+import base64
 import hashlib
 import hmac
 import json
 import os
+import queue
+import random
+import sqlite3
+import sys
 import threading
 import uuid
-from contextlib import contextmanager
+import weakref
+from concurrent.futures import Future
+from contextlib import ExitStack, closing, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .binary import (
+    BINARY_ALGS,
+    HMAC_SHA256_BIN,
+    SHA256_BIN,
+    BinaryRecord,
+    chain_digest,
+    encode_body,
+    encode_record,
+)
+from .blobs import BLOB_KEY, BlobSource, BlobStore, as_blob_store, is_blob_ref
+from .events import Event
+from .headcell import CellHead, HeadCell
+from .metrics import WriterMetrics
+from .registry import EventTypes
+from .storage import LedgerStorage, open_storage
+from .tracing import Tracer
+from .validation import validate_details
 
 __all__ = [
     "AuditLogger",
     "AuditLogError",
+    "Durability",
     "verify_log",
+    "iter_verification",
     "iter_events",
     "read_head",
     "write_anchor",
@@ -44,6 +73,10 @@ SCHEMA_VERSION = "0.2.0"
 DEFAULT_LOG_PATH = os.environ.get("AUDIT_LOG_PATH", "audit_trail.jsonl")
 HMAC_KEY_ENV = "AUDIT_HMAC_KEY"
 
+VERIFY_MODES = ("first", "all")
+# altered-event fractions a spot check reports a detection probability for
+SAMPLE_FRACTIONS = (0.001, 0.01, 0.05, 0.1)
+
 _SHA256 = "sha256"
 _HMAC_SHA256 = "hmac-sha256"
 
@@ -52,6 +85,29 @@ class AuditLogError(RuntimeError):
     """Raised when the ledger cannot be safely appended to or read."""
 
 
+class Durability:
+    """How far an event must get before its write counts as done.
+
+    Levels are ordered: each one implies the ones before it.
+    """
+
+    WRITTEN = "written"  # handed to the OS; survives a process crash
+    FSYNCED = "fsynced"  # flushed to stable storage; survives power loss
+    ANCHORED = "anchored"  # fsynced, and the anchor file now covers it
+
+    ORDER = (WRITTEN, FSYNCED, ANCHORED)
+
+    @classmethod
+    def check(cls, level: str) -> str:
+        if level not in cls.ORDER:
+            raise ValueError(f"unknown durability {level!r}; expected one of {cls.ORDER}")
+        return level
+
+    @classmethod
+    def strongest(cls, levels) -> str:
+        return max(levels, key=cls.ORDER.index)
+
+
 # --------------------------------------------------------------------------
 # cross-process locking
 # --------------------------------------------------------------------------
@@ -103,13 +159,110 @@ def _file_lock(fh) -> Iterator[None]:
     yield  # pragma: no cover - no locking primitive available
 
 
+# --------------------------------------------------------------------------
+# ledger I/O
+# --------------------------------------------------------------------------
+
+_NO_SPAN = nullcontext()
+
+SYNC_METHODS = ("fsync", "fdatasync", "o_dsync")
+
+_O_DSYNC = getattr(os, "O_DSYNC", 0)
+_IOV_MAX = 1024  # POSIX minimum guarantee is 16; every real platform allows 1024
+
+
+def _open_ledger(path: str, sync_method: str = "fsync"):
+    """Unbuffered read/append handle on the ledger.
+
+    ``O_APPEND`` makes every write land at the current end of file no matter
+    where the handle was last seeked for a tail read. With ``o_dsync`` each
+    write returns only once its data is on stable storage, which replaces the
+    separate fsync call.
+    """
+    flags = os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    if sync_method == "o_dsync":
+        flags |= _O_DSYNC
+    return open(os.open(path, flags, 0o666), "rb+", buffering=0)
+
+
+def _write_lines(fh, chunks: List[bytes]) -> None:
+    """Write ``chunks`` back to back, gathering them with ``writev`` if possible."""
+    fd = fh.fileno()
+    if not hasattr(os, "writev"):  # pragma: no cover - Windows
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data) :]
+        return
+    pending = [chunk for chunk in chunks if chunk]
+    while pending:
+        written = os.writev(fd, pending[:_IOV_MAX])
+        while pending and written >= len(pending[0]):
+            written -= len(pending.pop(0))
+        if written:  # short write inside a chunk
+            pending[0] = pending[0][written:]
+
+
+def _sync(fh, sync_method: str) -> None:
+    if sync_method == "o_dsync" and _O_DSYNC:
+        return  # every write was already synchronous
+    if sync_method == "fdatasync" and hasattr(os, "fdatasync"):
+        # skips flushing metadata such as mtime that recovery does not need
+        os.fdatasync(fh.fileno())
+    else:
+        os.fsync(fh.fileno())
+
+
 # --------------------------------------------------------------------------
 # serialisation helpers
 # --------------------------------------------------------------------------
 
 
+# Key marking an encoded n-dimensional array in event ``details``.
+NDARRAY_KEY = "__ndarray__"
+
+
+def _encode_ndarray(obj: Any) -> Any:
+    """``{"__ndarray__": {"dtype", "shape", "data"}}`` for a numpy-style array.
+
+    ``data`` is the base64 of the little-endian, C-order buffer, so the same
+    values always serialise (and hash) to the same bytes whatever the host
+    byte order or memory layout, and no element is boxed as a Python float.
+    """
+    dtype = obj.dtype
+    if dtype.kind == "O":  # object arrays have no portable buffer
+        return obj.tolist()
+    if dtype.byteorder == ">" or (dtype.byteorder == "=" and sys.byteorder == "big"):
+        obj = obj.astype(dtype.newbyteorder("<"))
+        dtype = obj.dtype
+    return {
+        NDARRAY_KEY: {
+            "dtype": dtype.str,
+            "shape": [int(n) for n in obj.shape],
+            "data": base64.b64encode(obj.tobytes(order="C")).decode("ascii"),
+        }
+    }
+
+
+def _decode_ndarray(obj: Dict[str, Any]) -> Any:
+    """``json.loads`` object hook reversing :func:`_encode_ndarray`."""
+    if len(obj) != 1 or NDARRAY_KEY not in obj:
+        return obj
+    spec = obj[NDARRAY_KEY]
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("decode_arrays=True needs numpy installed") from exc
+    return np.frombuffer(
+        base64.b64decode(spec["data"]), dtype=np.dtype(spec["dtype"])
+    ).reshape(spec["shape"])
+
+
 def _json_default(obj: Any) -> Any:
-    """Coerce values json cannot encode (numpy scalars, dates, paths)."""
+    """Coerce values json cannot encode (numpy values, dates, paths)."""
+    if getattr(obj, "ndim", 0) and hasattr(obj, "dtype") and hasattr(obj, "tobytes"):
+        # checked before .item(): it raises on arrays, and silently drops the
+        # shape of a one-element one
+        return _encode_ndarray(obj)
     item = getattr(obj, "item", None)
     if callable(item):
         try:
@@ -145,23 +298,61 @@ def _resolve_key(key: Union[str, bytes, None]) -> Optional[bytes]:
 
 
 def _digest(prev_hash: str, body: Dict[str, Any], key: Optional[bytes]) -> str:
-    payload = (prev_hash + _stable_json(body)).encode("utf-8")
+    return _chain_hash(prev_hash, _stable_json(body), key)
+
+
+def _chain_hash(prev_hash: str, body_json: str, key: Optional[bytes]) -> str:
+    return _chain_hash_bytes(prev_hash, body_json.encode("utf-8"), key)
+
+
+def _chain_hash_bytes(prev_hash: str, body: bytes, key: Optional[bytes]) -> str:
+    payload = prev_hash.encode("utf-8") + body
     if key is not None:
         return hmac.new(key, payload, hashlib.sha256).hexdigest()
     return hashlib.sha256(payload).hexdigest()
 
 
+def _spliced_body(line: bytes, claimed: str) -> Optional[bytes]:
+    """The hashed body of a canonical line: the line minus its ``curr_hash``.
+
+    Appenders write ``_stable_json(event)``, which is the hashed body with
+    one ``"curr_hash":"..."`` member added at its sorted position, so
+    cutting that member back out recovers the body without re-encoding.
+    Returns None if the member is not there as written by an appender; a
+    result that does not hash to ``claimed`` means the line is not in
+    canonical form, not that it was tampered with (the caller re-encodes).
+    """
+    member = b'"curr_hash":"' + claimed.encode("ascii", "replace") + b'"'
+    at = line.find(b"," + member)
+    if at >= 0:
+        return line[:at] + line[at + len(member) + 1 :]
+    if line.startswith(b"{" + member):
+        rest = line[len(member) + 1 :]
+        return b"{" + (rest[1:] if rest.startswith(b",") else rest)
+    return None
+
+
 # --------------------------------------------------------------------------
 # tail reading
 # --------------------------------------------------------------------------
 
 
-def _read_last_line(fh) -> Optional[bytes]:
-    """Return the final non-empty line of a binary handle, or None if empty."""
-    fh.seek(0, os.SEEK_END)
-    pos = fh.tell()
+def _read_last_line(fh, end: Optional[int] = None) -> Optional[bytes]:
+    """Return the final non-empty line of a binary handle, or None if empty.
+
+    With ``end``, only the first ``end`` bytes are considered.
+    """
+    return _last_line_at(fh, end)[1]
+
+
+def _last_line_at(fh, end: Optional[int] = None) -> Tuple[int, Optional[bytes]]:
+    """Like :func:`_read_last_line`, also returning where that line starts."""
+    if end is None:
+        fh.seek(0, os.SEEK_END)
+        end = fh.tell()
+    pos = end
     if pos == 0:
-        return None
+        return 0, None
 
     buf = b""
     while pos > 0:
@@ -171,22 +362,57 @@ def _read_last_line(fh) -> Optional[bytes]:
         buf = fh.read(step) + buf
         trimmed = buf.rstrip(b"\r\n")
         if not trimmed:
-            return None  # file is nothing but newlines
+            return 0, None  # file is nothing but newlines
         cut = trimmed.rfind(b"\n")
         if cut != -1:
-            return trimmed[cut + 1 :].strip()
+            return pos + cut + 1, trimmed[cut + 1 :].strip()
         if pos == 0:
-            return trimmed.strip()
-    return None  # pragma: no cover - unreachable
+            return 0, trimmed.strip()
+    return 0, None  # pragma: no cover - unreachable
 
 
-def _read_last_record(fh, path: str) -> Optional[Dict[str, Any]]:
-    """Parse the last ledger entry.
+def _uncommitted_tail(fh) -> Optional[int]:
+    """Offset of bytes after the final newline, or None if there are none.
+
+    Every append writes whole lines in a single write, so the newline is the
+    commit marker: anything after the last one was never acknowledged to a
+    caller. That is what a torn write looks like after a crash — a partial
+    line, or the zero-filled extent some filesystems leave behind.
+    """
+    fh.seek(0, os.SEEK_END)
+    end = fh.tell()
+    pos = end
+    while pos > 0:
+        step = min(8192, pos)
+        pos -= step
+        fh.seek(pos)
+        chunk = fh.read(step)
+        cut = chunk.rfind(b"\n")
+        if cut != -1:
+            start = pos + cut + 1
+            return start if start < end else None
+    return 0 if end else None
+
+
+def _parse_record(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        record = json.loads(line.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if isinstance(record, dict) and isinstance(record.get("curr_hash"), str):
+        return record
+    return None
+
+
+def _read_last_record(
+    fh, path: str, end: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Parse the last ledger entry (within the first ``end`` bytes).
 
     Refuses to continue on a corrupt tail: silently restarting the chain
     would hide exactly the damage this library exists to surface.
     """
-    line = _read_last_line(fh)
+    line = _read_last_line(fh, end)
     if line is None:
         return None
     try:
@@ -204,6 +430,84 @@ def _read_last_record(fh, path: str) -> Optional[Dict[str, Any]]:
     return record
 
 
+class _CommittedLines:
+    """Numbered non-blank lines of a binary handle, up to the commit point.
+
+    Appends write whole newline-terminated lines, so a final segment with no
+    newline is either a write still in flight or one torn by a crash.
+    Readers stop before it — it is counted in ``pending_bytes`` — unless it
+    parses as a complete record, which appenders also treat as committed.
+    That gives every reader a clean prefix of the ledger without taking the
+    writers' lock.
+    """
+
+    def __init__(self, fh: Any) -> None:
+        self.fh = fh
+        self.pending_bytes = 0
+
+    def __iter__(self) -> Iterator[Tuple[int, bytes]]:
+        for line_no, raw in enumerate(self.fh, start=1):
+            line = raw.strip()
+            if not raw.endswith(b"\n") and line and _parse_record(line) is None:
+                self.pending_bytes = len(raw)
+                return
+            if line:
+                yield line_no, line
+
+
+class _StoredLines:
+    """:class:`_CommittedLines` for a ledger kept by a storage backend.
+
+    SQLite commits whole transactions, so nothing is ever pending; a binary
+    ledger reports an incomplete final record like a JSONL one.
+    """
+
+    pending_bytes = 0
+
+    def __init__(
+        self,
+        storage: LedgerStorage,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> None:
+        self.storage = storage
+        self.since = since
+        self.until = until
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        lines = self.storage.lines(self.since, self.until)
+        yield from lines
+        self.pending_bytes = getattr(lines, "pending_bytes", 0)
+
+
+@contextmanager
+def _ledger_lines(path: str) -> Iterator[Any]:
+    """Committed ``(line_no, line)`` pairs of ``path``, whatever stores it.
+
+    Raises OSError (or :class:`sqlite3.Error`) if the ledger cannot be read.
+    """
+    storage = open_storage(path)
+    if storage is not None:
+        try:
+            yield _StoredLines(storage)
+        finally:
+            storage.close()
+    else:
+        with open(path, "rb") as fh:
+            yield _CommittedLines(fh)
+
+
+def _committed_end(fh: Any) -> int:
+    """Length of the committed prefix of a binary handle (see _CommittedLines)."""
+    tail = _uncommitted_tail(fh)
+    if tail is None:
+        return fh.seek(0, os.SEEK_END)
+    fh.seek(tail)
+    if _parse_record(fh.read().strip()) is not None:
+        return fh.tell()
+    return tail
+
+
 # --------------------------------------------------------------------------
 # logger
 # --------------------------------------------------------------------------
@@ -223,7 +527,48 @@ class AuditLogger:
         key: HMAC secret. Defaults to ``$AUDIT_HMAC_KEY``; when unset the
             chain is a plain SHA-256 chain that anyone can recompute.
         fsync: Flush each event to disk before returning. Durable across
-            power loss, roughly an order of magnitude slower.
+            power loss, roughly an order of magnitude slower. Sets the
+            default durability of :meth:`submit` to ``"fsynced"``.
+        sync_method: How durable writes reach disk: ``"fsync"`` (default),
+            ``"fdatasync"`` (data only, no metadata flush) or ``"o_dsync"``
+            (open with ``O_DSYNC``, which makes *every* write synchronous).
+            Platforms without the primitive fall back to ``fsync``.
+        anchor_path: Where ``"anchored"`` submissions write the anchor.
+            Defaults to ``<path>.anchor``.
+        max_batch: Most events :meth:`submit` groups into a single locked
+            append.
+        auto_recover: Quarantine a torn final write (see :meth:`recover`)
+            instead of refusing to append after a crash.
+        tracer: Receives a span around each phase of every append. See
+            :mod:`llm_audit_trail.tracing`.
+        shared_head: Keep the chain head in a memory-mapped
+            ``<path>.head`` sidecar (see :mod:`llm_audit_trail.headcell`), so
+            appenders and :func:`read_head` on the same host learn the head
+            without reading the ledger tail. Every process appending to the
+            ledger should set it; one that does not only costs the others a
+            fallback read.
+        validate: Check ``details`` against the bundled schema for the
+            event type (see :mod:`llm_audit_trail.validation`) and raise
+            :class:`~llm_audit_trail.validation.SchemaValidationError`
+            before anything is chained. :meth:`submit` raises at once.
+        blob_dir: Keep ``details`` larger than ``blob_threshold`` bytes (as
+            canonical JSON) in a content-addressed
+            :class:`~llm_audit_trail.blobs.BlobStore` in this directory and
+            chain a ``{"$blob": "sha256:…", "bytes": n}`` reference instead.
+            Identical payloads are stored once.
+        blob_threshold: Size above which ``details`` go to the blob store.
+
+    A ``path`` ending in ``.db``, ``.sqlite`` or ``.sqlite3`` (or naming an
+    existing SQLite file) keeps the ledger in SQLite instead; see
+    :mod:`llm_audit_trail.storage`. The events and their hashes are the
+    same. ``sync_method``, ``auto_recover`` and ``shared_head`` only apply
+    to JSONL ledgers: SQLite commits are atomic, so there are no torn tails
+    to recover, and the head is an index lookup already.
+
+    A ``path`` ending in ``.alog`` writes compact binary records chained
+    with ``hash_alg`` ``"sha256-bin"`` (see :mod:`llm_audit_trail.binary`).
+    ``auto_recover`` applies there too; ``sync_method`` and ``shared_head``
+    do not.
     """
 
     path: str = DEFAULT_LOG_PATH
@@ -232,15 +577,46 @@ class AuditLogger:
     schema_version: str = SCHEMA_VERSION
     key: Union[str, bytes, None] = None
     fsync: bool = False
+    sync_method: str = "fsync"
+    anchor_path: Optional[str] = None
+    max_batch: int = 256
+    auto_recover: bool = False
+    tracer: Optional[Tracer] = None
+    validate: bool = False
+    shared_head: bool = False
+    blob_dir: Optional[str] = None
+    blob_threshold: int = 16 * 1024
     _lock: threading.Lock = field(
         default_factory=threading.Lock, repr=False, compare=False
     )
+    _writer: Optional["_BatchWriter"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _metrics: WriterMetrics = field(
+        default_factory=WriterMetrics, init=False, repr=False, compare=False
+    )
+    _head_cell: Optional[HeadCell] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _storage: Optional[LedgerStorage] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _blobs: Optional[BlobStore] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
+        if self.sync_method not in SYNC_METHODS:
+            raise ValueError(
+                f"unknown sync_method {self.sync_method!r}; expected one of {SYNC_METHODS}"
+            )
         self.key = _resolve_key(self.key)
         parent = os.path.dirname(os.path.abspath(self.path))
         if parent:
             os.makedirs(parent, exist_ok=True)
+        self._storage = open_storage(self.path, create=True)
+        if self.blob_dir is not None:
+            self._blobs = BlobStore(self.blob_dir)
 
     def emit(
         self,
@@ -254,48 +630,521 @@ class AuditLogger:
         actor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Append a single hash-chained audit event and return it."""
-        with self._lock, open(self.path, "ab+") as fh, _file_lock(fh):
-            previous = _read_last_record(fh, self.path)
-            if previous is None:
-                prev_hash, seq = GENESIS, 0
-            else:
-                prev_hash = previous["curr_hash"]
-                prev_seq = previous.get("seq")
-                seq = prev_seq + 1 if isinstance(prev_seq, int) else 0
+        request = self._request(
+            event_type, details, model_id, dataset_id, deployment_id, system, actor
+        )
+        durability = Durability.FSYNCED if self.fsync else Durability.WRITTEN
+        return self._append([request], durability)[0]
 
+    def submit(
+        self,
+        event_type: str,
+        details: Optional[Dict[str, Any]] = None,
+        *,
+        model_id: Optional[str] = None,
+        dataset_id: Optional[str] = None,
+        deployment_id: Optional[str] = None,
+        system: Optional[str] = None,
+        actor: Optional[str] = None,
+        durability: Optional[str] = None,
+    ) -> "Future[Dict[str, Any]]":
+        """Queue an event and return at once.
+
+        Events are chained in submission order by a background thread that
+        appends whatever has queued up under a single lock. The returned
+        future resolves to the chained event once its batch has reached
+        ``durability`` (default: ``"fsynced"`` if ``fsync`` is set, else
+        ``"written"``), or carries the exception that stopped it.
+
+        Call :meth:`flush` before relying on queued events; pending events
+        are also flushed at interpreter exit, for up to
+        ``EXIT_FLUSH_TIMEOUT`` seconds.
+        """
+        if durability is None:
+            durability = Durability.FSYNCED if self.fsync else Durability.WRITTEN
+        request = self._request(
+            event_type, details, model_id, dataset_id, deployment_id, system, actor
+        )
+        with self._lock:
+            if self._writer is None:
+                self._writer = _BatchWriter(self)
+            writer = self._writer
+        return writer.put(request, Durability.check(durability))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every submitted event to resolve.
+
+        Returns False if ``timeout`` seconds passed first.
+        """
+        writer = self._writer
+        return True if writer is None else writer.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush submitted events, stop the writer and close the storage.
+
+        A SQLite ledger's connection is released once the writer is idle;
+        the logger stays usable, and a later append reconnects.
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+        done = True if writer is None else writer.stop(timeout)
+        if done and self._storage is not None:
+            self._storage.close()
+        return done
+
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def recover(self) -> Optional[Dict[str, Any]]:
+        """Quarantine a torn final write and record that it happened.
+
+        A crash mid-append (or a power loss with ``fsync=False``) can leave a
+        partial last line. Its bytes are moved to ``<path>.torn-<offset>``,
+        the ledger is cut back to the last committed event, and a
+        ``RecoveryPerformed`` event carrying the quarantined bytes' digest is
+        chained on. A committed line that fails to parse is *not* a torn
+        write and is never touched.
+
+        Returns the ``RecoveryPerformed`` event, or None if the tail was clean
+        (always, for a SQLite ledger).
+        """
+        if self._storage is not None:
+            request = self._quarantine_stored_tail()
+            if request is None:
+                return None
+            return self._append_stored([request], Durability.FSYNCED, recover=False)[0]
+        with self._lock, self._open() as fh, _file_lock(fh):
+            request = self._quarantine_torn_tail(fh)
+            if request is None:
+                return None
+            return self._write_chained(fh, [request], Durability.FSYNCED, {})[0]
+
+    def head(self) -> Optional[Dict[str, Any]]:
+        """Current chain head, or None for an empty ledger."""
+        return read_head(self.path)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of this process's append timings and throughput.
+
+        ``phases`` holds a latency histogram per step of the locked append
+        cycle (``lock_wait``, ``tail_read``, ``serialise``, ``hash``,
+        ``write``, ``fsync``), one observation per append. Render it for
+        Prometheus with :func:`llm_audit_trail.metrics.render_prometheus`.
+        """
+        writer = self._writer
+        return self._metrics.snapshot(queue_depth=writer.depth() if writer else 0)
+
+    def verify(self, **kwargs: Any) -> Tuple[bool, Dict[str, Any]]:
+        """Verify this ledger. See :func:`verify_log`."""
+        kwargs.setdefault("key", self.key)
+        kwargs.setdefault("tracer", self.tracer)
+        return verify_log(self.path, **kwargs)
+
+    # ---- internals ---------------------------------------------------------
+
+    def _open(self):
+        return _open_ledger(self.path, self.sync_method)
+
+    def _span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        if self.tracer is None:
+            return _NO_SPAN
+        return self.tracer.span(name, attributes)
+
+    def _request(
+        self,
+        event_type: str,
+        details: Optional[Dict[str, Any]],
+        model_id: Optional[str],
+        dataset_id: Optional[str],
+        deployment_id: Optional[str],
+        system: Optional[str],
+        actor: Optional[str],
+    ) -> Dict[str, Any]:
+        """Everything about an event except its position in the chain."""
+        if details is None:
+            details = {}
+        if self.validate:
+            validate_details(event_type, details)
+        if self._blobs is not None:
+            encoded = _stable_json(details).encode("utf-8")
+            if len(encoded) > self.blob_threshold:
+                details = self._blobs.store_details(encoded)
+        return {
+            "event_type": event_type,
+            "actor": actor if actor is not None else self.actor,
+            "system": system if system is not None else self.system,
+            "model_id": model_id,
+            "dataset_id": dataset_id,
+            "deployment_id": deployment_id,
+            "details": details,
+        }
+
+    def _append(
+        self, requests: List[Dict[str, Any]], durability: str
+    ) -> List[Dict[str, Any]]:
+        """Chain and write ``requests`` in one locked read-then-append cycle."""
+        if self._storage is not None:
+            return self._append_stored(requests, durability)
+        span = self._span
+        started = perf_counter()
+        try:
+            with span("audit.append", {"events": len(requests)}), ExitStack() as held:
+                with span("audit.lock_wait"):
+                    held.enter_context(self._lock)
+                    fh = held.enter_context(self._open())
+                    held.enter_context(_file_lock(fh))
+                timings = {"lock_wait": perf_counter() - started}
+                recovery = None
+                if self.auto_recover:
+                    recovery = self._quarantine_torn_tail(fh)
+                if recovery is not None:
+                    events = self._write_chained(
+                        fh, [recovery] + requests, durability, timings
+                    )[1:]
+                else:
+                    events = self._write_chained(fh, requests, durability, timings)
+        except BaseException:
+            self._metrics.record_error()
+            raise
+
+        if durability == Durability.ANCHORED:
+            # read_head takes the file lock itself, so this must run after
+            # ours is released. The anchor may cover later events too.
+            write_anchor(self.path, self.anchor_path)
+        return events
+
+    def _write_chained(
+        self,
+        fh,
+        requests: List[Dict[str, Any]],
+        durability: str,
+        timings: Dict[str, float],
+    ) -> List[Dict[str, Any]]:
+        """Chain ``requests`` onto the current tail. Caller holds the locks."""
+        span = self._span
+        mark = perf_counter()
+        separator = ""
+        with span("audit.tail_read"):
+            cell = self._shared_head(fh)
+            if cell is not None:
+                prev_hash, seq = cell.hash, cell.seq + 1
+            else:
+                torn = _uncommitted_tail(fh)
+                if torn is not None:
+                    fh.seek(torn)
+                    if _parse_record(fh.read().strip()) is None:
+                        raise AuditLogError(
+                            f"{self.path}: final line is incomplete, probably a torn "
+                            f"write from a crash; run `llm-audit recover` (or pass "
+                            f"auto_recover=True) to quarantine it"
+                        )
+                    separator = "\n"  # a complete record someone left unterminated
+                previous = _read_last_record(fh, self.path)
+                if previous is None:
+                    prev_hash, seq = GENESIS, 0
+                else:
+                    prev_hash = previous["curr_hash"]
+                    prev_seq = previous.get("seq")
+                    seq = prev_seq + 1 if isinstance(prev_seq, int) else 0
+        now = perf_counter()
+        timings["tail_read"], mark = now - mark, now
+
+        events, encoded = self._chain(requests, prev_hash, seq, timings, mark)
+        mark = perf_counter()
+        lines = [separator.encode("ascii")] + [line + b"\n" for line in encoded]
+
+        with span("audit.write", {"events": len(events)}):
+            _write_lines(fh, lines)
+            if self._head_cell is not None:
+                last = events[-1]
+                self._head_cell.write(
+                    os.fstat(fh.fileno()).st_size,
+                    last["seq"],
+                    last["curr_hash"],
+                    last["timestamp"],
+                )
+        now = perf_counter()
+        timings["write"], mark = now - mark, now
+        if durability != Durability.WRITTEN:
+            with span("audit.fsync", {"sync_method": self.sync_method}):
+                _sync(fh, self.sync_method)
+            timings["fsync"] = perf_counter() - mark
+
+        self._metrics.record_append(timings, len(events), sum(map(len, lines)))
+        return events
+
+    def _chain(
+        self,
+        requests: List[Dict[str, Any]],
+        prev_hash: str,
+        seq: int,
+        timings: Dict[str, float],
+        mark: float,
+    ) -> Tuple[List[Dict[str, Any]], List[bytes]]:
+        """Build events on ``prev_hash``/``seq``; return them and their lines.
+
+        Lines are canonical JSON without the trailing newline. Shared by
+        every storage backend, so the chain bytes never depend on where
+        they are kept — except for a binary ledger, whose events are
+        chained over (and stored as) their binary bodies.
+        """
+        if self._storage is not None and self._storage.binary:
+            return self._chain_binary(requests, prev_hash, seq, timings, mark)
+        span = self._span
+        events: List[Dict[str, Any]] = []
+        lines: List[bytes] = []
+        serialise = hashing = 0.0
+        for request in requests:
             event: Dict[str, Any] = {
                 "schema_version": self.schema_version,
                 "seq": seq,
                 "event_id": str(uuid.uuid4()),
                 "timestamp": _now(),
-                "event_type": event_type,
-                "actor": actor if actor is not None else self.actor,
-                "system": system if system is not None else self.system,
-                "model_id": model_id,
-                "dataset_id": dataset_id,
-                "deployment_id": deployment_id,
-                "details": details if details is not None else {},
+                **request,
                 "hash_alg": _HMAC_SHA256 if self.key else _SHA256,
                 "prev_hash": prev_hash,
             }
-            event["curr_hash"] = _digest(prev_hash, event, self.key)  # type: ignore[arg-type]
+            with span("audit.serialise", {"seq": seq, "stage": "body"}):
+                body = _stable_json(event)
+            serialised = perf_counter()
+            with span("audit.digest", {"seq": seq}):
+                event["curr_hash"] = _chain_hash(prev_hash, body, self.key)  # type: ignore[arg-type]
+            hashed = perf_counter()
+            with span("audit.serialise", {"seq": seq, "stage": "line"}):
+                lines.append(_stable_json(event).encode("utf-8"))
+            now = perf_counter()
+            serialise += (serialised - mark) + (now - hashed)
+            hashing += hashed - serialised
+            mark = now
+            events.append(event)
+            prev_hash, seq = event["curr_hash"], seq + 1
+        timings["serialise"], timings["hash"] = serialise, hashing
+        return events, lines
+
+    def _chain_binary(
+        self,
+        requests: List[Dict[str, Any]],
+        prev_hash: str,
+        seq: int,
+        timings: Dict[str, float],
+        mark: float,
+    ) -> Tuple[List[Dict[str, Any]], List[bytes]]:
+        """:meth:`_chain` for a binary ledger: lines are framed records."""
+        span = self._span
+        events: List[Dict[str, Any]] = []
+        lines: List[bytes] = []
+        serialise = hashing = 0.0
+        for request in requests:
+            event: Dict[str, Any] = {
+                "schema_version": self.schema_version,
+                "seq": seq,
+                "event_id": str(uuid.uuid4()),
+                "timestamp": _now(),
+                **request,
+                "hash_alg": HMAC_SHA256_BIN if self.key else SHA256_BIN,
+                "prev_hash": prev_hash,
+            }
+            with span("audit.serialise", {"seq": seq, "stage": "body"}):
+                body = encode_body(event)
+            serialised = perf_counter()
+            with span("audit.digest", {"seq": seq}):
+                event["curr_hash"] = chain_digest(body, self.key)  # type: ignore[arg-type]
+            hashed = perf_counter()
+            lines.append(encode_record(body, event["curr_hash"]))
+            now = perf_counter()
+            serialise += (serialised - mark) + (now - hashed)
+            hashing += hashed - serialised
+            mark = now
+            events.append(event)
+            prev_hash, seq = event["curr_hash"], seq + 1
+        timings["serialise"], timings["hash"] = serialise, hashing
+        return events, lines
+
+    def _append_stored(
+        self, requests: List[Dict[str, Any]], durability: str, recover: bool = True
+    ) -> List[Dict[str, Any]]:
+        """:meth:`_append` for a ledger kept by a storage backend."""
+        if recover and self.auto_recover:
+            recovery = self._quarantine_stored_tail()
+            if recovery is not None:
+                requests = [recovery] + requests
+                return self._append_stored(requests, durability, recover=False)[1:]
+        storage = self._storage
+        started = perf_counter()
+        timings: Dict[str, float] = {}
+        written: List[bytes] = []
+
+        def build(previous: Optional[Dict[str, Any]]):
+            mark = perf_counter()
+            timings["lock_wait"] = mark - started
+            if previous is None:
+                prev_hash, seq = GENESIS, 0
+            else:
+                prev_hash = previous["curr_hash"]
+                prev_seq = previous.get("seq")
+                seq = prev_seq + 1 if isinstance(prev_seq, int) else 0
+            events, lines = self._chain(requests, prev_hash, seq, timings, mark)
+            written[:] = lines
+            return events, lines
 
-            fh.seek(0, os.SEEK_END)
-            fh.write((_stable_json(event) + "\n").encode("utf-8"))
-            fh.flush()
-            if self.fsync:
-                os.fsync(fh.fileno())
+        try:
+            with self._span("audit.append", {"events": len(requests)}), self._lock:
+                events = storage.append(build, durability, timings)  # type: ignore[union-attr]
+        except BaseException:
+            self._metrics.record_error()
+            raise
+        self._metrics.record_append(timings, len(events), sum(map(len, written)))
+        if durability == Durability.ANCHORED:
+            write_anchor(self.path, self.anchor_path)
+        return events
+
+    def _shared_head(self, fh) -> Optional[CellHead]:
+        """The head from the sidecar cell, if it still describes the ledger."""
+        if not self.shared_head:
+            return None
+        if self._head_cell is None:
+            self._head_cell = HeadCell(self.path + ".head", writable=True)
+        head = self._head_cell.read()
+        if head is None or head.length != os.fstat(fh.fileno()).st_size:
+            return None
+        return head
+
+    def _quarantine_torn_tail(self, fh) -> Optional[Dict[str, Any]]:
+        """Move a torn tail aside; return the event request describing it."""
+        offset = _uncommitted_tail(fh)
+        if offset is None:
+            return None
+        fh.seek(offset)
+        tail = fh.read()
+        if _parse_record(tail.strip()) is not None:
+            return None  # complete, merely unterminated: nothing was lost
+
+        side_path = f"{self.path}.torn-{offset}"
+        with open(side_path, "ab") as side:
+            side.write(tail)
+            side.flush()
+            os.fsync(side.fileno())
+        # only cut once the bytes are safely elsewhere
+        fh.truncate(offset)
+        os.fsync(fh.fileno())
+        return self._recovery_request(offset, tail, side_path)
+
+    def _quarantine_stored_tail(self) -> Optional[Dict[str, Any]]:
+        """:meth:`_quarantine_torn_tail` for backends that can tear (binary)."""
+        quarantine = getattr(self._storage, "quarantine_torn_tail", None)
+        found = quarantine() if quarantine is not None else None
+        return None if found is None else self._recovery_request(*found)
+
+    def _recovery_request(self, offset: int, tail: bytes, side_path: str) -> Dict[str, Any]:
+        return self._request(
+            EventTypes.RECOVERY_PERFORMED,
+            {
+                "reason": "torn_write",
+                "offset": offset,
+                "bytes": len(tail),
+                "sha256": "sha256:" + hashlib.sha256(tail).hexdigest(),
+                "quarantine_path": os.path.abspath(side_path),
+            },
+            model_id=None,
+            dataset_id=None,
+            deployment_id=None,
+            system="audit_trail",
+            actor=None,
+        )
 
-        return event
 
-    def head(self) -> Optional[Dict[str, Any]]:
-        """Current chain head, or None for an empty ledger."""
-        return read_head(self.path)
+class _BatchWriter:
+    """Background thread behind :meth:`AuditLogger.submit`.
 
-    def verify(self, **kwargs: Any) -> Tuple[bool, Dict[str, Any]]:
-        """Verify this ledger. See :func:`verify_log`."""
-        kwargs.setdefault("key", self.key)
-        return verify_log(self.path, **kwargs)
+    Drains the queue in batches so that a burst of submissions costs one
+    lock acquisition, one tail read and one write (and fsync) in total.
+    """
+
+    _STOP = object()
+
+    def __init__(self, logger: AuditLogger) -> None:
+        self._logger = logger
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._idle = threading.Condition()
+        self._unfinished = 0
+        self._thread = threading.Thread(
+            target=self._run, name="audit-batch-writer", daemon=True
+        )
+        self._thread.start()
+        # daemon threads die at exit, but atexit handlers run first: flush
+        # there so queued events are not silently dropped.
+        _LIVE_WRITERS.add(self)
+
+    def put(self, request: Dict[str, Any], durability: str) -> "Future[Dict[str, Any]]":
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._idle:
+            self._unfinished += 1
+        self._queue.put((request, durability, future))
+        return future
+
+    def depth(self) -> int:
+        return self._unfinished
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def stop(self, timeout: Optional[float]) -> bool:
+        done = self.wait(timeout)
+        self._queue.put(self._STOP)
+        _LIVE_WRITERS.discard(self)
+        return done
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            while len(batch) < self._logger.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    self._queue.put(item)  # handle after this batch
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch) -> None:
+        live = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        try:
+            if live:
+                durability = Durability.strongest(d for _, d, _ in live)
+                events = self._logger._append([r for r, _, _ in live], durability)
+                for (_, _, future), event in zip(live, events):
+                    future.set_result(event)
+        except BaseException as exc:  # surfaced through the futures
+            for _, _, future in live:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            with self._idle:
+                self._unfinished -= len(batch)
+                self._idle.notify_all()
+
+
+# Writers still running, flushed by one exit handler for all of them.
+_LIVE_WRITERS: "weakref.WeakSet[_BatchWriter]" = weakref.WeakSet()
+# Longest the interpreter waits at exit for queued events (a hung fsync,
+# say) before giving up on them.
+EXIT_FLUSH_TIMEOUT = 30.0
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    deadline = monotonic() + EXIT_FLUSH_TIMEOUT
+    for writer in list(_LIVE_WRITERS):
+        writer.wait(max(0.0, deadline - monotonic()))
 
 
 # --------------------------------------------------------------------------
@@ -303,21 +1152,219 @@ class AuditLogger:
 # --------------------------------------------------------------------------
 
 
-def iter_events(path: str = DEFAULT_LOG_PATH) -> Iterator[Dict[str, Any]]:
-    """Yield each event in the ledger. Blank lines are skipped."""
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if line:
-                yield json.loads(line)
+TimeBound = Union[str, datetime, None]
+# which events iter_events keeps: required field values, or a predicate
+Where = Union[Mapping[str, Any], Callable[[Event], bool], None]
+
+
+def _timestamp_bound(value: TimeBound) -> Optional[str]:
+    """``value`` in the ledger's fixed-width timestamp format, for comparison."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"not an ISO 8601 timestamp: {value!r}") from None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _first_value_from(
+    fh: Any, pos: int, name: str = "timestamp", kind: type = str
+) -> Tuple[int, Any]:
+    """Offset and ``name`` of the first line starting at or after ``pos`` with one.
+
+    Returns ``(offset, None)`` at end of file. Lines that are blank, torn or
+    lack a ``kind`` value for ``name`` are stepped over.
+    """
+    if pos:
+        fh.seek(pos - 1)
+        fh.readline()  # to the start of the next line
+    else:
+        fh.seek(0)
+    while True:
+        start = fh.tell()
+        raw = fh.readline()
+        if not raw:
+            return start, None
+        try:
+            value = json.loads(raw).get(name)
+        except (ValueError, AttributeError):
+            continue
+        if isinstance(value, kind) and not isinstance(value, bool):
+            return start, value
+
+
+def _seek_timestamp(fh: Any, since: str) -> int:
+    """Offset of the first line stamped at or after ``since``.
+
+    Bisects on byte offsets, reading one line per probe, so it costs
+    O(log size) reads. Relies on timestamps being non-decreasing, which
+    holds because they are taken under the append lock.
+    """
+    lo, hi = 0, os.fstat(fh.fileno()).st_size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        _, timestamp = _first_value_from(fh, mid)
+        if timestamp is None or timestamp >= since:
+            hi = mid
+        else:
+            lo = mid + 1
+    return _first_value_from(fh, lo)[0]
+
+
+def iter_events(
+    path: str = DEFAULT_LOG_PATH,
+    *,
+    decode_arrays: bool = False,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    blobs: BlobSource = None,
+    fields: Optional[Sequence[str]] = None,
+    where: Where = None,
+    lazy: bool = False,
+) -> Iterator[Mapping[str, Any]]:
+    """Yield each event in the ledger. Blank lines are skipped.
+
+    Arrays in ``details`` are stored as ``{"__ndarray__": {...}}``; pass
+    ``decode_arrays=True`` (needs numpy) to get them back as read-only
+    ``numpy.ndarray`` views.
+
+    Only committed events are yielded: a final line still being written (or
+    torn by a crash) is skipped rather than raising.
+
+    ``since`` (inclusive) and ``until`` (exclusive) restrict the events to a
+    time window. Each is a :class:`~datetime.datetime` or an ISO 8601
+    string; naive values are taken as UTC. The start of the window is
+    found by binary search over the file (or the timestamp index of a
+    SQLite ledger), so only the window itself is read.
+
+    ``blobs`` (a :class:`~llm_audit_trail.blobs.BlobStore` or its
+    directory) swaps ``{"$blob": ...}`` references back for the ``details``
+    they stand for, reading each blob only when its event is reached and
+    raising :class:`~llm_audit_trail.blobs.BlobError` if one is missing or
+    altered. Without it references are yielded as stored.
+
+    Scans that only need a few top-level fields can skip decoding
+    ``details`` altogether (see :class:`~llm_audit_trail.events.Event`):
+
+    * ``where`` keeps only matching events: a mapping of field to required
+      value, or a predicate called with each lazy
+      :class:`~llm_audit_trail.events.Event`;
+    * ``fields`` yields dicts holding just those top-level fields (those
+      an event lacks are left out);
+    * ``lazy=True`` yields the :class:`~llm_audit_trail.events.Event`
+      records themselves, whose ``details`` are decoded on first access.
+
+    ``details`` (and its blob, with ``blobs``) is only decoded for events
+    that pass ``where`` and ask for it.
+    """
+    store = as_blob_store(blobs)
+    hook = _decode_ndarray if decode_arrays else None
+    if fields is None and where is None and not lazy:
+        for event in _iter_events(path, hook, since, until):
+            if store is not None and is_blob_ref(event.get("details")):
+                event = store.resolve(event, hook)
+            yield event
+        return
+
+    predicate = _where_predicate(where)
+    match = None if where is None or callable(where) else where
+    for event in _iter_events(path, hook, since, until, store, lazy=True, match=match):
+        if predicate is not None and not predicate(event):
+            continue
+        if fields is not None:
+            yield {name: event[name] for name in fields if name in event}
+        elif lazy:
+            yield event
+        else:
+            yield event.to_dict()
+
+
+def _where_predicate(where: Where) -> Optional[Callable[[Event], bool]]:
+    if where is None or callable(where):
+        return where
+    wanted = dict(where)
+    return lambda event: all(event.get(name) == value for name, value in wanted.items())
+
+
+def _iter_events(
+    path: str,
+    hook: Any,
+    since: TimeBound,
+    until: TimeBound,
+    blobs: Optional[BlobStore] = None,
+    lazy: bool = False,
+    match: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Any]:
+    """Decoded events of ``path`` in the window: dicts, or lazy Events.
+
+    ``match`` lets a backend with indexed columns skip events; callers
+    still filter what is yielded.
+    """
+    lower, upper = _timestamp_bound(since), _timestamp_bound(until)
+    storage = open_storage(path)
+    if storage is not None:
+        try:
+            for _, line in storage.lines(lower, upper, match):
+                if isinstance(line, BinaryRecord):
+                    if line.error:
+                        raise AuditLogError(f"{path}: damaged binary record: {line.error}")
+                    if lazy:
+                        yield Event.from_record(line, hook, blobs)
+                    else:
+                        yield line.decode(object_hook=hook)
+                elif lazy:
+                    yield Event.from_line(line, hook, blobs)
+                else:
+                    yield json.loads(line, object_hook=hook)
+        finally:
+            storage.close()
+        return
+    with open(path, "rb") as fh:
+        if lower is not None:
+            fh.seek(_seek_timestamp(fh, lower))
+        for _, line in _CommittedLines(fh):
+            if lazy:
+                event = Event.from_line(line, hook, blobs)
+            else:
+                event = json.loads(line, object_hook=hook)
+            timestamp = event.get("timestamp")
+            if isinstance(timestamp, str):
+                if upper is not None and timestamp >= upper:
+                    break
+                if lower is not None and timestamp < lower:
+                    continue
+            yield event
 
 
 def read_head(path: str = DEFAULT_LOG_PATH) -> Optional[Dict[str, Any]]:
-    """Read the chain head without scanning the whole ledger."""
+    """Read the chain head without scanning the whole ledger.
+
+    Takes no lock, so it never delays an append: the head is the last
+    committed event, and a write still in flight is not yet part of it.
+    When a ``shared_head`` logger maintains ``<path>.head`` and it matches
+    the ledger's size, the head is read from there without touching the
+    ledger. A SQLite ledger answers from its index.
+    """
     if not os.path.exists(path) or os.path.getsize(path) == 0:
         return None
-    with open(path, "rb") as fh, _file_lock(fh):
-        record = _read_last_record(fh, path)
+    storage = open_storage(path)
+    if storage is not None:
+        try:
+            return storage.head()
+        finally:
+            storage.close()
+    cell = HeadCell.open(path + ".head")
+    if cell is not None:
+        with cell:
+            head = cell.read()
+        if head is not None and head.length == os.path.getsize(path):
+            return {"seq": head.seq, "hash": head.hash, "timestamp": head.timestamp}
+    with open(path, "rb") as fh:
+        record = _read_last_record(fh, path, _committed_end(fh))
     if record is None:
         return None
     return {
@@ -353,11 +1400,354 @@ def read_anchor(anchor_path: str) -> Dict[str, Any]:
         return json.load(fh)
 
 
+# one decoder for every verified line, skipping json.loads' per-call setup
+_decode_json = json.JSONDecoder().decode
+
+
+class _ChainVerifier:
+    """Checks ledger lines one at a time against the chain seen so far."""
+
+    def __init__(
+        self,
+        key: Optional[bytes],
+        expected_head: Optional[Dict[str, Any]] = None,
+        blobs: Optional[BlobStore] = None,
+    ) -> None:
+        self.key = key
+        self.expected_head = expected_head
+        self.blobs = blobs
+        self.anchor_seen = expected_head is None
+        # None once the chain is lost (after an unparseable line, when
+        # resynchronising): the next event's link and seq are taken on trust
+        self.prev_hash: Optional[str] = GENESIS
+        self.prev_seq: Optional[int] = None
+        self.count = 0
+        self.last: Optional[Dict[str, Any]] = None
+        self._last_line: Any = None
+        self._record: Optional[Dict[str, Any]] = None
+
+    def feed(
+        self, line_no: int, line: Union[str, bytes, BinaryRecord]
+    ) -> Optional[Dict[str, Any]]:
+        """Check one non-blank line; return an error report, or None if it links."""
+        self._record = None
+        raw: Optional[bytes] = None
+        body: Optional[bytes] = None
+        if isinstance(line, BinaryRecord):
+            if line.error:
+                return {"error": "malformed_record", "line": line_no, "detail": line.error}
+            try:
+                # *-bin events hash the body as is, so the header is enough;
+                # details are only needed for the blob check, and another
+                # algorithm's events are re-encoded as JSON
+                record = line.chain_fields() if self.blobs is None else None
+                if record is None or record["hash_alg"] not in BINARY_ALGS:
+                    record = line.decode()
+            except (ValueError, UnicodeDecodeError) as exc:
+                return {"error": "malformed_record", "line": line_no, "detail": str(exc)}
+            body = line.body
+        else:
+            raw = line.encode("utf-8") if isinstance(line, str) else line
+            try:
+                record = _decode_json(raw.decode("utf-8"))
+            except ValueError as exc:
+                return {"error": "malformed_json", "line": line_no, "detail": str(exc)}
+            if not isinstance(record, dict):
+                return {"error": "malformed_record", "line": line_no}
+        self._record = record
+
+        claimed = record.get("curr_hash")
+        if not isinstance(claimed, str):
+            return {
+                "error": "missing_curr_hash",
+                "line": line_no,
+                "event_id": record.get("event_id"),
+            }
+
+        found_prev = record.get("prev_hash")
+        if not isinstance(found_prev, str):
+            # nothing to hash over, even when the link is taken on trust
+            return {
+                "error": "broken_link",
+                "line": line_no,
+                "event_id": record.get("event_id"),
+                "expected_prev_hash": self.prev_hash,
+                "found_prev_hash": found_prev,
+                "detail": "prev_hash is missing or not a string",
+            }
+        prev_hash = self.prev_hash if self.prev_hash is not None else found_prev
+        if found_prev != prev_hash:
+            return {
+                "error": "broken_link",
+                "line": line_no,
+                "event_id": record.get("event_id"),
+                "expected_prev_hash": self.prev_hash,
+                "found_prev_hash": record.get("prev_hash"),
+                "detail": "an event was deleted, reordered or inserted here",
+            }
+
+        alg = record.get("hash_alg", _SHA256)
+        if alg not in (_SHA256, _HMAC_SHA256) + BINARY_ALGS:
+            return {"error": "unknown_hash_alg", "line": line_no, "hash_alg": alg}
+        if alg in (_HMAC_SHA256, HMAC_SHA256_BIN) and self.key is None:
+            return {
+                "error": "key_required",
+                "line": line_no,
+                "detail": f"ledger is HMAC-chained; pass key= or set ${HMAC_KEY_ENV}",
+            }
+
+        key = self.key if alg in (_HMAC_SHA256, HMAC_SHA256_BIN) else None
+        if alg in BINARY_ALGS:
+            # the body commits to prev_hash itself, checked as a link above
+            if body is None:
+                try:
+                    body = encode_body({k: v for k, v in record.items() if k != "curr_hash"})
+                except ValueError:
+                    body = b""
+            calculated = chain_digest(body, key)
+        else:
+            spliced = _spliced_body(raw, claimed) if raw is not None else None
+            calculated = None
+            if spliced is not None:
+                calculated = _chain_hash_bytes(prev_hash, spliced, key)
+            if calculated is None or not hmac.compare_digest(calculated, claimed):
+                # not canonical as stored (or tampered): judge the decoded record
+                fields = {k: v for k, v in record.items() if k != "curr_hash"}
+                calculated = _digest(prev_hash, fields, key)
+        if not hmac.compare_digest(calculated, claimed):
+            return {
+                "error": "hash_mismatch",
+                "line": line_no,
+                "event_id": record.get("event_id"),
+                "expected": calculated,
+                "found": claimed,
+                "detail": "this event's contents were modified after it was written",
+            }
+
+        seq = record.get("seq")
+        if isinstance(seq, int):
+            if self.prev_seq is not None and seq != self.prev_seq + 1:
+                return {
+                    "error": "seq_gap",
+                    "line": line_no,
+                    "expected_seq": self.prev_seq + 1,
+                    "found_seq": seq,
+                }
+            self.prev_seq = seq
+            anchor = self.expected_head
+            if not self.anchor_seen and seq == anchor.get("seq"):  # type: ignore[union-attr]
+                if claimed != anchor.get("hash"):  # type: ignore[union-attr]
+                    return {
+                        "error": "anchor_mismatch",
+                        "line": line_no,
+                        "seq": seq,
+                        "expected": anchor.get("hash"),  # type: ignore[union-attr]
+                        "found": claimed,
+                        "detail": "the anchored event was rewritten",
+                    }
+                self.anchor_seen = True
+
+        details = record.get("details")
+        if self.blobs is not None and is_blob_ref(details):
+            code = self.blobs.check(details[BLOB_KEY])
+            if code is not None:
+                return {
+                    "error": code,
+                    "line": line_no,
+                    "event_id": record.get("event_id"),
+                    "blob": details[BLOB_KEY],
+                    "detail": "the event links, but the details it references "
+                    "are missing or were altered",
+                }
+
+        self.prev_hash = claimed
+        self.last = record
+        self._last_line = line
+        self.count += 1
+        return None
+
+    def resync(self) -> None:
+        """Carry on after an error, trusting the failed line's own claims.
+
+        The chain continues from the line's claimed ``curr_hash`` and
+        ``seq``, so damage is reported once rather than at every later
+        line. A line that did not parse leaves nothing to trust, and the
+        next line's link is accepted as-is.
+        """
+        record = self._record
+        claimed = record.get("curr_hash") if record is not None else None
+        if not isinstance(claimed, str):
+            self.prev_hash = None
+            self.prev_seq = None
+            return
+        self.prev_hash = claimed
+        seq = record.get("seq")  # type: ignore[union-attr]
+        self.prev_seq = seq if isinstance(seq, int) else None
+        if not self.anchor_seen and seq == self.expected_head.get("seq"):  # type: ignore[union-attr]
+            self.anchor_seen = True  # already reported as anchor_mismatch
+
+    def head(self) -> Optional[Dict[str, Any]]:
+        last = self.last
+        if last is None:
+            return None
+        if "timestamp" not in last and isinstance(self._last_line, BinaryRecord):
+            last = self._last_line.decode(details=False)
+        return {
+            "seq": last.get("seq"),
+            "hash": last["curr_hash"],
+            "timestamp": last.get("timestamp"),
+        }
+
+    def finish(self) -> Tuple[bool, Dict[str, Any]]:
+        """Final verdict once every line has been fed without error."""
+        if not self.anchor_seen:
+            return False, {
+                "error": "anchor_missing",
+                "detail": (
+                    "the anchored event is no longer in the ledger; its tail was "
+                    "truncated or rewritten"
+                ),
+                "expected_head": self.expected_head,
+                "events": self.count,
+                "head": self.head(),
+            }
+        return True, {"events": self.count, "head": self.head()}
+
+
+class _FileSampler:
+    """Random access to the committed lines of a JSONL ledger, by byte offset.
+
+    Implements the positional lookups :class:`~llm_audit_trail.storage.LedgerStorage`
+    backends provide, so spot checks read a handful of lines on either.
+    """
+
+    def __init__(self, fh: Any) -> None:
+        self.fh = fh
+        self.end = _committed_end(fh)
+
+    def extent(self) -> Tuple[int, int]:
+        return 0, self.end
+
+    def line_from(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        fh = self.fh
+        if pos:
+            fh.seek(pos - 1)
+            fh.readline()  # to the start of the next line
+        else:
+            fh.seek(0)
+        while fh.tell() < self.end:
+            start = fh.tell()
+            line = fh.readline().strip()
+            if line:
+                return start, line
+        return None
+
+    def line_before(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        start, line = _last_line_at(self.fh, pos)
+        return None if line is None else (start, line)
+
+    def line_with_seq(self, seq: int) -> Optional[Tuple[int, bytes]]:
+        fh = self.fh
+        lo, hi = 0, self.end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, found = _first_value_from(fh, mid, "seq", int)
+            if found is None or start >= self.end or found >= seq:
+                hi = mid
+            else:
+                lo = mid + 1
+        start, found = _first_value_from(fh, lo, "seq", int)
+        if found != seq or start >= self.end:
+            return None
+        return self.line_from(start)
+
+
+def _verify_sample(
+    sampler: Any,
+    sample: int,
+    key: Optional[bytes],
+    expected_head: Optional[Dict[str, Any]],
+    blobs: Optional[BlobStore],
+    rng: random.Random,
+) -> Tuple[bool, Dict[str, Any]]:
+    """Check ``sample`` random events, the head and the anchor. See verify_log."""
+
+    def check(
+        start: int, line: bytes, anchor: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        verifier = _ChainVerifier(key, anchor, blobs)
+        if anchor is not None:
+            verifier.prev_hash = None  # the anchored event's own digest only
+        else:
+            previous = sampler.line_before(start)
+            if previous is not None:
+                record = _parse_record(previous[1])
+                if record is None:
+                    return {"error": "malformed_record", "offset": previous[0]}
+                prev_seq = record.get("seq")
+                verifier.prev_hash = record["curr_hash"]
+                verifier.prev_seq = prev_seq if isinstance(prev_seq, int) else None
+        error = verifier.feed(start, line)
+        if error is not None:
+            error = dict(error, offset=error.pop("line"))
+        return error
+
+    lo, hi = sampler.extent()
+    last = sampler.line_before(hi) if hi > lo else None
+    if last is None:
+        if expected_head is not None:
+            return False, {"error": "anchor_missing", "expected_head": expected_head}
+        return True, {"sampled_events": 0, "head": None, "detection_probability": {}}
+
+    checked: Dict[int, bytes] = {}
+    for _ in range(sample):
+        found = sampler.line_from(rng.randrange(lo, hi)) or sampler.line_from(lo)
+        if found is not None:
+            checked.setdefault(*found)
+    targets = dict(checked)
+    targets.setdefault(*last)
+    for start in sorted(targets):
+        error = check(start, targets[start])
+        if error is not None:
+            return False, error
+
+    if expected_head is not None:
+        seq = expected_head.get("seq")
+        found = sampler.line_with_seq(seq) if isinstance(seq, int) else None
+        if found is None:
+            return False, {
+                "error": "anchor_missing",
+                "detail": "no event carries the anchored seq any more",
+                "expected_head": expected_head,
+            }
+        error = check(*found, anchor=expected_head)
+        if error is not None:
+            return False, error
+
+    head = _parse_record(last[1])
+    n = len(checked)
+    return True, {
+        "sampled_events": n,
+        "head": {
+            "seq": head.get("seq"),  # type: ignore[union-attr]
+            "hash": head["curr_hash"],  # type: ignore[index]
+            "timestamp": head.get("timestamp"),  # type: ignore[union-attr]
+        },
+        "detection_probability": {
+            str(fraction): 1 - (1 - fraction) ** n for fraction in SAMPLE_FRACTIONS
+        },
+    }
+
+
 def verify_log(
     path: str = DEFAULT_LOG_PATH,
     *,
     key: Union[str, bytes, None] = None,
     expected_head: Optional[Dict[str, Any]] = None,
+    tracer: Optional[Tracer] = None,
+    mode: str = "first",
+    sample: Optional[int] = None,
+    blobs: BlobSource = None,
 ) -> Tuple[bool, Dict[str, Any]]:
     """Verify the hash chain end to end.
 
@@ -371,129 +1761,203 @@ def verify_log(
             also requires that the anchored event is still present at its
             original sequence number with its original hash, which is what
             catches truncation of the ledger's tail.
+        tracer: Receives an ``audit.verify`` span around the run and an
+            ``audit.verify_line`` span around each event.
+        mode: ``"first"`` stops at the first problem. ``"all"`` resumes the
+            chain after each one and reports them all in a single pass.
+        sample: Spot-check instead of reading everything: verify this many
+            randomly chosen events (each one's digest and its link to the
+            event stored before it), plus the head and, with
+            ``expected_head``, the anchored event. Costs O(sample) reads
+            however large the ledger is. Events are picked at random byte
+            offsets, so with uneven line lengths the choice is only roughly
+            uniform. Not combinable with ``mode="all"``.
+        blobs: The :class:`~llm_audit_trail.blobs.BlobStore` (or its
+            directory) holding out-of-line ``details``. Each referenced blob
+            must then exist and match its digest (``blob_missing``,
+            ``blob_mismatch``). Without it only the references are checked.
 
     Returns:
         ``(ok, report)``. On success the report carries ``events`` and
         ``head``; on failure it carries an ``error`` code plus context.
+        Verification covers the committed prefix of the ledger; if a final
+        line is still being written (or was torn by a crash) it is left out
+        and its size reported as ``pending_bytes``.
+        With ``mode="all"`` a failing report also carries every error
+        under ``errors`` and the contiguous damaged line ranges under
+        ``damage`` (see :func:`iter_verification`).
+        With ``sample`` a passing report carries ``sampled_events``,
+        ``head`` and ``detection_probability``: for each fraction of altered
+        events in :data:`SAMPLE_FRACTIONS`, the chance that this many
+        samples would have hit one. Failures point at the bad event by
+        ``offset`` (a byte offset, or a row position in SQLite) rather
+        than ``line``.
     """
-    key = _resolve_key(key)
-    prev_hash = GENESIS
-    prev_seq: Optional[int] = None
-    count = 0
-    last: Optional[Dict[str, Any]] = None
-    anchor_seen = expected_head is None
-
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"unknown verify mode {mode!r}; expected one of {VERIFY_MODES}")
+    if sample is not None:
+        if mode != "first":
+            raise ValueError("sample= cannot be combined with mode='all'")
+        if sample < 1:
+            raise ValueError("sample must be a positive number of events")
+        attributes = {"path": path, "sample": sample}
+        outer = tracer.span("audit.verify", attributes) if tracer else _NO_SPAN
+        try:
+            with ExitStack() as stack, outer:
+                storage = open_storage(path)
+                if storage is None:
+                    sampler = _FileSampler(stack.enter_context(open(path, "rb")))
+                elif storage.binary:
+                    storage.close()
+                    raise ValueError(
+                        "sample= needs random access by offset; binary ledgers "
+                        "are verified in full"
+                    )
+                else:
+                    sampler = stack.enter_context(closing(storage))
+                return _verify_sample(
+                    sampler,
+                    sample,
+                    _resolve_key(key),
+                    expected_head,
+                    as_blob_store(blobs),
+                    random.SystemRandom(),
+                )
+        except (OSError, sqlite3.Error) as exc:
+            return False, {"error": "unreadable", "path": path, "detail": str(exc)}
+    if mode == "all":
+        errors: List[Dict[str, Any]] = []
+        damage: List[Dict[str, Any]] = []
+        for record in iter_verification(
+            path, key=key, expected_head=expected_head, tracer=tracer, blobs=blobs
+        ):
+            kind = record.pop("type")
+            if kind == "error":
+                errors.append(record)
+            elif kind == "damage":
+                damage.append(record)
+        summary = record
+        report = {"events": summary["events"], "head": summary["head"]}
+        if "pending_bytes" in summary:
+            report["pending_bytes"] = summary["pending_bytes"]
+        if summary["ok"]:
+            return True, report
+        return False, dict(report, error=errors[0]["error"], errors=errors, damage=damage)
+
+    verifier = _ChainVerifier(_resolve_key(key), expected_head, as_blob_store(blobs))
+
+    reader = ExitStack()
     try:
-        handle = open(path, "r", encoding="utf-8")
-    except OSError as exc:
+        lines = reader.enter_context(_ledger_lines(path))
+    except (OSError, sqlite3.Error) as exc:
         return False, {"error": "unreadable", "path": path, "detail": str(exc)}
 
-    with handle:
-        for line_no, raw in enumerate(handle, start=1):
-            line = raw.strip()
-            if not line:
-                continue
-
-            try:
-                record = json.loads(line)
-            except ValueError as exc:
-                return False, {
-                    "error": "malformed_json",
-                    "line": line_no,
-                    "detail": str(exc),
-                }
-            if not isinstance(record, dict):
-                return False, {"error": "malformed_record", "line": line_no}
-
-            claimed = record.get("curr_hash")
-            if not isinstance(claimed, str):
-                return False, {
-                    "error": "missing_curr_hash",
-                    "line": line_no,
-                    "event_id": record.get("event_id"),
-                }
-
-            if record.get("prev_hash") != prev_hash:
-                return False, {
-                    "error": "broken_link",
-                    "line": line_no,
-                    "event_id": record.get("event_id"),
-                    "expected_prev_hash": prev_hash,
-                    "found_prev_hash": record.get("prev_hash"),
-                    "detail": "an event was deleted, reordered or inserted here",
-                }
-
-            alg = record.get("hash_alg", _SHA256)
-            if alg not in (_SHA256, _HMAC_SHA256):
-                return False, {
-                    "error": "unknown_hash_alg",
-                    "line": line_no,
-                    "hash_alg": alg,
-                }
-            if alg == _HMAC_SHA256 and key is None:
-                return False, {
-                    "error": "key_required",
-                    "line": line_no,
-                    "detail": (
-                        "ledger is HMAC-chained; pass key= or set "
-                        f"${HMAC_KEY_ENV}"
-                    ),
-                }
+    outer = tracer.span("audit.verify", {"path": path}) if tracer else _NO_SPAN
+    with reader, outer:
+        for line_no, line in lines:
+            if tracer is None:
+                error = verifier.feed(line_no, line)
+            else:
+                with tracer.span("audit.verify_line", {"line": line_no}):
+                    error = verifier.feed(line_no, line)
+            if error is not None:
+                return False, error
 
-            body = {k: v for k, v in record.items() if k != "curr_hash"}
-            calculated = _digest(prev_hash, body, key if alg == _HMAC_SHA256 else None)
-            if not hmac.compare_digest(calculated, claimed):
-                return False, {
-                    "error": "hash_mismatch",
-                    "line": line_no,
-                    "event_id": record.get("event_id"),
-                    "expected": calculated,
-                    "found": claimed,
-                    "detail": "this event's contents were modified after it was written",
-                }
+    ok, report = verifier.finish()
+    if lines.pending_bytes:
+        report["pending_bytes"] = lines.pending_bytes
+    return ok, report
 
-            seq = record.get("seq")
-            if isinstance(seq, int):
-                if prev_seq is not None and seq != prev_seq + 1:
-                    return False, {
-                        "error": "seq_gap",
-                        "line": line_no,
-                        "expected_seq": prev_seq + 1,
-                        "found_seq": seq,
-                    }
-                prev_seq = seq
-                if not anchor_seen and seq == expected_head.get("seq"):  # type: ignore[union-attr]
-                    if claimed != expected_head.get("hash"):  # type: ignore[union-attr]
-                        return False, {
-                            "error": "anchor_mismatch",
-                            "line": line_no,
-                            "seq": seq,
-                            "expected": expected_head.get("hash"),  # type: ignore[union-attr]
-                            "found": claimed,
-                            "detail": "the anchored event was rewritten",
-                        }
-                    anchor_seen = True
-
-            prev_hash = claimed
-            last = record
-            count += 1
-
-    head = (
-        {"seq": last.get("seq"), "hash": last["curr_hash"], "timestamp": last.get("timestamp")}
-        if last is not None
-        else None
-    )
 
-    if not anchor_seen:
-        return False, {
-            "error": "anchor_missing",
-            "detail": (
-                "the anchored event is no longer in the ledger; its tail was "
-                "truncated or rewritten"
-            ),
-            "expected_head": expected_head,
-            "events": count,
-            "head": head,
+def iter_verification(
+    path: str = DEFAULT_LOG_PATH,
+    *,
+    key: Union[str, bytes, None] = None,
+    expected_head: Optional[Dict[str, Any]] = None,
+    tracer: Optional[Tracer] = None,
+    blobs: BlobSource = None,
+) -> Iterator[Dict[str, Any]]:
+    """Verify the whole ledger, yielding every problem as it is found.
+
+    After each failure the chain is resynchronised from the failing line's
+    claimed ``curr_hash``, so one pass maps all the damage. Yields, in file
+    order:
+
+    * ``{"type": "error", "error": ..., "line": ..., ...}`` — the same
+      reports :func:`verify_log` returns, one per failing line;
+    * ``{"type": "damage", "first_line", "last_line", "errors", "codes"}``
+      — once per run of consecutive failing lines, when it ends;
+    * finally ``{"type": "summary", "ok", "events", "errors",
+      "damaged_ranges", "head"}``, where ``events`` counts lines that
+      verified, plus ``pending_bytes`` if the final line is uncommitted.
+
+    ``key_required`` ends the scan: without the key nothing further can be
+    checked. ``blobs`` is as for :func:`verify_log`. Every record is JSON-serialisable, for streaming as JSON lines.
+    """
+    verifier = _ChainVerifier(_resolve_key(key), expected_head, as_blob_store(blobs))
+    errors = ranges = 0
+    fatal = False
+    damage: Optional[Dict[str, Any]] = None
+
+    def close() -> Iterator[Dict[str, Any]]:
+        nonlocal damage, ranges
+        if damage is not None:
+            ranges += 1
+            damage["codes"] = sorted(damage["codes"])
+            yield dict(damage, type="damage")
+            damage = None
+
+    reader = ExitStack()
+    try:
+        lines = reader.enter_context(_ledger_lines(path))
+    except (OSError, sqlite3.Error) as exc:
+        yield {"type": "error", "error": "unreadable", "path": path, "detail": str(exc)}
+        yield {
+            "type": "summary",
+            "ok": False,
+            "events": 0,
+            "errors": 1,
+            "damaged_ranges": 0,
+            "head": None,
         }
+        return
 
-    return True, {"events": count, "head": head}
+    outer = tracer.span("audit.verify", {"path": path}) if tracer else _NO_SPAN
+    with reader, outer:
+        for line_no, line in lines:
+            if tracer is None:
+                error = verifier.feed(line_no, line)
+            else:
+                with tracer.span("audit.verify_line", {"line": line_no}):
+                    error = verifier.feed(line_no, line)
+            if error is None:
+                yield from close()
+                continue
+            errors += 1
+            yield dict(error, type="error")
+            if damage is None:
+                damage = {"first_line": line_no, "errors": 0, "codes": set()}
+            damage["last_line"] = line_no
+            damage["errors"] += 1
+            damage["codes"].add(error["error"])
+            if error["error"] == "key_required":
+                fatal = True
+                break
+            verifier.resync()
+        yield from close()
+
+    ok, final = verifier.finish()
+    if not ok and not fatal:
+        errors += 1
+        yield {"type": "error", **final}
+    summary = {
+        "type": "summary",
+        "ok": errors == 0,
+        "events": verifier.count,
+        "errors": errors,
+        "damaged_ranges": ranges,
+        "head": verifier.head(),
+    }
+    if lines.pending_bytes:
+        summary["pending_bytes"] = lines.pending_bytes
+    yield summary
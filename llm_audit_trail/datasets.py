@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any, Dict, List, Optional
 
-from .core import AuditLogger
+from .core import DEFAULT_LOG_PATH, AuditLogger, iter_events
+from .hashing import load_manifest
 from .registry import EventTypes
 
-__all__ = ["register_dataset", "dataset_attestation"]
+__all__ = ["register_dataset", "dataset_attestation", "registered_manifest"]
 
 
 def register_dataset(
@@ -23,8 +25,16 @@ def register_dataset(
     preprocessing: Optional[Dict[str, Any]] = None,
     pii_residual_risk: Optional[str] = None,
     owner: Optional[str] = None,
+    manifest_root: Optional[str] = None,
+    manifest_path: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Record a dataset so later training and evaluation events can cite it."""
+    """Record a dataset so later training and evaluation events can cite it.
+
+    ``manifest_root`` and ``manifest_path`` cite a Merkle manifest from
+    :func:`llm_audit_trail.hashing.build_manifest`: the root is chained into
+    the ledger, the manifest itself is stored wherever ``manifest_path``
+    points.
+    """
     return log.emit(
         EventTypes.DATASET_REGISTERED,
         details={
@@ -37,6 +47,8 @@ def register_dataset(
             "preprocessing": preprocessing or {},
             "pii_residual_risk": pii_residual_risk,
             "owner": owner,
+            "manifest_root": manifest_root,
+            "manifest_path": manifest_path,
         },
         dataset_id=dataset_id,
         system="data_engineering",
@@ -64,3 +76,42 @@ def dataset_attestation(
         system="governance",
         actor=owner,
     )
+
+
+def registered_manifest(
+    dataset_id: str, version: str, path: str = DEFAULT_LOG_PATH
+) -> Dict[str, Any]:
+    """The manifest a ledger recorded for one version of a dataset.
+
+    Takes the latest ``DatasetRegistered`` event for ``dataset_id`` and
+    ``version`` that cites a manifest, loads it from its ``manifest_path``
+    (relative paths are taken from the ledger's directory) and checks that
+    it is the manifest whose root was chained.
+
+    Raises:
+        LookupError: if no such event cites a manifest.
+        ValueError: if the file is not a manifest or its root differs from
+            the chained ``manifest_root``.
+        OSError: if the manifest cannot be read.
+    """
+    found: Optional[Dict[str, Any]] = None
+    for event in iter_events(
+        path, where={"event_type": EventTypes.DATASET_REGISTERED, "dataset_id": dataset_id}
+    ):
+        details = event.get("details") or {}
+        if details.get("version") == version and details.get("manifest_path"):
+            found = details
+    if found is None:
+        raise LookupError(
+            f"{path}: no manifest recorded for version {version!r} of {dataset_id}"
+        )
+    manifest_path = os.path.join(
+        os.path.dirname(os.path.abspath(path)), found["manifest_path"]
+    )
+    manifest = load_manifest(manifest_path)
+    if manifest["root"] != found.get("manifest_root"):
+        raise ValueError(
+            f"{manifest_path}: root {manifest['root']} is not the chained "
+            f"manifest_root {found.get('manifest_root')}"
+        )
+    return manifest
@@ -0,0 +1,152 @@
+"""Ledger events with ``details`` decoded on first access.
+
+Most consumers that scan a ledger look at ``event_type``, ``seq``,
+``timestamp`` or the scope ids and never at ``details`` — which is usually
+most of every line. :class:`Event` decodes everything else and keeps
+``details`` as the raw bytes of the line until it is read, so such scans
+build a dozen small values per event instead of the whole payload.
+
+Canonical lines sort their keys, so ``details`` is always followed by
+``event_id``: the member is cut out between the two and the remainder is
+decoded. The cut is only trusted when what is left parses as an object
+that still has a top-level ``event_id`` and no ``details``; anything else
+is decoded in full.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .binary import BinaryRecord
+from .blobs import BlobStore, is_blob_ref
+
+__all__ = ["Event"]
+
+_DETAILS_MEMBER = b',"details":'
+_NEXT_MEMBER = b',"event_id":'
+_NOTHING = object()  # no details waiting to be decoded
+
+ObjectHook = Optional[Callable[[Dict[str, Any]], Any]]
+
+
+def _split_details(line: bytes, object_hook: ObjectHook) -> Optional[Tuple[Dict[str, Any], bytes]]:
+    """The line's other fields, and its ``details`` still encoded."""
+    start = line.find(_DETAILS_MEMBER)
+    end = line.rfind(_NEXT_MEMBER)
+    if start < 0 or end < start:
+        return None
+    try:
+        fields = json.loads(line[:start] + line[end:], object_hook=object_hook)
+    except ValueError:
+        return None
+    if (
+        not isinstance(fields, dict)
+        or "details" in fields
+        or not isinstance(fields.get("event_id"), str)
+    ):
+        return None
+    return fields, line[start + len(_DETAILS_MEMBER) : end]
+
+
+class Event(Mapping):
+    """A read-only mapping of one event's fields; ``details`` load lazily.
+
+    Compares equal to the dict :func:`~llm_audit_trail.iter_events` would
+    have yielded. Use :meth:`to_dict` where a real dict is needed (for
+    ``json.dumps``, say).
+    """
+
+    __slots__ = ("_fields", "_pending", "_hook", "_blobs")
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        pending: Any = _NOTHING,
+        object_hook: ObjectHook = None,
+        blobs: Optional[BlobStore] = None,
+    ) -> None:
+        self._fields = fields
+        self._pending = pending
+        self._hook = object_hook
+        self._blobs = blobs
+        if blobs is not None and pending is _NOTHING and "details" in fields:
+            # decoded already, but a blob reference is still only read on demand
+            self._pending = fields.pop("details")
+
+    @classmethod
+    def from_line(
+        cls,
+        line: bytes,
+        object_hook: ObjectHook = None,
+        blobs: Optional[BlobStore] = None,
+    ) -> "Event":
+        """Decode a ledger line, leaving ``details`` for later.
+
+        Raises:
+            ValueError: if the line is not a JSON object.
+        """
+        split = _split_details(line, object_hook)
+        if split is not None:
+            return cls(split[0], split[1], object_hook, blobs)
+        fields = json.loads(line, object_hook=object_hook)
+        if not isinstance(fields, dict):
+            raise ValueError("ledger line is not a JSON object")
+        return cls(fields, _NOTHING, object_hook, blobs)
+
+    @classmethod
+    def from_record(
+        cls,
+        record: BinaryRecord,
+        object_hook: ObjectHook = None,
+        blobs: Optional[BlobStore] = None,
+    ) -> "Event":
+        """Decode a binary record, leaving ``details`` for later."""
+        pending = record if record.has_details else _NOTHING
+        return cls(record.decode(details=False), pending, object_hook, blobs)
+
+    @property
+    def details(self) -> Any:
+        return self.get("details")
+
+    def to_dict(self) -> Dict[str, Any]:
+        self._load()
+        return dict(self._fields)
+
+    def _load(self) -> None:
+        pending = self._pending
+        if pending is _NOTHING:
+            return
+        self._pending = _NOTHING
+        if isinstance(pending, BinaryRecord):
+            details = pending.decode(object_hook=self._hook)["details"]
+        elif isinstance(pending, bytes):
+            details = json.loads(pending, object_hook=self._hook)
+        else:
+            details = pending
+        if self._blobs is not None and is_blob_ref(details):
+            details = self._blobs.load_details(details, self._hook)
+        self._fields["details"] = details
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "details":
+            self._load()
+        return self._fields[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields or (key == "details" and self._pending is not _NOTHING)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        if self._pending is not _NOTHING:
+            yield "details"
+
+    def __len__(self) -> int:
+        return len(self._fields) + (self._pending is not _NOTHING)
+
+    def __repr__(self) -> str:
+        shown = dict(self._fields)
+        if self._pending is not _NOTHING:
+            shown["details"] = ...
+        return f"Event({shown!r})"
@@ -10,8 +10,10 @@ from typing import Optional
 
 from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
 
 from .core import AuditLogger
+from .metrics import render_prometheus
 
 __all__ = ["AuditMiddleware"]
 
@@ -36,6 +38,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
         buffer_response: Read the response body to hash it. Set False for
             streaming endpoints (SSE, token streaming) — the response then
             passes straight through and its hash is recorded as None.
+        metrics_path: Serve the logger's writer metrics in Prometheus text
+            format at this path (e.g. ``"/metrics"``). Scrapes are answered
+            by the middleware and are not themselves audited.
     """
 
     def __init__(
@@ -47,6 +52,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
         log_client_ip: bool = False,
         preview_chars: int = 64,
         buffer_response: bool = True,
+        metrics_path: Optional[str] = None,
     ) -> None:
         super().__init__(app)
         self.log = logger
@@ -55,6 +61,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
         self.log_client_ip = log_client_ip
         self.preview_chars = preview_chars
         self.buffer_response = buffer_response
+        self.metrics_path = metrics_path
 
     def _preview(self, text: str) -> Optional[str]:
         return None if self.redact else text[: self.preview_chars]
@@ -73,6 +80,12 @@ class AuditMiddleware(BaseHTTPMiddleware):
         )
 
     async def dispatch(self, request, call_next):
+        if self.metrics_path is not None and request.url.path == self.metrics_path:
+            return PlainTextResponse(
+                render_prometheus(self.log.metrics(), ledger=self.log.path),
+                media_type="text/plain; version=0.0.4",
+            )
+
         started = time.perf_counter()
         request_id = uuid.uuid4().hex
 
@@ -0,0 +1,327 @@
+"""Current governance state: who approved what, and which waivers still hold.
+
+Answering "is deployment X approved right now?" from the ledger means
+replaying every ``Approval``, ``RiskWaiver`` and ``Attestation`` ever
+written. :func:`governance_state` keeps the replay in a state file next to
+the ledger (``<ledger>.governance.json``) together with the byte offset,
+``seq`` and hash it reflects, and on the next call reads only the bytes
+appended since. The state is rebuilt from scratch whenever the ledger no
+longer matches it — truncated, rewritten, or its chain does not continue
+from the recorded hash.
+
+The state file sits next to the ledger, so whoever can write there could
+add an approval to it or drop an expired waiver. With the ledger key
+(``$AUDIT_HMAC_KEY``) it is sealed with an HMAC and only resumed from when
+the seal checks out. Without a key the file is written unsealed and only
+its byte offsets are used: each decision is read back from the ledger line
+it points at, so nothing can be added to the file that the ledger does not
+hold. Dropping a decision from an unsealed file still goes unnoticed — no
+more than an unkeyed chain, which anyone with write access can recompute,
+protects against.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
+
+from .blobs import is_blob_ref
+from .core import (
+    DEFAULT_LOG_PATH,
+    GENESIS,
+    _parse_record,
+    _read_last_line,
+    _resolve_key,
+    _stable_json,
+)
+from .registry import EventTypes
+from .storage import is_jsonl_ledger
+
+__all__ = ["governance_state", "STATE_FORMAT"]
+
+STATE_FORMAT = "llm-audit-governance/3"
+
+_SCOPE_KEYS = ("model_id", "dataset_id", "deployment_id")
+_DECISIONS = (EventTypes.APPROVAL, EventTypes.RISK_WAIVER, EventTypes.ATTESTATION)
+# Canonical lines carry the event type verbatim, so most lines can be
+# skipped without parsing them.
+_MARKERS = tuple(f'"event_type":"{name}"'.encode("ascii") for name in _DECISIONS)
+
+
+def _empty_state() -> Dict[str, Any]:
+    return {
+        "format": STATE_FORMAT,
+        "offset": 0,  # bytes of the ledger replayed so far
+        "seq": None,
+        "hash": None,
+        "decisions": [],
+        "positions": [],  # byte offset of each decision's ledger line
+    }
+
+
+def _seal(state: Dict[str, Any], key: bytes) -> str:
+    body = _stable_json({k: v for k, v in state.items() if k != "mac"})
+    return hmac.new(key, body.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _well_formed(state: Any) -> bool:
+    if not isinstance(state, dict) or state.get("format") != STATE_FORMAT:
+        return False
+    offset, positions = state.get("offset"), state.get("positions")
+    return (
+        isinstance(offset, int)
+        and offset >= 0
+        and isinstance(state.get("hash"), (str, type(None)))
+        and isinstance(state.get("decisions"), list)
+        and isinstance(positions, list)
+        and all(isinstance(p, int) and 0 <= p < offset for p in positions)
+        and positions == sorted(set(positions))
+    )
+
+
+def _load_state(state_path: str, key: Optional[bytes]) -> Dict[str, Any]:
+    try:
+        with open(state_path, "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+    except (OSError, ValueError):
+        return _empty_state()
+    if not isinstance(state, dict):
+        return _empty_state()
+    mac = state.pop("mac", None)
+    if key is not None and (
+        not isinstance(mac, str) or not hmac.compare_digest(mac, _seal(state, key))
+    ):
+        return _empty_state()
+    if not _well_formed(state):
+        return _empty_state()
+    return state
+
+
+def _save_state(state: Dict[str, Any], state_path: str, key: Optional[bytes]) -> None:
+    tmp = f"{state_path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            sealed = state if key is None else dict(state, mac=_seal(state, key))
+            json.dump(sealed, fh, sort_keys=True, separators=(",", ":"))
+        os.replace(tmp, state_path)
+    except OSError:
+        # a read-only ledger directory only costs the next caller a replay
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _still_matches(fh: Any, state: Dict[str, Any], size: int) -> bool:
+    """Whether the ledger still ends its first ``offset`` bytes on ``hash``."""
+    offset = state["offset"]
+    if offset == 0:
+        return True
+    if offset > size:
+        return False
+    fh.seek(offset - 1)
+    if fh.read(1) != b"\n":
+        return False
+    record = _parse_record(_read_last_line(fh, offset) or b"")
+    return record is not None and record["curr_hash"] == state["hash"]
+
+
+def _reread(fh: Any, state: Dict[str, Any]) -> bool:
+    """Rebuild an unsealed state's decisions from the lines it points at."""
+    decisions = []
+    for position in state["positions"]:
+        if position > 0:
+            fh.seek(position - 1)
+            if fh.read(1) != b"\n":
+                return False
+        else:
+            fh.seek(0)
+        record = _parse_record(fh.readline().strip())
+        if record is None or record.get("event_type") not in _DECISIONS:
+            return False
+        decisions.append(_summary(record))
+    state["decisions"] = decisions
+    return True
+
+
+def _summary(record: Dict[str, Any]) -> Dict[str, Any]:
+    details = record.get("details") or {}
+    readable = isinstance(details, dict) and not is_blob_ref(details)
+    if not readable:
+        details = {}
+    summary = {
+        "event_type": record.get("event_type"),
+        "event_id": record.get("event_id"),
+        "seq": record.get("seq"),
+        "timestamp": record.get("timestamp"),
+        "owner": details.get("owner"),
+        "scope": {key: record.get(key) for key in _SCOPE_KEYS},
+    }
+    if not readable:
+        # stored out of line or not an object: owner, dates and controls
+        # are unknown, so a waiver counts as expired
+        summary["details_unreadable"] = True
+    if record.get("event_type") == EventTypes.RISK_WAIVER:
+        summary["waived_controls"] = details.get("waived_controls") or []
+        summary["time_bound_until"] = details.get("time_bound_until")
+    elif record.get("event_type") == EventTypes.ATTESTATION:
+        summary["statement"] = details.get("statement")
+    return summary
+
+
+def _catch_up(fh: Any, state: Dict[str, Any]) -> bool:
+    """Apply committed lines after ``state["offset"]``. False if the chain broke."""
+    fh.seek(state["offset"])
+    offset = state["offset"]
+    checked_link = False
+    last: Optional[bytes] = None
+    for raw in fh:
+        if not raw.endswith(b"\n"):
+            break  # uncommitted tail: leave it for after recovery
+        start = offset
+        offset += len(raw)
+        line = raw.strip()
+        if not line:
+            continue
+        if not checked_link:
+            record = _parse_record(line)
+            if record is None or record.get("prev_hash") != (state["hash"] or GENESIS):
+                return False
+            checked_link = True
+        if any(marker in line for marker in _MARKERS):
+            record = _parse_record(line)
+            if record is not None and record.get("event_type") in _DECISIONS:
+                state["decisions"].append(_summary(record))
+                state["positions"].append(start)
+        last = line
+    if last is not None:
+        record = _parse_record(last)
+        if record is None:
+            return False
+        state["seq"] = record.get("seq")
+        state["hash"] = record["curr_hash"]
+    state["offset"] = offset
+    return True
+
+
+def _refresh(
+    path: str, state_path: str, persist: bool, key: Optional[bytes]
+) -> Dict[str, Any]:
+    state = _load_state(state_path, key)
+    if not os.path.exists(path):
+        return _empty_state()
+    before = dict(state, decisions=None, positions=None)
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if not (
+            _still_matches(fh, state, size)
+            and (key is not None or _reread(fh, state))
+            and _catch_up(fh, state)
+        ):
+            state = _empty_state()
+            _catch_up(fh, state)
+    if persist and dict(state, decisions=None, positions=None) != before:
+        _save_state(state, state_path, key)
+    return state
+
+
+def _expiry(value: Any) -> datetime:
+    """When a ``time_bound_until`` lapses. A bare date lasts the whole day."""
+    text = str(value).strip()
+    moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    if len(text) == 10:
+        moment += timedelta(days=1)
+    return moment
+
+
+def _matches(decision: Dict[str, Any], scope: Dict[str, str]) -> bool:
+    return all(decision["scope"].get(key) == value for key, value in scope.items())
+
+
+def governance_state(
+    path: str = DEFAULT_LOG_PATH,
+    scope: Optional[Dict[str, Optional[str]]] = None,
+    *,
+    now: Optional[datetime] = None,
+    state_path: Optional[str] = None,
+    persist: bool = True,
+    key: Union[str, bytes, None] = None,
+) -> Dict[str, Any]:
+    """Approvals, waivers and attestations in force for a scope.
+
+    Args:
+        path: Ledger to read.
+        scope: Any of ``model_id``, ``dataset_id`` and ``deployment_id``.
+            Decisions match when they carry every given value. None or an
+            empty dict covers the whole ledger.
+        now: Reference time for waiver expiry. Defaults to the current time.
+        state_path: Where the replayed state lives. Defaults to
+            ``<path>.governance.json``.
+        persist: Write the refreshed state back for the next caller.
+        key: Secret sealing the state file. Defaults to
+            ``$AUDIT_HMAC_KEY``; without one the file is left unsealed and
+            each decision is re-read from the ledger instead.
+
+    Returns:
+        ``{"seq", "scope", "approved", "approvals", "waivers",
+        "expired_waivers", "attestations", "ok"}``. ``ok`` is true when the
+        scope has at least one approval and no waiver past its
+        ``time_bound_until``. A waiver whose date cannot be read counts as
+        expired, as does one whose ``details`` are stored in a blob or are
+        not an object (flagged ``details_unreadable``).
+    """
+    if not is_jsonl_ledger(path):
+        raise ValueError(
+            f"{path}: governance state is replayed from JSONL ledgers only; "
+            f"copy it with `llm-audit convert`"
+        )
+    scope = {key: value for key, value in (scope or {}).items() if value}
+    unknown = set(scope) - set(_SCOPE_KEYS)
+    if unknown:
+        raise ValueError(f"unknown scope keys {sorted(unknown)}; expected {_SCOPE_KEYS}")
+    state = _refresh(
+        path, state_path or path + ".governance.json", persist, _resolve_key(key)
+    )
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+
+    approvals: List[Dict[str, Any]] = []
+    waivers: List[Dict[str, Any]] = []
+    expired: List[Dict[str, Any]] = []
+    attestations: List[Dict[str, Any]] = []
+    for decision in state["decisions"]:
+        if not _matches(decision, scope):
+            continue
+        kind = decision["event_type"]
+        if kind == EventTypes.APPROVAL:
+            approvals.append(decision)
+        elif kind == EventTypes.ATTESTATION:
+            attestations.append(decision)
+        elif decision.get("details_unreadable"):
+            expired.append(decision)
+        elif decision.get("time_bound_until") is None:
+            waivers.append(decision)
+        else:
+            try:
+                lapsed = _expiry(decision["time_bound_until"]) <= now
+            except ValueError:
+                lapsed = True
+            (expired if lapsed else waivers).append(decision)
+
+    return {
+        "seq": state["seq"],
+        "scope": scope,
+        "approved": bool(approvals),
+        "approvals": approvals,
+        "waivers": waivers,
+        "expired_waivers": expired,
+        "attestations": attestations,
+        "ok": bool(approvals) and not expired,
+    }
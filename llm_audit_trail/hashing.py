@@ -0,0 +1,391 @@
+"""Content digests for datasets and other large file trees.
+
+``register_dataset`` wants a ``content_hash`` and a row count for exactly the
+snapshot that was used. :func:`hash_dataset` produces both in one streaming
+pass per file, spreads files across worker processes, and can skip files
+whose size and mtime have not changed since a previous run.
+
+For sharded datasets that are re-registered version after version,
+:func:`build_manifest` records a Merkle tree shaped like the directory tree:
+a new version only re-reads the shards that changed, and
+:func:`diff_manifests` only descends into directories whose hash differs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "hash_file",
+    "hash_dataset",
+    "combine_digests",
+    "build_manifest",
+    "diff_manifests",
+    "write_manifest",
+    "load_manifest",
+    "ROW_FORMATS",
+    "MANIFEST_FORMAT",
+]
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+MANIFEST_FORMAT = "llm-audit-manifest/1"
+
+# Extensions whose rows are counted as physical lines, and how many header
+# lines to discount. A CSV field with an embedded newline counts twice.
+ROW_FORMATS: Dict[str, int] = {
+    ".jsonl": 0,
+    ".ndjson": 0,
+    ".csv": 1,
+    ".tsv": 1,
+}
+
+
+def _row_header(path: str) -> Optional[int]:
+    return ROW_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def hash_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """SHA-256 a file through ``mmap``, counting rows for line formats.
+
+    Returns ``{"sha256": "sha256:…", "bytes": n, "rows": n or None}``.
+    """
+    header = _row_header(path)
+    digest = hashlib.sha256()
+    newlines = 0
+    last = b"\n"
+
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    for start in range(0, size, chunk_size):
+                        # hashlib reads the mapped pages in place, no copy
+                        with view[start : start + chunk_size] as chunk:
+                            digest.update(chunk)
+                        if header is not None:
+                            newlines += mm[start : start + chunk_size].count(b"\n")
+                last = mm[size - 1 : size]
+
+    rows = None
+    if header is not None:
+        lines = newlines + (0 if last == b"\n" else 1)
+        rows = max(lines - header, 0)
+    return {"sha256": "sha256:" + digest.hexdigest(), "bytes": size, "rows": rows}
+
+
+def _hash_job(job: Tuple[str, int]) -> Dict[str, Any]:
+    return hash_file(*job)
+
+
+def _walk(root: str, exclude: Iterable[str]) -> List[Tuple[str, str]]:
+    """``(relative posix path, absolute path)`` for every file, sorted."""
+    skip = {os.path.abspath(path) for path in exclude}
+    found = []
+    for directory, subdirs, names in os.walk(root):
+        subdirs.sort()
+        for name in names:
+            full = os.path.abspath(os.path.join(directory, name))
+            if full in skip:
+                continue
+            rel = os.path.relpath(full, os.path.abspath(root)).replace(os.sep, "/")
+            found.append((rel, full))
+    found.sort()
+    return found
+
+
+def _load_cache(cache_path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        return {}  # a damaged cache only costs a rehash
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_path: str, cache: Dict[str, Dict[str, Any]]) -> None:
+    tmp = cache_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, sort_keys=True)
+    os.replace(tmp, cache_path)
+
+
+def combine_digests(files: Dict[str, Dict[str, Any]]) -> str:
+    """Deterministic digest of a file tree from its per-file entries.
+
+    SHA-256 over ``path NUL bytes NUL sha256 LF`` for each file in sorted
+    path order, so renames, additions and removals all change it.
+    """
+    digest = hashlib.sha256()
+    for rel in sorted(files):
+        entry = files[rel]
+        digest.update(f"{rel}\0{entry['bytes']}\0{entry['sha256']}\n".encode("utf-8"))
+    return "sha256:" + digest.hexdigest()
+
+
+def _hash_tree(
+    path: str,
+    *,
+    workers: Optional[int],
+    chunk_size: int,
+    cache_path: Optional[str],
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """Per-file entries for ``path`` keyed by relative path, plus reuse count.
+
+    An entry is reused without reading the file when its size and
+    ``mtime_ns`` match either the absolute-path ``cache_path`` or the
+    relative-path ``previous`` entries.
+    """
+    if os.path.isdir(path):
+        listing = _walk(path, [cache_path] if cache_path else [])
+    else:
+        listing = [(os.path.basename(path), os.path.abspath(path))]
+
+    cache = _load_cache(cache_path)
+    previous = previous or {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    todo: List[Tuple[str, str, os.stat_result]] = []
+    for rel, full in listing:
+        stat = os.stat(full)
+        for known in (cache.get(full), previous.get(rel)):
+            if (
+                known is not None
+                and known.get("bytes") == stat.st_size
+                and known.get("mtime_ns") == stat.st_mtime_ns
+            ):
+                entries[rel] = {
+                    "sha256": known["sha256"],
+                    "bytes": known["bytes"],
+                    "rows": known.get("rows"),
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+                break
+        else:
+            todo.append((rel, full, stat))
+
+    jobs = [(full, chunk_size) for _, full, _ in todo]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_hash_job, jobs))
+    else:
+        results = [_hash_job(job) for job in jobs]
+
+    for (rel, full, stat), result in zip(todo, results):
+        entries[rel] = dict(result, mtime_ns=stat.st_mtime_ns)
+        cache[full] = entries[rel]
+    if cache_path and todo:
+        _save_cache(cache_path, cache)
+    return entries, len(listing) - len(todo)
+
+
+def hash_dataset(
+    path: str,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Digest a dataset file or directory for :func:`register_dataset`.
+
+    A single file's ``content_hash`` is its plain SHA-256 (what
+    ``sha256sum`` prints). A directory's is :func:`combine_digests` over
+    every file beneath it.
+
+    Args:
+        path: File or directory.
+        workers: Processes to hash files in parallel. Defaults to the CPU
+            count; ``1`` hashes in this process. Each file is one job, so a
+            single huge file is still hashed by one worker.
+        chunk_size: Bytes fed to the hash per step.
+        cache_path: JSON file remembering each file's digest keyed by its
+            absolute path, size and ``mtime_ns``. Unchanged files are not
+            read again. Created if missing; never counted as data.
+
+    Returns:
+        ``{"content_hash", "rows", "files", "bytes", "file_hashes"}`` where
+        ``rows`` is None unless at least one file is JSONL/CSV/TSV, and
+        ``file_hashes`` maps each relative path to its own entry.
+    """
+    found, _ = _hash_tree(
+        path, workers=workers, chunk_size=chunk_size, cache_path=cache_path
+    )
+    entries = {
+        rel: {k: entry[k] for k in ("sha256", "bytes", "rows")}
+        for rel, entry in found.items()
+    }
+
+    counted = [entry["rows"] for entry in entries.values() if entry["rows"] is not None]
+    if os.path.isdir(path):
+        content_hash = combine_digests(entries)
+    else:
+        content_hash = next(iter(entries.values()))["sha256"]
+    return {
+        "content_hash": content_hash,
+        "rows": sum(counted) if counted else None,
+        "files": len(entries),
+        "bytes": sum(entry["bytes"] for entry in entries.values()),
+        "file_hashes": {rel: entries[rel] for rel in sorted(entries)},
+    }
+
+
+# --------------------------------------------------------------------------
+# Merkle manifests
+# --------------------------------------------------------------------------
+
+
+def _dir_hash(entries: Dict[str, Dict[str, Any]]) -> str:
+    """Hash a directory node from its children's names, kinds and hashes."""
+    digest = hashlib.sha256(b"\x01")  # domain-separates nodes from file digests
+    for name in sorted(entries):
+        child = entries[name]
+        kind = "d" if child["type"] == "dir" else "f"
+        digest.update(f"{kind}\0{name}\0{child['hash']}\n".encode("utf-8"))
+    return "sha256:" + digest.hexdigest()
+
+
+def _build_tree(files: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    root: Dict[str, Any] = {"type": "dir", "entries": {}}
+    for rel in sorted(files):
+        *parents, name = rel.split("/")
+        node = root
+        for part in parents:
+            node = node["entries"].setdefault(part, {"type": "dir", "entries": {}})
+        entry = files[rel]
+        node["entries"][name] = {"type": "file", "hash": entry["sha256"], **entry}
+
+    def seal(node: Dict[str, Any]) -> None:
+        for child in node["entries"].values():
+            if child["type"] == "dir":
+                seal(child)
+        node["hash"] = _dir_hash(node["entries"])
+
+    seal(root)
+    return root
+
+
+def _leaves(node: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for name, child in node["entries"].items():
+        rel = prefix + name
+        if child["type"] == "dir":
+            yield from _leaves(child, rel + "/")
+        else:
+            yield rel, child
+
+
+def build_manifest(
+    path: str,
+    *,
+    previous: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Merkle manifest of a dataset directory.
+
+    Args:
+        path: Dataset directory (a single file gives a one-leaf tree).
+        previous: Manifest of the prior version. Files whose relative path,
+            size and ``mtime_ns`` match an entry there are not read again —
+            copies made with ``cp -p``/``rsync -a`` or an untouched working
+            tree both qualify.
+        workers, chunk_size: As for :func:`hash_dataset`.
+
+    Returns:
+        ``{"format", "root", "files", "bytes", "rows", "reused", "tree"}``.
+        ``root`` is the tree's top hash — record it as the dataset's
+        ``manifest_root`` (or its ``content_hash``).
+    """
+    known = dict(_leaves(previous["tree"])) if previous else None
+    files, reused = _hash_tree(
+        path, workers=workers, chunk_size=chunk_size, cache_path=None, previous=known
+    )
+    tree = _build_tree(files)
+    counted = [entry["rows"] for entry in files.values() if entry["rows"] is not None]
+    return {
+        "format": MANIFEST_FORMAT,
+        "root": tree["hash"],
+        "files": len(files),
+        "bytes": sum(entry["bytes"] for entry in files.values()),
+        "rows": sum(counted) if counted else None,
+        "reused": reused,
+        "tree": tree,
+    }
+
+
+def diff_manifests(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Shards added, removed and changed between two manifests.
+
+    Subtrees with equal hashes are skipped without being walked, so the
+    work grows with the number of changed files (and the width of the
+    directories holding them), not with the size of the dataset.
+
+    To diff two registered versions of a dataset, load the manifests the
+    ledger chained for them with
+    :func:`~llm_audit_trail.datasets.registered_manifest`.
+    """
+    added: List[str] = []
+    removed: List[str] = []
+    changed: List[str] = []
+
+    def walk(a: Optional[Dict[str, Any]], b: Optional[Dict[str, Any]], rel: str) -> None:
+        if a is not None and b is not None and a["hash"] == b["hash"]:
+            return
+        if a is None or b is None or a["type"] != b["type"]:
+            if a is not None:
+                removed.extend(_paths(a, rel))
+            if b is not None:
+                added.extend(_paths(b, rel))
+            return
+        if a["type"] == "file":
+            changed.append(rel)
+            return
+        prefix = rel + "/" if rel else ""
+        for name in sorted(set(a["entries"]) | set(b["entries"])):
+            walk(a["entries"].get(name), b["entries"].get(name), prefix + name)
+
+    walk(old["tree"], new["tree"], "")
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def _paths(node: Dict[str, Any], rel: str) -> List[str]:
+    if node["type"] == "file":
+        return [rel]
+    return sorted(
+        (rel + "/" if rel else "") + leaf for leaf, _ in _leaves(node)
+    )
+
+
+def write_manifest(manifest: Dict[str, Any], manifest_path: str) -> str:
+    """Store a manifest as JSON and return its path."""
+    parent = os.path.dirname(os.path.abspath(manifest_path))
+    os.makedirs(parent, exist_ok=True)
+    tmp = manifest_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, sort_keys=True, separators=(",", ":"))
+        fh.write("\n")
+    os.replace(tmp, manifest_path)
+    return manifest_path
+
+
+def load_manifest(manifest_path: str) -> Dict[str, Any]:
+    """Load a manifest written by :func:`write_manifest`, checking its root.
+
+    Raises:
+        ValueError: if the file is not a manifest or its tree no longer
+            hashes to its recorded ``root``.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"{manifest_path} is not a {MANIFEST_FORMAT} manifest")
+    if _build_tree(dict(_leaves(manifest["tree"])))["hash"] != manifest.get("root"):
+        raise ValueError(f"{manifest_path}: tree does not hash to its recorded root")
+    return manifest
@@ -0,0 +1,129 @@
+"""A memory-mapped sidecar holding the ledger's current chain head.
+
+With several processes appending to one ledger on one host, each append
+would otherwise re-read and parse the ledger tail to learn what the others
+wrote. Loggers created with ``shared_head=True`` also keep the head in
+``<ledger>.head`` — ``seq``, ``curr_hash``, ``timestamp`` and the ledger
+length it describes — and update it while still holding the ledger's file
+lock, so the next appender (and :func:`~llm_audit_trail.read_head`) can
+take the head from a memory read.
+
+The cell is a cache, never a source of truth: it is only believed while
+the ledger's size equals the length recorded in it, so an append by a
+process that does not maintain the cell, a recovery, or a crash between
+the ledger write and the cell update all fall back to reading the file.
+
+Layout (little-endian, 128 bytes)::
+
+    magic "LAH1" | pad | generation u64 | length u64 | seq i64 |
+    curr_hash 64 bytes ASCII | timestamp 32 bytes ASCII
+
+``generation`` is a seqlock: the writer makes it odd before changing the
+fields and even afterwards, and readers retry if it was odd or moved while
+they copied the fields.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import NamedTuple, Optional
+
+__all__ = ["HeadCell", "CellHead"]
+
+_MAGIC = b"LAH1"
+_LAYOUT = struct.Struct("<4s4xQQq64s32s")
+_GENERATION = struct.Struct("<Q")
+_GENERATION_AT = 8
+_FIELDS = struct.Struct("<Qq64s32s")
+_FIELDS_AT = 16
+_RETRIES = 16
+
+
+class CellHead(NamedTuple):
+    length: int
+    seq: int
+    hash: str
+    timestamp: str
+
+
+class HeadCell:
+    """One mapped ``<ledger>.head`` sidecar.
+
+    Args:
+        path: The sidecar file.
+        writable: Create and size the file if needed, and allow
+            :meth:`write`. Readers map it read-only.
+    """
+
+    def __init__(self, path: str, *, writable: bool = False) -> None:
+        flags = (os.O_RDWR | os.O_CREAT) if writable else os.O_RDONLY
+        fd = os.open(path, flags | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            if writable and os.fstat(fd).st_size < _LAYOUT.size:
+                os.ftruncate(fd, _LAYOUT.size)
+            elif os.fstat(fd).st_size < _LAYOUT.size:
+                raise ValueError(f"{path} is not a head cell")
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._map = mmap.mmap(fd, _LAYOUT.size, access=access)
+        finally:
+            os.close(fd)
+        if writable and self._map[:4] != _MAGIC:
+            self._map[:4] = _MAGIC
+
+    @classmethod
+    def open(cls, path: str) -> Optional["HeadCell"]:
+        """Map an existing cell read-only, or None if there is none."""
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    def read(self) -> Optional[CellHead]:
+        """A consistent snapshot of the head, or None if unset or contended."""
+        view = self._map
+        if view[:4] != _MAGIC:
+            return None
+        for _ in range(_RETRIES):
+            (before,) = _GENERATION.unpack_from(view, _GENERATION_AT)
+            if before & 1:
+                continue  # a writer is mid-update
+            length, seq, digest, timestamp = _FIELDS.unpack_from(view, _FIELDS_AT)
+            (after,) = _GENERATION.unpack_from(view, _GENERATION_AT)
+            if before != after:
+                continue
+            if before == 0:
+                return None  # never written
+            return CellHead(
+                length,
+                seq,
+                digest.rstrip(b"\0").decode("ascii"),
+                timestamp.rstrip(b"\0").decode("ascii"),
+            )
+        return None
+
+    def write(self, length: int, seq: int, digest: str, timestamp: str) -> None:
+        """Publish a new head. Callers serialise writes (the ledger lock)."""
+        view = self._map
+        (generation,) = _GENERATION.unpack_from(view, _GENERATION_AT)
+        generation += generation & 1  # recover from a writer that died mid-update
+        _GENERATION.pack_into(view, _GENERATION_AT, generation + 1)
+        _FIELDS.pack_into(
+            view,
+            _FIELDS_AT,
+            length,
+            seq,
+            digest.encode("ascii"),
+            timestamp.encode("ascii"),
+        )
+        _GENERATION.pack_into(view, _GENERATION_AT, generation + 2)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "HeadCell":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -2,21 +2,77 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
 
 from transformers import TrainerCallback
+from transformers.trainer_utils import PREFIX_CHECKPOINT_DIR
 
 from .core import AuditLogger
+from .hashing import hash_dataset
+from .registry import EventTypes
+from .telemetry import StepTelemetry
 
 __all__ = ["AuditTrailCallback", "hf_audit_callback"]
 
 
+def _distributed() -> Any:
+    """``torch.distributed`` if a process group is up, else None."""
+    try:
+        import torch.distributed as dist
+    except ImportError:
+        return None
+    if dist.is_available() and dist.is_initialized():
+        return dist
+    return None
+
+
+def _rank_and_world() -> Tuple[int, int]:
+    dist = _distributed()
+    if dist is not None:
+        return dist.get_rank(), dist.get_world_size()
+    # launchers (torchrun, accelerate, deepspeed) export these before init
+    for rank_var, world_var in (("RANK", "WORLD_SIZE"), ("SLURM_PROCID", "SLURM_NTASKS")):
+        if rank_var in os.environ:
+            return int(os.environ[rank_var]), int(os.environ.get(world_var, "1"))
+    return 0, 1
+
+
 class AuditTrailCallback(TrainerCallback):
     """Records the training lifecycle to an audit ledger.
 
-    Emits ``FineTuneStart``, ``EpochEnd``, ``Evaluation``, ``Checkpoint`` and
-    ``FineTuneEnd``. Metric values that arrive as numpy scalars are
-    normalised during serialisation.
+    Emits ``FineTuneStart``, ``EpochEnd``, ``Evaluation``, ``Checkpoint``,
+    ``CheckpointHashed`` and ``FineTuneEnd``. Metric values that arrive as
+    numpy scalars are normalised during serialisation.
+
+    In distributed training every rank runs the callback, but only the world
+    main process writes, so a 64-GPU job appends each event once instead of
+    64 processes contending for the ledger's lock.
+
+    Args:
+        logger: Where events are written.
+        model_id: Stamped on every event.
+        dataset_id: Stamped on every event.
+        main_process_only: Write from world rank 0 only. Turn off only if
+            each rank has its own ledger.
+        aggregate_ranks: At each epoch end, gather every rank's step count,
+            step times and throughput to rank 0 and record them as one
+            ``RankSummary`` event. Uses a ``torch.distributed`` collective,
+            so every rank must have the callback installed.
+        hash_checkpoints: Hash each saved checkpoint (and the best model
+            checkpoint at the end of training) on a background thread and
+            record a ``CheckpointHashed`` event citing the ``Checkpoint`` or
+            ``FineTuneEnd`` event it belongs to. Training does not wait for
+            it; call :meth:`wait_for_hashes` before exiting early. Off by
+            default, since it reads every checkpoint back from disk.
+        telemetry_every_steps: Summarise the ``Trainer``'s per-step logs
+            (min/max/mean/last of each metric, step-time percentiles,
+            tokens per second) into one ``StepSummary`` event every this
+            many steps. Off by default.
+        telemetry_every_seconds: Same, closing a window after this many
+            seconds. With both set, whichever comes first wins.
     """
 
     def __init__(
@@ -24,13 +80,36 @@ class AuditTrailCallback(TrainerCallback):
         logger: AuditLogger,
         model_id: Optional[str] = None,
         dataset_id: Optional[str] = None,
+        main_process_only: bool = True,
+        aggregate_ranks: bool = False,
+        hash_checkpoints: bool = False,
+        telemetry_every_steps: Optional[int] = None,
+        telemetry_every_seconds: Optional[float] = None,
     ) -> None:
         self.log = logger
         self.model_id = model_id
         self.dataset_id = dataset_id
+        self.main_process_only = main_process_only
+        self.aggregate_ranks = aggregate_ranks
+        self._step_started: Optional[float] = None
+        self._step_times: List[float] = []
+        self.hash_checkpoints = hash_checkpoints
+        self._hasher: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._telemetry: Optional[StepTelemetry] = None
+        if telemetry_every_steps is not None or telemetry_every_seconds is not None:
+            self._telemetry = StepTelemetry(telemetry_every_steps, telemetry_every_seconds)
 
-    def _emit(self, event_type: str, details: dict) -> None:
-        self.log.emit(
+    def _is_main(self, state) -> bool:
+        flag = getattr(state, "is_world_process_zero", None)
+        if isinstance(flag, bool):
+            return flag
+        return _rank_and_world()[0] == 0
+
+    def _emit(self, event_type: str, details: dict, state=None) -> Optional[dict]:
+        if self.main_process_only and not self._is_main(state):
+            return None
+        return self.log.emit(
             event_type,
             details=details,
             model_id=self.model_id,
@@ -39,6 +118,11 @@ class AuditTrailCallback(TrainerCallback):
         )
 
     def on_train_begin(self, args, state, control, **kwargs):
+        if self._telemetry is not None:
+            self._telemetry.start(
+                getattr(state, "global_step", 0) or 0,
+                getattr(state, "num_input_tokens_seen", None),
+            )
         self._emit(
             "FineTuneStart",
             {
@@ -54,7 +138,9 @@ class AuditTrailCallback(TrainerCallback):
                 "output_dir": getattr(args, "output_dir", None),
                 "fp16": getattr(args, "fp16", False),
                 "bf16": getattr(args, "bf16", False),
+                "world_size": _rank_and_world()[1],
             },
+            state,
         )
 
     def on_epoch_end(self, args, state, control, **kwargs):
@@ -69,31 +155,182 @@ class AuditTrailCallback(TrainerCallback):
                 "learning_rate": latest.get("learning_rate"),
                 "loss": latest.get("loss"),
             },
+            state,
         )
+        if self.aggregate_ranks:
+            self._emit_rank_summary(state)
 
     def on_evaluate(self, args, state, control, metrics=None, **kwargs):
         epoch = getattr(state, "epoch", None)
         details = {"epoch": float(epoch) if epoch is not None else None}
         details.update(metrics or {})
-        self._emit("Evaluation", details)
+        self._emit("Evaluation", details, state)
 
     def on_save(self, args, state, control, **kwargs):
-        self._emit(
+        global_step = getattr(state, "global_step", None)
+        output_dir = getattr(args, "output_dir", None)
+        event = self._emit(
             "Checkpoint",
+            {"global_step": global_step, "output_dir": output_dir},
+            state,
+        )
+        if event is not None and output_dir is not None:
+            checkpoint = os.path.join(output_dir, f"{PREFIX_CHECKPOINT_DIR}-{global_step}")
+            self._hash_later(checkpoint, event)
+
+    def on_train_end(self, args, state, control, **kwargs):
+        if self._telemetry is not None:
+            self._emit_step_summary(self._telemetry.flush(), state)
+        best = getattr(state, "best_model_checkpoint", None)
+        event = self._emit(
+            "FineTuneEnd",
             {
                 "global_step": getattr(state, "global_step", None),
-                "output_dir": getattr(args, "output_dir", None),
+                "best_metric": getattr(state, "best_metric", None),
+                "best_model_checkpoint": best,
             },
+            state,
         )
+        if event is not None and best:
+            self._hash_later(best, event)
 
-    def on_train_end(self, args, state, control, **kwargs):
+    # ---- background checkpoint hashing ------------------------------------
+
+    def _hash_later(self, checkpoint: str, cited: dict) -> None:
+        if not self.hash_checkpoints:
+            return
+        if self._hasher is None:
+            # one thread: checkpoints hash in save order, and hashlib releases
+            # the GIL on large buffers so the training loop keeps running
+            self._hasher = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="audit-checkpoint-hash"
+            )
+        # finished hashes are dropped, failed ones kept for wait_for_hashes
+        self._pending = [f for f in self._pending if not f.done() or f.exception()]
+        self._pending.append(self._hasher.submit(self._hash_checkpoint, checkpoint, cited))
+
+    def _hash_checkpoint(self, checkpoint: str, cited: dict) -> None:
+        details: Dict[str, Any] = {
+            "checkpoint_event_id": cited["event_id"],
+            "checkpoint_event_type": cited["event_type"],
+            "path": checkpoint,
+        }
+        started = time.perf_counter()
+        try:
+            digest = hash_dataset(checkpoint, workers=1)
+        except OSError as exc:
+            # e.g. rotated away by save_total_limit before we reached it
+            details["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            details.update(
+                content_hash=digest["content_hash"],
+                files=digest["files"],
+                bytes=digest["bytes"],
+                file_hashes={
+                    rel: entry["sha256"] for rel, entry in digest["file_hashes"].items()
+                },
+            )
+        details["hash_seconds"] = round(time.perf_counter() - started, 3)
+        self.log.emit(
+            EventTypes.CHECKPOINT_HASHED,
+            details=details,
+            model_id=self.model_id,
+            dataset_id=self.dataset_id,
+            system="hf_trainer",
+        )
+
+    def wait_for_hashes(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued checkpoint hashes are recorded.
+
+        Returns False if ``timeout`` seconds passed first. Pending hashes are
+        also completed at interpreter exit.
+
+        Raises:
+            Exception: the error of a hash that could not be recorded (the
+                ledger append failed, say). An unreadable checkpoint is not
+                an error: it is recorded with an ``error`` detail.
+        """
+        done, not_done = wait(self._pending, timeout=timeout)
+        self._pending = list(not_done)
+        for future in done:
+            future.result()
+        return not not_done
+
+    # ---- step telemetry -----------------------------------------------------
+
+    def on_log(self, args, state, control, logs=None, **kwargs):
+        if self._telemetry is None:
+            return
+        if self.main_process_only and not self._is_main(state):
+            return
+        summary = self._telemetry.observe(
+            getattr(state, "global_step", 0) or 0,
+            logs,
+            getattr(state, "num_input_tokens_seen", None),
+        )
+        self._emit_step_summary(summary, state)
+
+    def _emit_step_summary(self, summary: Optional[Dict[str, Any]], state) -> None:
+        if summary is not None:
+            self._emit(EventTypes.STEP_SUMMARY, summary, state)
+
+    # ---- per-rank step timing ---------------------------------------------
+
+    def on_step_begin(self, args, state, control, **kwargs):
+        if self.aggregate_ranks or self._telemetry is not None:
+            self._step_started = time.perf_counter()
+
+    def on_step_end(self, args, state, control, **kwargs):
+        if self._step_started is None:
+            return
+        elapsed = time.perf_counter() - self._step_started
+        self._step_started = None
+        if self.aggregate_ranks:
+            self._step_times.append(elapsed)
+        if self._telemetry is not None and (
+            not self.main_process_only or self._is_main(state)
+        ):
+            self._telemetry.add_step_time(elapsed)
+
+    def _local_summary(self) -> Dict[str, Any]:
+        rank, _ = _rank_and_world()
+        times = self._step_times
+        total = sum(times)
+        return {
+            "rank": rank,
+            "steps": len(times),
+            "mean_step_seconds": total / len(times) if times else None,
+            "max_step_seconds": max(times) if times else None,
+            "steps_per_second": len(times) / total if total else None,
+        }
+
+    def _emit_rank_summary(self, state) -> None:
+        local = self._local_summary()
+        self._step_times = []
+        dist = _distributed()
+        if dist is not None:
+            # collective: every rank must reach this call
+            gathered: List[Optional[Dict[str, Any]]] = [None] * dist.get_world_size()
+            dist.all_gather_object(gathered, local)
+            ranks = [summary for summary in gathered if summary is not None]
+        else:
+            ranks = [local]
+        slowest = max(
+            (r for r in ranks if r["mean_step_seconds"] is not None),
+            key=lambda r: r["mean_step_seconds"],
+            default=None,
+        )
+        epoch = getattr(state, "epoch", None)
         self._emit(
-            "FineTuneEnd",
+            EventTypes.RANK_SUMMARY,
             {
+                "epoch": float(epoch) if epoch is not None else None,
                 "global_step": getattr(state, "global_step", None),
-                "best_metric": getattr(state, "best_metric", None),
-                "best_model_checkpoint": getattr(state, "best_model_checkpoint", None),
+                "world_size": len(ranks),
+                "slowest_rank": slowest["rank"] if slowest else None,
+                "ranks": ranks,
             },
+            state,
         )
 
 
@@ -101,10 +338,20 @@ def hf_audit_callback(
     model_id: Optional[str] = None,
     dataset_id: Optional[str] = None,
     logger: Optional[AuditLogger] = None,
+    main_process_only: bool = True,
+    aggregate_ranks: bool = False,
+    hash_checkpoints: bool = False,
+    telemetry_every_steps: Optional[int] = None,
+    telemetry_every_seconds: Optional[float] = None,
 ) -> AuditTrailCallback:
     """Build a callback ready to pass to ``Trainer(callbacks=[...])``."""
     return AuditTrailCallback(
         logger=logger or AuditLogger(),
         model_id=model_id,
         dataset_id=dataset_id,
+        main_process_only=main_process_only,
+        aggregate_ranks=aggregate_ranks,
+        hash_checkpoints=hash_checkpoints,
+        telemetry_every_steps=telemetry_every_steps,
+        telemetry_every_seconds=telemetry_every_seconds,
     )
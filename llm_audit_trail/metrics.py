@@ -0,0 +1,153 @@
+"""In-process metrics for the ledger writer.
+
+Everything here is plain counters and fixed-bucket histograms updated under
+one short lock per append, so it stays on in production: the cost is a few
+``perf_counter`` calls next to a file lock and a write.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+__all__ = ["Histogram", "WriterMetrics", "PHASES", "render_prometheus"]
+
+# Phases of one locked append, in the order they happen.
+PHASES = ("lock_wait", "tail_read", "serialise", "hash", "write", "fsync")
+
+# 1 µs to ~16 s, doubling. Ledger phases span sub-microsecond hashing to
+# multi-second fsyncs on a contended network filesystem.
+_BUCKETS: Tuple[float, ...] = tuple(1e-6 * 2**i for i in range(25))
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, in seconds."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Tuple[float, ...] = _BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative: List[Tuple[float, int]] = []
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            cumulative.append((bound, seen))
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+class WriterMetrics:
+    """Per-logger hot-path timings and throughput counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.phases: Dict[str, Histogram] = {name: Histogram() for name in PHASES}
+        self.events = 0
+        self.bytes = 0
+        self.appends = 0
+        self.errors = 0
+
+    def record_append(self, timings: Dict[str, float], events: int, nbytes: int) -> None:
+        with self._lock:
+            for name, seconds in timings.items():
+                self.phases[name].observe(seconds)
+            self.appends += 1
+            self.events += events
+            self.bytes += nbytes
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self, queue_depth: int = 0) -> Dict[str, Any]:
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            return {
+                "events": self.events,
+                "bytes": self.bytes,
+                "appends": self.appends,
+                "errors": self.errors,
+                "queue_depth": queue_depth,
+                "uptime_seconds": uptime,
+                "events_per_second": self.events / uptime if uptime > 0 else 0.0,
+                "phases": {
+                    name: histogram.snapshot() for name, histogram in self.phases.items()
+                },
+            }
+
+
+def _labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + body + "}" if body else ""
+
+
+def render_prometheus(
+    snapshot: Dict[str, Any], *, prefix: str = "llm_audit", ledger: Optional[str] = None
+) -> str:
+    """Render a :meth:`AuditLogger.metrics` snapshot in Prometheus text format."""
+    base = [("ledger", ledger)] if ledger else []
+    out: List[str] = []
+
+    for name, key, help_text in (
+        ("events_total", "events", "Events appended by this process."),
+        ("bytes_total", "bytes", "Ledger bytes written by this process."),
+        ("appends_total", "appends", "Locked append cycles (one per batch)."),
+        ("errors_total", "errors", "Append cycles that raised."),
+    ):
+        out.append(f"# HELP {prefix}_{name} {help_text}")
+        out.append(f"# TYPE {prefix}_{name} counter")
+        out.append(f"{prefix}_{name}{_labels(base)} {snapshot[key]}")
+
+    out.append(f"# HELP {prefix}_queue_depth Submitted events not yet resolved.")
+    out.append(f"# TYPE {prefix}_queue_depth gauge")
+    out.append(f"{prefix}_queue_depth{_labels(base)} {snapshot['queue_depth']}")
+
+    metric = f"{prefix}_append_phase_seconds"
+    out.append(f"# HELP {metric} Time spent in each phase of a locked append.")
+    out.append(f"# TYPE {metric} histogram")
+    for phase, hist in snapshot["phases"].items():
+        labels = base + [("phase", phase)]
+        for bound, count in hist["buckets"]:
+            out.append(f"{metric}_bucket{_labels(labels + [('le', repr(bound))])} {count}")
+        out.append(f"{metric}_bucket{_labels(labels + [('le', '+Inf')])} {hist['count']}")
+        out.append(f"{metric}_sum{_labels(labels)} {hist['sum']}")
+        out.append(f"{metric}_count{_labels(labels)} {hist['count']}")
+
+    return "\n".join(out) + "\n"
@@ -6,11 +6,13 @@ human to retype them, which is where typos silently fragment a ledger.
 
 from __future__ import annotations
 
-import json
 import os
 from collections import deque
 from typing import Any, Dict, List
 
+from ..events import Event
+from ..storage import SQLiteStorage, is_sqlite_ledger
+
 __all__ = ["ScopeProvider", "JSONLLocalProvider", "load_scope_providers"]
 
 _EMPTY: Dict[str, List[str]] = {"models": [], "datasets": [], "deployments": []}
@@ -24,7 +26,10 @@ class ScopeProvider:
 
 
 class JSONLLocalProvider(ScopeProvider):
-    """Reads identifiers from the tail of a local JSONL ledger."""
+    """Reads identifiers from the tail of a local JSONL ledger.
+
+    A SQLite ledger answers from its indexed scope columns instead.
+    """
 
     def __init__(self, path: str, limit: int = 100) -> None:
         self.path = path
@@ -45,7 +50,20 @@ class JSONLLocalProvider(ScopeProvider):
             "deployment_id": "deployments",
         }
 
-        with open(self.path, "r", encoding="utf-8") as fh:
+        if is_sqlite_ledger(self.path):
+            # the scope ids are indexed columns: no line is decoded at all
+            storage = SQLiteStorage(self.path)
+            try:
+                rows = storage.recent_scopes(self.limit)
+            finally:
+                storage.close()
+            for row in rows:
+                for bucket, value in zip(key_for.values(), row):
+                    if value:
+                        found[bucket].add(value)
+            return {bucket: sorted(values) for bucket, values in found.items()}
+
+        with open(self.path, "rb") as fh:
             # deque keeps memory flat regardless of ledger size.
             tail = deque(fh, maxlen=self.limit)
 
@@ -54,11 +72,10 @@ class JSONLLocalProvider(ScopeProvider):
             if not line:
                 continue
             try:
-                record = json.loads(line)
+                # only the scope ids are read, so details stay undecoded
+                record = Event.from_line(line)
             except ValueError:
                 continue
-            if not isinstance(record, dict):
-                continue
             for field, bucket in key_for.items():
                 value = record.get(field)
                 if value:
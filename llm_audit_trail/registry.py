@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any, Dict, List
 
 __all__ = ["EventTypes", "SCHEMA_FILES", "load_schema", "available_schemas"]
@@ -30,11 +31,17 @@ class EventTypes:
     EPOCH_END = "EpochEnd"
     EVALUATION = "Evaluation"
     CHECKPOINT = "Checkpoint"
+    CHECKPOINT_HASHED = "CheckpointHashed"
+    RANK_SUMMARY = "RankSummary"
+    STEP_SUMMARY = "StepSummary"
 
     # serving
     INFERENCE_REQUEST = "InferenceRequest"
     INFERENCE_RESPONSE = "InferenceResponse"
 
+    # ledger maintenance
+    RECOVERY_PERFORMED = "RecoveryPerformed"
+
 
 SCHEMA_FILES: Dict[str, str] = {
     EventTypes.APPROVAL: "approval.schema.json",
@@ -62,7 +69,12 @@ def load_schema(event_type: str) -> Dict[str, Any]:
             f"no bundled schema for {event_type!r}; have {available_schemas()}"
         ) from None
 
+    # parsed per call so callers may mutate their copy; the read is cached
+    return json.loads(_schema_text(filename))
+
+
+@lru_cache(maxsize=None)
+def _schema_text(filename: str) -> str:
     from importlib.resources import files
 
-    resource = files(__package__).joinpath("schemas", filename)
-    return json.loads(resource.read_text(encoding="utf-8"))
+    return files(__package__).joinpath("schemas", filename).read_text(encoding="utf-8")
@@ -0,0 +1,293 @@
+"""Incremental, verified replication of a ledger to a mirror directory.
+
+A periodic full copy is slow and copies a tampered ledger as faithfully as
+a good one. :func:`replicate` instead keeps ``<dir>/<name>`` as an exact
+copy of the ledger's committed prefix, next to a state file
+(``<dir>/<name>.replica.json``) recording how many bytes were copied and
+the ``seq`` and hash of the last event among them. Each run:
+
+* refuses if the ledger no longer continues the replicated prefix — it was
+  truncated, or the last replicated event was rewritten (``full_check=True``
+  also compares every replicated byte against the mirror);
+* reads only the bytes appended since, checking each new event's link and
+  digest as :func:`~llm_audit_trail.verify_log` would;
+* appends the events that verified to the mirror, fsyncs it and only then
+  advances the state, so an interrupted run is repeated rather than
+  half-applied.
+
+The cost of a run is proportional to what was appended. The mirror is
+itself a ledger: ``verify_log`` and every reader accept it. JSONL and
+binary ledgers are supported; SQLite ledgers are copied with
+:func:`~llm_audit_trail.convert_ledger` or SQLite's own backup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .binary import MAGIC, _last_record, _Records, encode_record, is_binary_ledger
+from .core import (
+    GENESIS,
+    _ChainVerifier,
+    _file_lock,
+    _open_ledger,
+    _parse_record,
+    _read_last_line,
+    _resolve_key,
+    _write_lines,
+)
+from .storage import is_sqlite_ledger
+
+__all__ = ["replicate", "STATE_FORMAT"]
+
+STATE_FORMAT = "llm-audit-replica/1"
+
+_CHUNK = 1 << 20
+_BATCH = 1024  # lines gathered per mirror write
+
+
+def replicate(
+    path: str,
+    mirror_dir: str,
+    *,
+    key: Union[str, bytes, None] = None,
+    full_check: bool = False,
+) -> Tuple[bool, Dict[str, Any]]:
+    """Bring the mirror of ``path`` in ``mirror_dir`` up to date.
+
+    Args:
+        path: Ledger to replicate (JSONL or binary).
+        mirror_dir: Directory holding the mirror and its state file.
+            Created if missing.
+        key: HMAC secret for verifying new events. Defaults to
+            ``$AUDIT_HMAC_KEY``.
+        full_check: Also compare the whole replicated prefix with the
+            mirror, byte for byte, instead of only its last event.
+
+    Returns:
+        ``(ok, report)``. ``report`` holds ``events`` and ``bytes`` copied
+        by this run, the replicated ``offset``, the mirror's ``head`` and
+        the ``mirror`` path. On failure it also carries ``error`` and
+        ``detail``: ``prefix_changed`` or ``mirror_mismatch`` when nothing
+        was copied, or the report of the first new event that failed
+        verification (the events before it were copied).
+    """
+    if is_sqlite_ledger(path):
+        raise ValueError(
+            f"{path}: replicate copies JSONL and binary ledgers; back up SQLite "
+            f"ledgers with `llm-audit convert` or SQLite's backup API"
+        )
+    binary = is_binary_ledger(path)
+    os.makedirs(mirror_dir, exist_ok=True)
+    mirror_path = os.path.join(mirror_dir, os.path.basename(path))
+    state_path = mirror_path + ".replica.json"
+    source = os.path.abspath(path)
+
+    try:
+        with open(path, "rb") as src, _open_ledger(mirror_path) as mirror, _file_lock(mirror):
+            state = _load_state(state_path)
+            report = {"mirror": mirror_path, "events": 0, "bytes": 0}
+            fresh = state is None
+            if fresh:
+                if not _is_blank(mirror, binary):
+                    return False, dict(
+                        report,
+                        error="mirror_mismatch",
+                        detail=f"{mirror_path} exists but has no replication state; "
+                        f"refusing to overwrite it",
+                    )
+                state = _empty_state(source, binary)
+                if binary:
+                    mirror.truncate(0)
+                    _write_lines(mirror, [MAGIC])
+            elif state.get("source") != source:
+                return False, dict(
+                    report,
+                    error="mirror_mismatch",
+                    detail=f"{mirror_path} mirrors {state.get('source')}, not {source}",
+                )
+
+            problem = _check_prefix(src, mirror, state, binary, full_check)
+            if problem is not None:
+                return False, dict(report, offset=state["offset"], **problem)
+            # bytes past the recorded offset are from a run that did not finish
+            mirror.truncate(state["offset"])
+
+            verifier = _ChainVerifier(_resolve_key(key))
+            verifier.prev_hash = state["hash"] or GENESIS
+            verifier.prev_seq = state["seq"]
+            start = state["offset"]
+            ship = _ship_records if binary else _ship_lines
+            error = ship(src, mirror, state, verifier)
+
+            copied = state["offset"] - start
+            if copied or fresh:
+                # a new mirror gets its state even with nothing copied yet, or
+                # the next run would take it for somebody else's file
+                os.fsync(mirror.fileno())
+                if copied:
+                    state["hash"] = verifier.prev_hash
+                    state["seq"] = verifier.prev_seq
+                _save_state(state, state_path)
+    except OSError as exc:
+        return False, {"error": "unreadable", "path": path, "detail": str(exc)}
+
+    report.update(
+        events=verifier.count,
+        bytes=copied,
+        offset=state["offset"],
+        head={"seq": state["seq"], "hash": state["hash"]} if state["hash"] else None,
+    )
+    if error is not None:
+        return False, dict(report, **error)
+    return True, report
+
+
+def _empty_state(source: str, binary: bool) -> Dict[str, Any]:
+    return {
+        "format": STATE_FORMAT,
+        "source": source,
+        "offset": len(MAGIC) if binary else 0,  # bytes replicated so far
+        "lines": 0,
+        "seq": None,
+        "hash": None,
+    }
+
+
+def _is_blank(mirror: Any, binary: bool) -> bool:
+    """Whether a mirror without state holds nothing that could be lost."""
+    size = os.fstat(mirror.fileno()).st_size
+    if binary and size == len(MAGIC):
+        mirror.seek(0)
+        return mirror.read(size) == MAGIC
+    return size == 0
+
+
+def _load_state(state_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(state_path, "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        state = None
+    if not isinstance(state, dict) or state.get("format") != STATE_FORMAT:
+        # an unreadable state must not restart replication over the mirror
+        raise OSError(f"{state_path}: not a replication state file")
+    return state
+
+
+def _save_state(state: Dict[str, Any], state_path: str) -> None:
+    tmp = f"{state_path}.tmp-{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+    os.replace(tmp, state_path)
+
+
+def _check_prefix(
+    src: Any, mirror: Any, state: Dict[str, Any], binary: bool, full_check: bool
+) -> Optional[Dict[str, Any]]:
+    """Why the ledger no longer continues the replicated prefix, if it does not."""
+    offset = state["offset"]
+    if os.fstat(mirror.fileno()).st_size < offset:
+        return {
+            "error": "mirror_mismatch",
+            "detail": "the mirror is shorter than the replicated offset; it was "
+            "truncated or replaced",
+        }
+    if os.fstat(src.fileno()).st_size < offset:
+        return {
+            "error": "prefix_changed",
+            "detail": "the ledger is shorter than what was already replicated; "
+            "it was truncated",
+        }
+    if state["hash"] is not None:
+        if binary:
+            record, intact = _last_record(src, offset)
+            found = record.curr_hash if intact and record is not None else None
+        else:
+            src.seek(offset - 1)
+            record = None
+            if src.read(1) == b"\n":
+                record = _parse_record(_read_last_line(src, offset) or b"")
+            found = record["curr_hash"] if record is not None else None
+        if found != state["hash"]:
+            return {
+                "error": "prefix_changed",
+                "seq": state["seq"],
+                "expected": state["hash"],
+                "found": found,
+                "detail": "the last replicated event is no longer where it was; "
+                "the ledger was rewritten",
+            }
+    elif binary and offset:
+        src.seek(0)
+        if src.read(len(MAGIC)) not in (MAGIC, b""):
+            return {"error": "prefix_changed", "detail": "not a binary ledger"}
+    if full_check:
+        src.seek(0)
+        mirror.seek(0)
+        done = 0
+        while done < offset:
+            want = min(_CHUNK, offset - done)
+            a, b = src.read(want), mirror.read(want)
+            if a != b:
+                first = next(
+                    (i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b))
+                )
+                return {
+                    "error": "prefix_changed",
+                    "at_byte": done + first,
+                    "detail": "the replicated prefix differs from the mirror",
+                }
+            done += want
+    return None
+
+
+def _ship_lines(
+    src: Any, mirror: Any, state: Dict[str, Any], verifier: _ChainVerifier
+) -> Optional[Dict[str, Any]]:
+    """Copy verified, newline-terminated lines after ``state["offset"]``."""
+    src.seek(state["offset"])
+    batch: List[bytes] = []
+    error = None
+    for raw in src:
+        if not raw.endswith(b"\n"):
+            break  # not committed yet; the next run picks it up
+        line = raw.strip()
+        if line:
+            error = verifier.feed(state["lines"] + 1, line)
+            if error is not None:
+                break
+        batch.append(raw)
+        state["lines"] += 1
+        state["offset"] += len(raw)
+        if len(batch) >= _BATCH:
+            _write_lines(mirror, batch)
+            batch = []
+    _write_lines(mirror, batch)
+    return error
+
+
+def _ship_records(
+    src: Any, mirror: Any, state: Dict[str, Any], verifier: _ChainVerifier
+) -> Optional[Dict[str, Any]]:
+    """:func:`_ship_lines` for a binary ledger: copy verified records."""
+    batch: List[bytes] = []
+    error = None
+    for pos, record in _Records(src, start=state["offset"]):
+        error = verifier.feed(pos, record)
+        if error is not None:
+            break
+        framed = encode_record(record.body, record.curr_hash)
+        batch.append(framed)
+        state["lines"] += 1
+        state["offset"] += len(framed)
+        if len(batch) >= _BATCH:
+            _write_lines(mirror, batch)
+            batch = []
+    _write_lines(mirror, batch)
+    return error
@@ -0,0 +1,427 @@
+"""Storage backends for the ledger.
+
+The chain is defined over canonical event lines (see ``core._stable_json``),
+not over a file format, so the same events can live anywhere that keeps
+those bytes in order. The default backend is the append-only JSONL file
+implemented in :mod:`llm_audit_trail.core`. :class:`SQLiteStorage` keeps the
+identical canonical bytes in a SQLite database in WAL mode, next to indexed
+``seq``, ``timestamp``, ``event_type`` and scope columns, so head lookups,
+time windows and ``where`` filters on those fields are index reads instead
+of file scans.
+
+A ledger path names a SQLite ledger when it ends in ``.db``, ``.sqlite`` or
+``.sqlite3``, or when the file already starts with the SQLite header; every
+API that takes a ledger path (:class:`~llm_audit_trail.AuditLogger`,
+:func:`~llm_audit_trail.iter_events`, :func:`~llm_audit_trail.read_head`,
+:func:`~llm_audit_trail.verify_log`, :func:`~llm_audit_trail.write_anchor`)
+then uses it. The indexed columns are derived from the stored line and are
+not covered by the chain; verification checks the lines.
+
+:class:`~llm_audit_trail.binary.BinaryStorage` (paths ending in ``.alog``)
+stores the same events as compact binary records instead of JSON lines.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+__all__ = [
+    "LedgerStorage",
+    "SQLiteStorage",
+    "open_storage",
+    "is_sqlite_ledger",
+    "is_jsonl_ledger",
+    "convert_ledger",
+]
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# (events, canonical lines without newlines) for a given head
+Builder = Callable[[Optional[Dict[str, Any]]], Tuple[List[Dict[str, Any]], List[bytes]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    pos INTEGER PRIMARY KEY,
+    seq INTEGER,
+    timestamp TEXT,
+    event_type TEXT,
+    model_id TEXT,
+    dataset_id TEXT,
+    deployment_id TEXT,
+    curr_hash TEXT NOT NULL,
+    line BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_seq ON events (seq);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS events_event_type ON events (event_type);
+CREATE INDEX IF NOT EXISTS events_model_id ON events (model_id);
+CREATE INDEX IF NOT EXISTS events_dataset_id ON events (dataset_id);
+CREATE INDEX IF NOT EXISTS events_deployment_id ON events (deployment_id);
+"""
+_COLUMNS = ("seq", "timestamp", "event_type", "model_id", "dataset_id", "deployment_id")
+# columns a ``match`` can be answered from: each has its own index
+_MATCHABLE = ("seq", "event_type", "model_id", "dataset_id", "deployment_id")
+
+
+class LedgerStorage:
+    """What a non-file backend provides.
+
+    Lines are canonical event JSON as bytes, without a trailing newline,
+    in chain order; a ``binary`` backend yields
+    :class:`~llm_audit_trail.binary.BinaryRecord` objects instead.
+    """
+
+    binary = False
+
+    def head(self) -> Optional[Dict[str, Any]]:
+        """``{"seq", "hash", "timestamp"}`` of the last event, or None."""
+        raise NotImplementedError
+
+    def lines(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        match: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Tuple[int, bytes]]:
+        """``(position, line)`` pairs, optionally within a timestamp window.
+
+        ``match`` maps top-level fields to required values. It is a hint: a
+        backend may use it to skip lines, but callers still check each
+        event they decode.
+        """
+        raise NotImplementedError
+
+    def extent(self) -> Tuple[int, int]:
+        """``[low, high)`` range of positions, for sampling."""
+        raise NotImplementedError
+
+    def line_from(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        """The first line at or after ``pos``."""
+        raise NotImplementedError
+
+    def line_before(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        """The last line before ``pos``."""
+        raise NotImplementedError
+
+    def line_with_seq(self, seq: int) -> Optional[Tuple[int, bytes]]:
+        """The first line whose event carries ``seq``."""
+        raise NotImplementedError
+
+    def append(
+        self,
+        build: Builder,
+        durability: str,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Atomically read the last event, build new ones on it and store them.
+
+        ``build`` receives the last stored event (or None) and returns the
+        chained events and their canonical lines. The seconds spent storing
+        them go into ``timings["write"]``, and those spent making them
+        durable (for any ``durability`` but ``"written"``) into
+        ``timings["fsync"]``.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+def is_sqlite_ledger(path: str) -> bool:
+    if path.lower().endswith(SQLITE_SUFFIXES):
+        return True
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+    except OSError:
+        return False
+
+
+def is_jsonl_ledger(path: str) -> bool:
+    """Whether ``path`` names a ledger in the default JSONL format."""
+    from .binary import is_binary_ledger
+
+    return not is_sqlite_ledger(path) and not is_binary_ledger(path)
+
+
+def open_storage(path: str, *, create: bool = False) -> Optional[LedgerStorage]:
+    """The backend for ``path``, or None for the default JSONL file."""
+    from .binary import BinaryStorage, is_binary_ledger
+
+    if is_binary_ledger(path):
+        return BinaryStorage(path, create=create)
+    if not is_sqlite_ledger(path):
+        return None
+    return SQLiteStorage(path, create=create)
+
+
+class SQLiteStorage(LedgerStorage):
+    """Ledger lines in a SQLite database (WAL mode).
+
+    Appends run in ``BEGIN IMMEDIATE`` transactions, so the read-head /
+    insert cycle is serialised across threads and processes by SQLite's
+    own write lock rather than a whole-file lock.
+
+    Args:
+        path: Database file.
+        create: Create the database and schema if missing. Otherwise the
+            database is opened read-only; a missing file raises
+            FileNotFoundError and a database without a ledger table raises
+            :class:`sqlite3.Error`.
+
+    :meth:`close` releases the connection; the storage reconnects if it is
+    used again.
+    """
+
+    def __init__(self, path: str, *, create: bool = False) -> None:
+        self.path = path
+        self.create = create
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.create:
+            db = sqlite3.connect(
+                self.path, timeout=60, isolation_level=None, check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            return db
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"no such ledger: {self.path}")
+        uri = "file:" + os.path.abspath(self.path).replace("?", "%3f") + "?mode=ro"
+        db = sqlite3.connect(
+            uri, uri=True, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        try:
+            db.execute("SELECT pos, line FROM events LIMIT 0")
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def head(self) -> Optional[Dict[str, Any]]:
+        row = self._db.execute(
+            "SELECT seq, curr_hash, timestamp FROM events ORDER BY pos DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return {"seq": row[0], "hash": row[1], "timestamp": row[2]}
+
+    def lines(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        match: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Tuple[int, bytes]]:
+        query, params = "SELECT pos, line FROM events", []
+        clauses = []
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        for name, value in (match or {}).items():
+            # only values a column holds exactly as the event does
+            if name not in _MATCHABLE:
+                continue
+            if value is None:
+                clauses.append(f"{name} IS NULL")
+            elif type(value) is (int if name == "seq" else str):
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        for pos, line in self._db.execute(query + " ORDER BY pos", params):
+            yield pos, _as_bytes(line)
+
+    def extent(self) -> Tuple[int, int]:
+        low, high = self._db.execute("SELECT MIN(pos), MAX(pos) FROM events").fetchone()
+        return (0, 0) if low is None else (low, high + 1)
+
+    def line_from(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        return self._one(
+            "SELECT pos, line FROM events WHERE pos >= ? ORDER BY pos LIMIT 1", pos
+        )
+
+    def line_before(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        return self._one(
+            "SELECT pos, line FROM events WHERE pos < ? ORDER BY pos DESC LIMIT 1", pos
+        )
+
+    def line_with_seq(self, seq: int) -> Optional[Tuple[int, bytes]]:
+        return self._one(
+            "SELECT pos, line FROM events WHERE seq = ? ORDER BY pos LIMIT 1", seq
+        )
+
+    def _one(self, query: str, value: int) -> Optional[Tuple[int, bytes]]:
+        row = self._db.execute(query, (value,)).fetchone()
+        return None if row is None else (row[0], _as_bytes(row[1]))
+
+    def append(
+        self,
+        build: Builder,
+        durability: str,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        from .core import Durability
+
+        timings = {} if timings is None else timings
+        durable = durability != Durability.WRITTEN
+        with self._lock:
+            db = self._db
+            db.execute(f"PRAGMA synchronous={'FULL' if durable else 'NORMAL'}")
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT line FROM events ORDER BY pos DESC LIMIT 1"
+                ).fetchone()
+                events, lines = build(json.loads(row[0]) if row else None)
+                mark = perf_counter()
+                db.executemany(
+                    "INSERT INTO events (seq, timestamp, event_type, model_id, "
+                    "dataset_id, deployment_id, curr_hash, line) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [_row(event, line) for event, line in zip(events, lines)],
+                )
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            now = perf_counter()
+            timings["write"] = now - mark
+            db.execute("COMMIT")
+            # with synchronous=FULL the commit is where the WAL is fsynced
+            if durable:
+                timings["fsync"] = perf_counter() - now
+            else:
+                timings["write"] += perf_counter() - now
+        return events
+
+    def insert_lines(self, lines: Iterator[bytes]) -> int:
+        """Store already-chained lines verbatim (for conversion)."""
+        count = 0
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for line in lines:
+                    self._db.execute(
+                        "INSERT INTO events (seq, timestamp, event_type, model_id, "
+                        "dataset_id, deployment_id, curr_hash, line) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        _row(json.loads(line), line),
+                    )
+                    count += 1
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return count
+
+    def recent_scopes(self, limit: int) -> List[Tuple[Any, Any, Any]]:
+        """``(model_id, dataset_id, deployment_id)`` of the last ``limit`` events."""
+        return self._db.execute(
+            "SELECT model_id, dataset_id, deployment_id FROM events "
+            "ORDER BY pos DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+
+def _as_bytes(line: Any) -> bytes:
+    # lines are stored as BLOBs, but an edited row can come back as TEXT
+    return line.encode("utf-8") if isinstance(line, str) else bytes(line)
+
+
+def _row(event: Dict[str, Any], line: bytes) -> Tuple[Any, ...]:
+    if not isinstance(event, dict) or not isinstance(event.get("curr_hash"), str):
+        raise ValueError("not a chained event: " + line[:80].decode("utf-8", "replace"))
+    values = [event.get(name) for name in _COLUMNS]
+    if not isinstance(values[0], int):
+        values[0] = None
+    return (*values, event["curr_hash"], line)
+
+
+def convert_ledger(source: str, target: str) -> int:
+    """Copy every committed event from one backend to another.
+
+    Between JSONL and SQLite, lines are copied byte for byte. To or from a
+    binary ledger each event is re-encoded losslessly, keeping its
+    ``hash_alg`` and ``curr_hash``. Either way hashes, anchors and
+    verification results carry over unchanged. ``target`` must not exist
+    yet. Returns the number of events copied.
+    """
+    from .core import _CommittedLines
+
+    if os.path.exists(target) and os.path.getsize(target):
+        raise FileExistsError(f"{target} already exists; refusing to overwrite it")
+
+    src = open_storage(source)
+    try:
+        if src is not None:
+            return _write_target(target, (line for _, line in src.lines()))
+        with open(source, "rb") as fh:
+            return _write_target(target, (line for _, line in _CommittedLines(fh)))
+    finally:
+        if src is not None:
+            src.close()
+
+
+def _write_target(target: str, items: Iterator[Any]) -> int:
+    from .binary import MAGIC, BinaryRecord, encode_body, encode_record, is_binary_ledger
+    from .core import _stable_json
+
+    def as_line(item: Any) -> bytes:
+        if isinstance(item, BinaryRecord):
+            return _stable_json(_decoded(item)).encode("utf-8")
+        return item
+
+    def as_record(item: Any) -> bytes:
+        if isinstance(item, BinaryRecord):
+            event = _decoded(item)
+            return encode_record(item.body, event["curr_hash"])
+        event = json.loads(item)
+        if not isinstance(event, dict) or "curr_hash" not in event:
+            raise ValueError("not a chained event: " + item[:80].decode("utf-8", "replace"))
+        body = encode_body({k: v for k, v in event.items() if k != "curr_hash"})
+        return encode_record(body, event["curr_hash"])
+
+    if is_sqlite_ledger(target):
+        storage = SQLiteStorage(target, create=True)
+        try:
+            return storage.insert_lines(as_line(item) for item in items)
+        finally:
+            storage.close()
+    binary = is_binary_ledger(target)
+    count = 0
+    with open(target, "xb") as out:
+        if binary:
+            out.write(MAGIC)
+        for item in items:
+            out.write(as_record(item) if binary else as_line(item) + b"\n")
+            count += 1
+        out.flush()
+        os.fsync(out.fileno())
+    return count
+
+
+def _decoded(record: Any) -> Dict[str, Any]:
+    if record.error:
+        raise ValueError(f"damaged binary record: {record.error}")
+    return record.decode()
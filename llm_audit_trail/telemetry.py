@@ -0,0 +1,172 @@
+"""Windowed summaries of per-step training metrics.
+
+Chaining one event per logging step would make the ledger grow with the
+step count and put a locked append on the training loop every few steps.
+:class:`StepTelemetry` keeps each window's numbers in memory instead and
+hands back one compact summary when the window closes, so ledger volume
+depends on the window size, not the run length, and a loss spike inside a
+long epoch still shows up as the window's ``max``.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+__all__ = ["StepTelemetry"]
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class _Series:
+    __slots__ = ("count", "total", "min", "max", "last", "nonfinite")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.last: Optional[float] = None
+        self.nonfinite = 0
+
+    def add(self, value: float) -> None:
+        self.last = value
+        if not math.isfinite(value):
+            # a NaN or inf loss is exactly what an auditor wants to see, but
+            # it would poison min/max/mean, so it is counted on its own
+            self.nonfinite += 1
+            return
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def summary(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.total / self.count if self.count else None,
+            "last": self.last if self.last is None or math.isfinite(self.last) else str(self.last),
+        }
+        if self.nonfinite:
+            out["nonfinite"] = self.nonfinite
+        return out
+
+
+class StepTelemetry:
+    """Accumulates ``Trainer`` log records and step times into windows.
+
+    A window closes after ``every_steps`` optimiser steps or
+    ``every_seconds`` of wall time, whichever comes first; either may be
+    None. :meth:`observe` returns the closed window's summary, or None
+    while the window is still open.
+
+    Args:
+        every_steps: Close a window after this many global steps.
+        every_seconds: Close a window after this many seconds.
+        clock: Monotonic time source, for tests.
+    """
+
+    def __init__(
+        self,
+        every_steps: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if every_steps is None and every_seconds is None:
+            raise ValueError("StepTelemetry needs every_steps or every_seconds")
+        if every_steps is not None and every_steps < 1:
+            raise ValueError("every_steps must be at least 1")
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError("every_seconds must be positive")
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self._clock = clock
+        self.start()
+
+    def start(self, step: int = 0, tokens_seen: Optional[int] = None) -> None:
+        """Open a fresh window at ``step``, discarding anything pending."""
+        self._window_started = self._clock()
+        self._first_step = step
+        self._last_step = step
+        self._tokens_at_start = tokens_seen
+        self._tokens_seen = tokens_seen
+        self._series: Dict[str, _Series] = {}
+        self._step_seconds: List[float] = []
+        self._records = 0
+        self._epoch: Optional[float] = None
+
+    def add_step_time(self, seconds: float) -> None:
+        self._step_seconds.append(seconds)
+
+    def observe(
+        self,
+        step: int,
+        logs: Optional[Dict[str, Any]],
+        tokens_seen: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Fold one log record in; return a summary if the window closed."""
+        self._records += 1
+        self._last_step = step
+        if tokens_seen is not None:
+            self._tokens_seen = tokens_seen
+        for name, value in (logs or {}).items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if name == "epoch":
+                self._epoch = float(value)
+                continue
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series()
+            series.add(float(value))
+        if self._due():
+            return self.flush()
+        return None
+
+    def _due(self) -> bool:
+        if self.every_steps is not None and self._last_step - self._first_step >= self.every_steps:
+            return True
+        return (
+            self.every_seconds is not None
+            and self._clock() - self._window_started >= self.every_seconds
+        )
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Close the current window now. None if nothing was observed."""
+        if not self._records and not self._step_seconds:
+            return None
+        now = self._clock()
+        elapsed = now - self._window_started
+        summary: Dict[str, Any] = {
+            "first_step": self._first_step,
+            "last_step": self._last_step,
+            "epoch": self._epoch,
+            "log_records": self._records,
+            "window_seconds": elapsed,
+            "metrics": {name: s.summary() for name, s in sorted(self._series.items())},
+            "step_seconds": None,
+            "tokens_per_second": None,
+        }
+        if self._step_seconds:
+            ordered = sorted(self._step_seconds)
+            summary["step_seconds"] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered),
+                "p50": _percentile(ordered, 0.5),
+                "p90": _percentile(ordered, 0.9),
+                "p99": _percentile(ordered, 0.99),
+                "max": ordered[-1],
+            }
+        if self._tokens_seen is not None and elapsed > 0:
+            started = self._tokens_at_start or 0
+            summary["tokens_per_second"] = (self._tokens_seen - started) / elapsed
+        self.start(self._last_step, self._tokens_seen)
+        return summary
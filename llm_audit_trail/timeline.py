@@ -0,0 +1,145 @@
+"""One timeline across several ledgers.
+
+Services keep their own ledgers — the trainer, the governance CLI, each
+API deployment — so the lifecycle of one model is spread over all of them.
+:func:`merge_events` streams them as a single sequence ordered by
+timestamp (or any other key) with a heap-based k-way merge: each ledger is
+read front to back and only its next event is held in memory, so the cost
+does not grow with the ledgers' length.
+
+Every ledger's timestamps are taken under its append lock and never go
+backwards, which is what makes a merge (rather than a sort) correct.
+"""
+
+from __future__ import annotations
+
+import heapq
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .binary import BinaryRecord
+from .core import (
+    AuditLogError,
+    TimeBound,
+    Where,
+    _ChainVerifier,
+    _ledger_lines,
+    _resolve_key,
+    _timestamp_bound,
+    _where_predicate,
+    iter_events,
+)
+from .events import Event
+
+__all__ = ["merge_events", "ChainError"]
+
+SortKey = Union[str, Callable[[Dict[str, Any]], Any]]
+
+
+class ChainError(AuditLogError):
+    """A ledger failed verification while being merged.
+
+    ``report`` is the error report :func:`~llm_audit_trail.verify_log`
+    would have returned for it.
+    """
+
+    def __init__(self, path: str, report: Dict[str, Any]) -> None:
+        super().__init__(
+            f"{path}: {report['error']} at line {report.get('line', '?')}"
+        )
+        self.path = path
+        self.report = report
+
+
+def merge_events(
+    paths: Sequence[str],
+    *,
+    key: SortKey = "timestamp",
+    where: Where = None,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    verify: bool = False,
+    hmac_key: Union[str, bytes, None] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(path, event)`` for every event of ``paths`` in ``key`` order.
+
+    Args:
+        paths: Ledgers to merge, in any supported format.
+        key: Top-level field to order by, or a function of the event.
+            Events lacking the field sort first. Ties keep the order of
+            ``paths``, then each ledger's own order.
+        where: Which events to keep, as for :func:`~llm_audit_trail.iter_events`
+            (e.g. ``{"model_id": "m-1"}``). Only ``details`` of kept events
+            are decoded.
+        since, until: Time window, as for :func:`~llm_audit_trail.iter_events`.
+        verify: Check each ledger's chain as it streams, from its first
+            event, and raise :class:`ChainError` at the first event that
+            does not link. Events already yielded are not retracted.
+        hmac_key: HMAC secret for ``verify``. Defaults to ``$AUDIT_HMAC_KEY``.
+
+    Each ledger is opened once and read sequentially; at most one event per
+    ledger is held at a time.
+    """
+    predicate = _where_predicate(where)
+    if isinstance(key, str):
+        field = key
+
+        def order(item: Tuple[str, Dict[str, Any]]) -> Any:
+            value = item[1].get(field)
+            return (value is not None, value)
+
+    else:
+        sort_key = key
+
+        def order(item: Tuple[str, Dict[str, Any]]) -> Any:
+            return sort_key(item[1])
+
+    with ExitStack() as stack:
+        streams = []
+        for path in paths:
+            if verify:
+                # every event is read to check the chain, then filtered
+                lines = stack.enter_context(_ledger_lines(path))
+                events = _verified(path, lines, _resolve_key(hmac_key), since, until)
+                streams.append(_tagged(path, events, predicate))
+            else:
+                events = iter_events(path, since=since, until=until, where=where, lazy=True)
+                streams.append(_tagged(path, events, None))
+        yield from heapq.merge(*streams, key=order)
+
+
+def _tagged(
+    path: str,
+    events: Iterable[Event],
+    predicate: Optional[Callable[[Event], bool]],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for event in events:
+        if predicate is None or predicate(event):
+            yield path, event.to_dict()
+
+
+def _verified(
+    path: str,
+    lines: Iterable[Tuple[int, Any]],
+    key: Optional[bytes],
+    since: TimeBound,
+    until: TimeBound,
+) -> Iterator[Event]:
+    """Events of ``lines`` that link, within the window; raises ChainError."""
+    lower, upper = _timestamp_bound(since), _timestamp_bound(until)
+    verifier = _ChainVerifier(key)
+    for line_no, line in lines:
+        error = verifier.feed(line_no, line)
+        if error is not None:
+            raise ChainError(path, error)
+        if isinstance(line, BinaryRecord):
+            event = Event.from_record(line)
+        else:
+            event = Event(verifier.last)  # type: ignore[arg-type]
+        timestamp = event.get("timestamp")
+        if isinstance(timestamp, str):
+            if upper is not None and timestamp >= upper:
+                return  # the chain up to here linked; the rest is not wanted
+            if lower is not None and timestamp < lower:
+                continue
+        yield event
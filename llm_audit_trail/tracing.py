@@ -0,0 +1,101 @@
+"""Tracing hooks around the phases of appends and verification.
+
+Pass a :class:`Tracer` as ``AuditLogger(tracer=...)`` or
+``verify_log(tracer=...)`` and its :meth:`~Tracer.span` is entered around
+each phase. With no tracer the library makes no tracing calls at all.
+
+Span names:
+
+* ``audit.append`` — one locked append cycle, with children
+  ``audit.lock_wait``, ``audit.tail_read``, ``audit.serialise``,
+  ``audit.digest``, ``audit.write`` and ``audit.fsync``. Per event there is
+  one ``audit.digest`` and, on a JSONL or SQLite ledger, two
+  ``audit.serialise`` spans: ``stage="body"`` encodes the fields that are
+  hashed, ``stage="line"`` the stored line including ``curr_hash``. A
+  binary ledger hashes the stored body itself, so it has only the first.
+* ``audit.verify`` — a whole :func:`verify_log` run, with one
+  ``audit.verify_line`` child per event
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["Tracer", "RecordingTracer", "OpenTelemetryTracer"]
+
+_NULL: ContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """Receives a span around each phase. The base class does nothing.
+
+    Subclasses override :meth:`span` to return any context manager.
+    Attribute values are always ``str``, ``int`` or ``bool``.
+    """
+
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        return _NULL
+
+
+class RecordingTracer(Tracer):
+    """Keeps ``(name, seconds, attributes)`` for every span, in end order.
+
+    Useful for finding the slow phase without an observability stack::
+
+        tracer = RecordingTracer()
+        verify_log(path, tracer=tracer)
+        tracer.totals()  # {"audit.verify_line": 1.92, "audit.verify": 2.01}
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Tuple[str, float, Dict[str, Any]]] = []
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, time.perf_counter() - started, attributes or {}))
+
+    def totals(self) -> Dict[str, float]:
+        """Total seconds per span name."""
+        out: Dict[str, float] = {}
+        for name, seconds, _ in self.spans:
+            out[name] = out.get(name, 0.0) + seconds
+        return out
+
+
+class OpenTelemetryTracer(Tracer):
+    """Forwards spans to OpenTelemetry, nesting them under the current span.
+
+    Works without ``opentelemetry-api`` installed: it then behaves like the
+    no-op :class:`Tracer`, so the same configuration runs everywhere.
+
+    Args:
+        tracer: An OpenTelemetry ``Tracer``. Defaults to
+            ``opentelemetry.trace.get_tracer("llm_audit_trail")``.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                tracer = None
+            else:
+                tracer = trace.get_tracer("llm_audit_trail")
+        self._tracer = tracer
+
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        if self._tracer is None:
+            return _NULL
+        return self._tracer.start_as_current_span(name, attributes=attributes)
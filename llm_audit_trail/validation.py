@@ -0,0 +1,344 @@
+"""Validate event ``details`` against the bundled JSON Schemas.
+
+Each schema is compiled once into a plain Python function (generated
+source, then ``exec``), so checking an event costs a few ``isinstance``
+calls rather than a walk over the schema. No validator package is needed.
+
+The compiler covers the JSON Schema keywords the bundled schemas use plus
+the common scalar constraints: ``type``, ``const``, ``enum``,
+``required``, ``properties``, ``additionalProperties``, ``items``,
+``minItems``/``maxItems``, ``minLength``/``maxLength``, ``pattern``,
+``minimum``/``maximum`` and their exclusive forms. Any other keyword is
+rejected at compile time rather than silently ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .blobs import is_blob_ref
+from .registry import SCHEMA_FILES, load_schema
+from .storage import is_jsonl_ledger
+
+__all__ = [
+    "SchemaValidationError",
+    "compile_schema",
+    "validator_for",
+    "validate_details",
+    "validate_log",
+]
+
+Validator = Callable[[Any], List[str]]
+
+# Keywords that describe a schema without constraining instances.
+_ANNOTATIONS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, (list, tuple))",
+}
+
+# Files smaller than this are validated in-process; a pool costs more.
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+# Violations kept verbatim in a validate_log report.
+_MAX_EXAMPLES = 20
+
+
+class SchemaValidationError(ValueError):
+    """An event's ``details`` do not match its event type's schema."""
+
+    def __init__(self, event_type: str, errors: List[str]) -> None:
+        super().__init__(f"{event_type} details failed validation: " + "; ".join(errors))
+        self.event_type = event_type
+        self.errors = errors
+
+
+class _Compiler:
+    """Turns one schema into the source of a ``validate(value)`` function."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._names = 0
+
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("c")
+        self.constants[name] = value
+        return name
+
+    def _line(self, depth: int, text: str) -> None:
+        self.lines.append("    " * depth + text)
+
+    def _fail(self, depth: int, path: str, message: str) -> None:
+        # path is a Python expression, so array indices are only formatted
+        # on the failure branch
+        self._line(depth, f"errors.append({path} + {message!r})")
+
+    def node(self, schema: Any, v: str, path: str, depth: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self._fail(depth, path, ": not allowed")
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"schema must be an object or boolean, got {schema!r}")
+        unknown = set(schema) - _ANNOTATIONS - {
+            "type", "const", "enum", "required", "properties",
+            "additionalProperties", "items", "minItems", "maxItems",
+            "minLength", "maxLength", "pattern", "minimum", "maximum",
+            "exclusiveMinimum", "exclusiveMaximum",
+        }
+        if unknown:
+            raise ValueError(f"unsupported schema keywords: {sorted(unknown)}")
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            check = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+            self._line(depth, f"if not ({check}):")
+            self._fail(depth + 1, path, f": expected {' or '.join(types)}")
+        if "const" in schema:
+            self._line(depth, f"if {v} != {self._constant(schema['const'])}:")
+            self._fail(depth + 1, path, f": must be {json.dumps(schema['const'])}")
+        if "enum" in schema:
+            self._line(depth, f"if {v} not in {self._constant(list(schema['enum']))}:")
+            self._fail(depth + 1, path, f": must be one of {json.dumps(schema['enum'])}")
+
+        strings = [k for k in ("minLength", "maxLength", "pattern") if k in schema]
+        if strings:
+            self._line(depth, f"if isinstance({v}, str):")
+            if "minLength" in schema:
+                self._line(depth + 1, f"if len({v}) < {int(schema['minLength'])}:")
+                self._fail(depth + 2, path, f": shorter than {schema['minLength']}")
+            if "maxLength" in schema:
+                self._line(depth + 1, f"if len({v}) > {int(schema['maxLength'])}:")
+                self._fail(depth + 2, path, f": longer than {schema['maxLength']}")
+            if "pattern" in schema:
+                regex = self._constant(re.compile(schema["pattern"]))
+                self._line(depth + 1, f"if not {regex}.search({v}):")
+                self._fail(depth + 2, path, f": does not match {schema['pattern']!r}")
+
+        bounds = [
+            (key, op)
+            for key, op in (
+                ("minimum", "<"), ("maximum", ">"),
+                ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">="),
+            )
+            if key in schema
+        ]
+        if bounds:
+            self._line(depth, f"if {_TYPE_CHECKS['number'].format(v=v)}:")
+            for key, op in bounds:
+                self._line(depth + 1, f"if {v} {op} {schema[key]!r}:")
+                self._fail(depth + 2, path, f": violates {key} {schema[key]}")
+
+        if any(k in schema for k in ("items", "minItems", "maxItems")):
+            self._line(depth, f"if {_TYPE_CHECKS['array'].format(v=v)}:")
+            if "minItems" in schema:
+                self._line(depth + 1, f"if len({v}) < {int(schema['minItems'])}:")
+                self._fail(depth + 2, path, f": fewer than {schema['minItems']} items")
+            if "maxItems" in schema:
+                self._line(depth + 1, f"if len({v}) > {int(schema['maxItems'])}:")
+                self._fail(depth + 2, path, f": more than {schema['maxItems']} items")
+            if "items" in schema and schema["items"] not in (True, {}):
+                index, item = self._name("i"), self._name("v")
+                self._line(depth + 1, f"for {index}, {item} in enumerate({v}):")
+                self.node(
+                    schema["items"], item, f"{path} + '[' + str({index}) + ']'", depth + 2
+                )
+
+        props = schema.get("properties", {})
+        extra = schema.get("additionalProperties", True)
+        if props or schema.get("required") or extra is not True:
+            self._line(depth, f"if {_TYPE_CHECKS['object'].format(v=v)}:")
+            for key in schema.get("required", []):
+                self._line(depth + 1, f"if {key!r} not in {v}:")
+                self._fail(depth + 2, path, f": missing required {key!r}")
+            for key, sub in props.items():
+                if sub is True or sub == {}:
+                    continue
+                child = self._name("v")
+                self._line(depth + 1, f"if {key!r} in {v}:")
+                self._line(depth + 2, f"{child} = {v}[{key!r}]")
+                self.node(sub, child, f"{path} + {'.' + key!r}", depth + 2)
+            if extra is not True:
+                key_var, child = self._name("k"), self._name("v")
+                known = self._constant(frozenset(props))
+                self._line(depth + 1, f"for {key_var}, {child} in {v}.items():")
+                self._line(depth + 2, f"if {key_var} in {known}:")
+                self._line(depth + 3, "continue")
+                self.node(extra, child, f"{path} + '.' + str({key_var})", depth + 2)
+
+
+def compile_schema(schema: Dict[str, Any], root: str = "details") -> Validator:
+    """Compile a JSON Schema into ``validate(value) -> [error, ...]``.
+
+    An empty list means the value is valid. Errors read
+    ``"details.rationale: expected string"``.
+
+    Raises:
+        ValueError: if the schema uses a keyword the compiler does not support.
+    """
+    compiler = _Compiler()
+    compiler.node(schema, "value", repr(root), 1)
+    source = "\n".join(
+        ["def validate(value):", "    errors = []", *compiler.lines, "    return errors"]
+    )
+    namespace: Dict[str, Any] = dict(compiler.constants)
+    exec(compile(source, f"<schema {schema.get('title', root)}>", "exec"), namespace)
+    validate = namespace["validate"]
+    validate.source = source
+    return validate
+
+
+@lru_cache(maxsize=None)
+def validator_for(event_type: str) -> Optional[Validator]:
+    """The compiled validator for ``event_type``, or None if it has no schema."""
+    if event_type not in SCHEMA_FILES:
+        return None
+    return compile_schema(load_schema(event_type))
+
+
+def _normalised(details: Any) -> Any:
+    """``details`` as it will be stored (numpy scalars become numbers, ...)."""
+    from .core import _json_default
+
+    return json.loads(json.dumps(details, default=_json_default))
+
+
+def validate_details(event_type: str, details: Any) -> None:
+    """Raise :class:`SchemaValidationError` if ``details`` break the schema.
+
+    Event types without a bundled schema always pass.
+    """
+    validate = validator_for(event_type)
+    if validate is None:
+        return
+    errors = validate(details)
+    if errors:
+        # values json would coerce (numpy ints, ...) only fail the fast
+        # check; judge them in their stored form before rejecting
+        errors = validate(_normalised(details))
+    if errors:
+        raise SchemaValidationError(event_type, errors)
+
+
+# ---------------------------------------------------------------------------
+# whole-ledger validation
+# ---------------------------------------------------------------------------
+
+
+def _validate_range(job: Tuple[str, int, int]) -> Dict[str, Any]:
+    """Validate the lines starting in ``[start, end)`` of ``path``."""
+    path, start, end = job
+    events: Counter = Counter()
+    invalid: Counter = Counter()
+    examples: List[Dict[str, Any]] = []
+    lines = 0
+    with open(path, "rb") as fh:
+        if start:
+            fh.seek(start - 1)
+            fh.readline()  # finish the line that straddles ``start``
+        while fh.tell() < end:
+            raw = fh.readline()
+            if not raw:
+                break
+            lines += 1
+            if not raw.strip():
+                continue
+            try:
+                event = json.loads(raw)
+                event_type = event["event_type"]
+                details = event.get("details")
+            except (ValueError, KeyError, TypeError):
+                continue  # structural damage is verify_log's business
+            errors: Optional[List[str]] = None
+            if not isinstance(event_type, str):
+                # counted under its JSON text: a list or object is not a key
+                event_type = json.dumps(event_type, sort_keys=True)
+                errors = ["event_type must be a string"]
+            events[event_type] += 1
+            if errors is None:
+                if is_blob_ref(details):
+                    continue  # stored out of line; checked when it was emitted
+                validate = validator_for(event_type)
+                errors = validate(details) if validate is not None else []
+            if errors:
+                invalid[event_type] += 1
+                if len(examples) < _MAX_EXAMPLES:
+                    examples.append(
+                        {"line": lines, "event_type": event_type, "errors": errors}
+                    )
+    return {"lines": lines, "events": events, "invalid": invalid, "examples": examples}
+
+
+def validate_log(path: str, *, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Check every event in a ledger against its bundled schema.
+
+    The file is split into byte ranges validated by parallel worker
+    processes. Lines that are not JSON events are skipped; use
+    :func:`~llm_audit_trail.verify_log` for chain integrity. Details kept
+    in a blob store are not read back, so only a logger created with
+    ``validate=True`` checks those.
+
+    Returns:
+        ``{"events", "invalid", "by_type", "examples"}``, where ``by_type``
+        maps each event type to ``{"events", "invalid"}`` and ``examples``
+        holds the first violations with their line numbers.
+    """
+    if not is_jsonl_ledger(path):
+        raise ValueError(
+            f"{path}: validate_log reads JSONL ledgers only; "
+            f"copy it with `llm-audit convert`"
+        )
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    if size < _PARALLEL_MIN_BYTES:
+        workers = 1
+    step = -(-size // workers) if size else 1
+    jobs = [(path, start, min(start + step, size)) for start in range(0, size, step)] or [
+        (path, 0, 0)
+    ]
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            results = list(pool.map(_validate_range, jobs))
+    else:
+        results = [_validate_range(job) for job in jobs]
+
+    events: Counter = Counter()
+    invalid: Counter = Counter()
+    examples: List[Dict[str, Any]] = []
+    offset = 0
+    for result in results:
+        events.update(result["events"])
+        invalid.update(result["invalid"])
+        for example in result["examples"]:
+            if len(examples) < _MAX_EXAMPLES:
+                examples.append(dict(example, line=example["line"] + offset))
+        offset += result["lines"]
+    return {
+        "events": sum(events.values()),
+        "invalid": sum(invalid.values()),
+        "by_type": {
+            name: {"events": count, "invalid": invalid[name]}
+            for name, count in sorted(events.items())
+        },
+        "examples": examples,
+    }
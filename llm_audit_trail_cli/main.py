@@ -12,20 +12,37 @@ import argparse
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from llm_audit_trail import (
+    AuditLogError,
     AuditLogger,
+    convert_ledger,
+    governance_state,
+    hash_dataset,
+    iter_events,
+    iter_verification,
+    merge_events,
     read_anchor,
     record_approval,
     record_attestation,
     record_waiver,
+    registered_manifest,
+    replicate,
+    validate_log,
     verify_log,
     write_anchor,
 )
+from llm_audit_trail.blobs import BlobError
 from llm_audit_trail.config import load_config
+from llm_audit_trail.hashing import (
+    build_manifest,
+    diff_manifests,
+    load_manifest,
+    write_manifest,
+)
 from llm_audit_trail.providers import load_scope_providers
 
 SCOPE_FIELDS = ("model_id", "dataset_id", "deployment_id")
@@ -292,10 +309,34 @@ def cmd_attest(args, config: Dict[str, Any]) -> Dict[str, Any]:
 def cmd_verify(args, config: Dict[str, Any]) -> int:
     path = args.log_path or config.get("log_path")
     expected_head = read_anchor(args.anchor) if args.anchor else None
-    ok, report = verify_log(path, expected_head=expected_head)
+    if args.all_errors:
+        # one JSON line per error and damaged range, then a summary line,
+        # flushed as found so a long scan can be watched or piped to jq
+        records = iter_verification(path, expected_head=expected_head, blobs=args.blobs)
+        for record in records:
+            print(json.dumps(record, sort_keys=True), flush=True)
+        return 0 if record["ok"] else 1
+
+    try:
+        ok, report = verify_log(
+            path, expected_head=expected_head, sample=args.sample, blobs=args.blobs
+        )
+    except ValueError as exc:
+        raise CliError(str(exc)) from None
 
     if args.json:
         print(json.dumps({"ok": ok, "path": path, **report}, indent=2, sort_keys=True))
+    elif ok and args.sample:
+        head = report.get("head") or {}
+        print(
+            f"OK  {path}: spot-checked {report['sampled_events']} events, "
+            f"head {head.get('hash', '-')}"
+        )
+        for fraction, chance in report["detection_probability"].items():
+            print(
+                f"  {float(fraction):.1%} of events altered would have been "
+                f"caught with probability {chance:.1%}"
+            )
     elif ok:
         head = report.get("head") or {}
         print(f"OK  {path}: {report['events']} events, head {head.get('hash', '-')}")
@@ -312,6 +353,92 @@ def cmd_verify(args, config: Dict[str, Any]) -> int:
     return 0 if ok else 1
 
 
+def cmd_events(args, config: Dict[str, Any]) -> int:
+    path = args.log_path or config.get("log_path")
+    if not os.path.exists(path):
+        raise CliError(f"{path} does not exist")
+    fields = [name.strip() for name in args.fields.split(",")] if args.fields else None
+    where = dict(_where_clause(clause) for clause in args.where or [])
+    try:
+        events = iter_events(
+            path,
+            since=args.since,
+            until=args.until,
+            blobs=args.blobs,
+            fields=fields,
+            where=where or None,
+        )
+        for event in events:
+            print(json.dumps(event, sort_keys=True))
+    except (ValueError, BlobError) as exc:
+        raise CliError(str(exc)) from None
+    return 0
+
+
+def _where_clause(clause: str) -> Tuple[str, Any]:
+    """``FIELD=VALUE``; the value is read as JSON when it parses (``seq=3``)."""
+    name, sep, raw = clause.partition("=")
+    if not sep or not name:
+        raise CliError(f"--where expects FIELD=VALUE, got {clause!r}")
+    try:
+        return name, json.loads(raw)
+    except ValueError:
+        return name, raw
+
+
+def _scope_from_args(args) -> Dict[str, Optional[str]]:
+    return {name: getattr(args, name, None) for name in SCOPE_FIELDS}
+
+
+def _governance(path: str, scope: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    try:
+        return governance_state(path, scope)
+    except ValueError as exc:
+        raise CliError(str(exc)) from None
+
+
+def cmd_status(args, config: Dict[str, Any]) -> int:
+    path = args.log_path or config.get("log_path")
+    state = _governance(path, _scope_from_args(args))
+    if args.json:
+        print(json.dumps(state, indent=2, sort_keys=True))
+        return 0
+    scope = ", ".join(f"{k}={v}" for k, v in state["scope"].items()) or "whole ledger"
+    print(f"{path} at seq {state['seq']} ({scope})")
+    for label, key in (
+        ("approvals", "approvals"),
+        ("active waivers", "waivers"),
+        ("expired waivers", "expired_waivers"),
+        ("attestations", "attestations"),
+    ):
+        print(f"  {label}: {len(state[key])}")
+        for decision in state[key]:
+            until = decision.get("time_bound_until")
+            suffix = f" until {until}" if until else ""
+            print(f"    seq {decision['seq']}  {decision['owner']}{suffix}")
+    return 0
+
+
+def cmd_check(args, config: Dict[str, Any]) -> int:
+    path = args.log_path or config.get("log_path")
+    scope = _scope_from_args(args)
+    if not any(scope.values()):
+        raise CliError("check needs --model-id, --dataset-id or --deployment-id")
+    state = _governance(path, scope)
+    if state["ok"]:
+        print(f"OK  {len(state['approvals'])} approval(s), no expired waivers")
+        return 0
+    if not state["approved"]:
+        print("FAILED  no approval recorded for this scope", file=sys.stderr)
+    for waiver in state["expired_waivers"]:
+        print(
+            f"FAILED  waiver at seq {waiver['seq']} for {waiver['waived_controls']} "
+            f"lapsed {waiver['time_bound_until']}",
+            file=sys.stderr,
+        )
+    return 1
+
+
 def cmd_anchor(args, config: Dict[str, Any]) -> int:
     path = args.log_path or config.get("log_path")
     anchor = write_anchor(path, args.out)
@@ -327,6 +454,156 @@ def cmd_anchor(args, config: Dict[str, Any]) -> int:
     return 0
 
 
+def cmd_recover(args, config: Dict[str, Any]) -> int:
+    event = _logger(args, config).recover()
+    if event is None:
+        print("nothing to recover: the ledger ends on a committed event", file=sys.stderr)
+        return 0
+    print(json.dumps(event, indent=2, sort_keys=True))
+    print(
+        f"\nQuarantined {event['details']['bytes']} torn bytes to "
+        f"{event['details']['quarantine_path']}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def cmd_validate(args, config: Dict[str, Any]) -> int:
+    path = args.log_path or config.get("log_path")
+    if not os.path.exists(path):
+        raise CliError(f"{path} does not exist")
+    try:
+        report = validate_log(path, workers=args.workers)
+    except ValueError as exc:
+        raise CliError(str(exc)) from None
+
+    ok = not report["invalid"]
+
+    if args.json:
+        print(json.dumps({"ok": ok, "path": path, **report}, indent=2, sort_keys=True))
+    else:
+        stream = sys.stdout if ok else sys.stderr
+        print(
+            f"{'OK' if ok else 'FAILED'}  {path}: {report['invalid']} of "
+            f"{report['events']} events violate their schema",
+            file=stream,
+        )
+        for event_type, counts in report["by_type"].items():
+            print(f"  {event_type}: {counts['invalid']}/{counts['events']}", file=stream)
+        for example in report["examples"]:
+            print(f"  line {example['line']}: {'; '.join(example['errors'])}", file=stream)
+    return 0 if ok else 1
+
+
+def cmd_timeline(args, config: Dict[str, Any]) -> int:
+    for path in args.ledgers:
+        if not os.path.exists(path):
+            raise CliError(f"{path} does not exist")
+    scope = {name: value for name, value in _scope_from_args(args).items() if value}
+    events = merge_events(
+        args.ledgers,
+        where=scope or None,
+        since=args.since,
+        until=args.until,
+        verify=args.verify,
+    )
+    try:
+        for path, event in events:
+            if args.json:
+                print(json.dumps({"ledger": path, "event": event}, sort_keys=True))
+            else:
+                print(
+                    f"{event.get('timestamp', '-')}  {event.get('event_type', '-'):<20} "
+                    f"seq={event.get('seq', '-')}  {path}"
+                )
+    except ValueError as exc:
+        raise CliError(str(exc)) from None
+    return 0
+
+
+def cmd_replicate(args, config: Dict[str, Any]) -> int:
+    path = args.log_path or config.get("log_path")
+    if not os.path.exists(path):
+        raise CliError(f"{path} does not exist")
+    try:
+        ok, report = replicate(path, args.to, full_check=args.full_check)
+    except ValueError as exc:
+        raise CliError(str(exc)) from None
+
+    if args.json:
+        print(json.dumps({"ok": ok, "path": path, **report}, indent=2, sort_keys=True))
+    elif ok:
+        head = report.get("head") or {}
+        print(
+            f"OK  {path} -> {report['mirror']}: {report['events']} new events "
+            f"({report['bytes']} bytes), head seq {head.get('seq', '-')}"
+        )
+    else:
+        print(f"FAILED  {path}: {report['error']}", file=sys.stderr)
+        for key, value in sorted(report.items()):
+            if key != "error":
+                print(f"  {key}: {value}", file=sys.stderr)
+    return 0 if ok else 1
+
+
+def cmd_convert(args, config: Dict[str, Any]) -> int:
+    if not os.path.exists(args.source):
+        raise CliError(f"{args.source} does not exist")
+    try:
+        count = convert_ledger(args.source, args.target)
+    except (FileExistsError, ValueError) as exc:
+        raise CliError(str(exc)) from None
+    print(f"copied {count} events from {args.source} to {args.target}", file=sys.stderr)
+    return 0
+
+
+def cmd_dataset_hash(args, config: Dict[str, Any]) -> int:
+    if not os.path.exists(args.path):
+        raise CliError(f"{args.path} does not exist")
+    digest = hash_dataset(args.path, workers=args.workers, cache_path=args.cache)
+    if not args.files:
+        digest.pop("file_hashes")
+    print(json.dumps(digest, indent=2, sort_keys=True))
+    return 0
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    try:
+        return load_manifest(path)
+    except (OSError, ValueError) as exc:
+        raise CliError(str(exc)) from None
+
+
+def cmd_dataset_manifest(args, config: Dict[str, Any]) -> int:
+    if not os.path.exists(args.path):
+        raise CliError(f"{args.path} does not exist")
+    previous = _load_manifest(args.previous) if args.previous else None
+    manifest = build_manifest(args.path, previous=previous, workers=args.workers)
+    write_manifest(manifest, args.out)
+    summary = {key: value for key, value in manifest.items() if key != "tree"}
+    print(json.dumps(dict(summary, manifest_path=args.out), indent=2, sort_keys=True))
+    return 0
+
+
+def _registered_manifest(dataset_id: str, version: str, path: str) -> Dict[str, Any]:
+    try:
+        return registered_manifest(dataset_id, version, path)
+    except (LookupError, OSError, ValueError) as exc:
+        raise CliError(str(exc)) from None
+
+
+def cmd_dataset_diff(args, config: Dict[str, Any]) -> int:
+    if args.dataset_id:
+        path = args.log_path or config.get("log_path")
+        old = _registered_manifest(args.dataset_id, args.old, path)
+        new = _registered_manifest(args.dataset_id, args.new, path)
+    else:
+        old, new = _load_manifest(args.old), _load_manifest(args.new)
+    diff = diff_manifests(old, new)
+    print(json.dumps(diff, indent=2, sort_keys=True))
+    return 0
+
+
 # --------------------------------------------------------------------------
 # argument parsing
 # --------------------------------------------------------------------------
@@ -393,10 +670,137 @@ def build_parser() -> argparse.ArgumentParser:
     verify = sub.add_parser("verify", help="verify the ledger's hash chain")
     verify.add_argument("--anchor", help="anchor file from `llm-audit anchor`")
     verify.add_argument("--json", action="store_true", help="machine-readable output")
+    scan = verify.add_mutually_exclusive_group()
+    scan.add_argument(
+        "--all-errors",
+        action="store_true",
+        help="keep going after a failure and stream every error as JSON lines",
+    )
+    scan.add_argument(
+        "--sample",
+        type=int,
+        metavar="K",
+        help="spot-check K random events plus the head instead of reading everything",
+    )
+    verify.add_argument(
+        "--blobs", help="blob store directory; check every referenced blob too"
+    )
+
+    status = sub.add_parser("status", help="approvals and waivers in force")
+    _add_scope_args(status)
+    status.add_argument("--json", action="store_true", help="machine-readable output")
+
+    check = sub.add_parser(
+        "check", help="exit 0 only if the scope is approved with no lapsed waivers"
+    )
+    _add_scope_args(check)
+
+    events = sub.add_parser("events", help="print events as JSON lines")
+    events.add_argument("--since", help="ISO 8601 time, inclusive (UTC if no offset)")
+    events.add_argument("--until", help="ISO 8601 time, exclusive (UTC if no offset)")
+    events.add_argument(
+        "--blobs", help="blob store directory; print stored details in place of references"
+    )
+    events.add_argument(
+        "--fields",
+        metavar="A,B,...",
+        help="print only these top-level fields (details are not decoded unless listed)",
+    )
+    events.add_argument(
+        "--where",
+        action="append",
+        metavar="FIELD=VALUE",
+        help="only events whose field equals VALUE (JSON if it parses); repeatable",
+    )
 
     anchor = sub.add_parser("anchor", help="record the current chain head")
     anchor.add_argument("--out", help="where to write the anchor")
 
+    validate = sub.add_parser(
+        "validate", help="check every event's details against its bundled schema"
+    )
+    validate.add_argument(
+        "--workers", type=int, help="parallel processes (default: CPU count)"
+    )
+    validate.add_argument("--json", action="store_true", help="machine-readable output")
+
+    sub.add_parser(
+        "recover",
+        help="quarantine a torn final write left by a crash",
+    )
+
+    replica = sub.add_parser(
+        "replicate",
+        help="copy newly appended events to a mirror, verifying them first",
+    )
+    replica.add_argument("--to", required=True, metavar="DIR", help="mirror directory")
+    replica.add_argument(
+        "--full-check",
+        action="store_true",
+        help="compare the whole replicated prefix with the mirror, not just its last event",
+    )
+    replica.add_argument("--json", action="store_true", help="machine-readable output")
+
+    timeline = sub.add_parser(
+        "timeline", help="merge several ledgers into one time-ordered stream"
+    )
+    timeline.add_argument("ledgers", nargs="+", help="ledgers to merge")
+    _add_scope_args(timeline)
+    timeline.add_argument("--since", help="ISO 8601 time, inclusive (UTC if no offset)")
+    timeline.add_argument("--until", help="ISO 8601 time, exclusive (UTC if no offset)")
+    timeline.add_argument(
+        "--verify",
+        action="store_true",
+        help="check each ledger's chain while merging; stop at the first break",
+    )
+    timeline.add_argument("--json", action="store_true", help="JSON lines of {ledger, event}")
+
+    convert = sub.add_parser(
+        "convert",
+        help="copy a ledger between JSONL, SQLite (.db/.sqlite/.sqlite3) and binary (.alog)",
+    )
+    convert.add_argument("source", help="existing ledger")
+    convert.add_argument("target", help="new ledger; its suffix picks the backend")
+
+    dataset = sub.add_parser("dataset", help="dataset provenance helpers")
+    dataset_sub = dataset.add_subparsers(dest="dataset_cmd", required=True)
+    dataset_hash = dataset_sub.add_parser(
+        "hash", help="content hash and row count for register_dataset"
+    )
+    dataset_hash.add_argument("path", help="dataset file or directory")
+    dataset_hash.add_argument(
+        "--workers", type=int, help="hashing processes (default: CPU count)"
+    )
+    dataset_hash.add_argument(
+        "--cache", help="JSON cache so unchanged files are not re-read"
+    )
+    dataset_hash.add_argument(
+        "--files", action="store_true", help="include per-file digests"
+    )
+
+    dataset_manifest = dataset_sub.add_parser(
+        "manifest", help="write a Merkle manifest of a dataset directory"
+    )
+    dataset_manifest.add_argument("path", help="dataset directory")
+    dataset_manifest.add_argument("--out", required=True, help="manifest file to write")
+    dataset_manifest.add_argument(
+        "--previous", help="prior version's manifest; unchanged shards are reused"
+    )
+    dataset_manifest.add_argument(
+        "--workers", type=int, help="hashing processes (default: CPU count)"
+    )
+
+    dataset_diff = dataset_sub.add_parser(
+        "diff", help="shards added, removed and changed between two manifests"
+    )
+    dataset_diff.add_argument("old", help="older manifest (or version, with --dataset-id)")
+    dataset_diff.add_argument("new", help="newer manifest (or version, with --dataset-id)")
+    dataset_diff.add_argument(
+        "--dataset-id",
+        dest="dataset_id",
+        help="diff two versions registered in the ledger, using their chained manifests",
+    )
+
     return parser
 
 
@@ -409,13 +813,36 @@ def main(argv: Optional[List[str]] = None) -> int:
             return cmd_verify(args, config)
         if args.cmd == "anchor":
             return cmd_anchor(args, config)
+        if args.cmd == "events":
+            return cmd_events(args, config)
+        if args.cmd == "status":
+            return cmd_status(args, config)
+        if args.cmd == "check":
+            return cmd_check(args, config)
+        if args.cmd == "recover":
+            return cmd_recover(args, config)
+        if args.cmd == "validate":
+            return cmd_validate(args, config)
+        if args.cmd == "convert":
+            return cmd_convert(args, config)
+        if args.cmd == "timeline":
+            return cmd_timeline(args, config)
+        if args.cmd == "replicate":
+            return cmd_replicate(args, config)
+        if args.cmd == "dataset":
+            handler = {
+                "hash": cmd_dataset_hash,
+                "manifest": cmd_dataset_manifest,
+                "diff": cmd_dataset_diff,
+            }[args.dataset_cmd]
+            return handler(args, config)
 
         handler = {"approve": cmd_approve, "waive": cmd_waive, "attest": cmd_attest}[
             args.cmd
         ]
         print(json.dumps(handler(args, config), indent=2, sort_keys=True))
         return 0
-    except CliError as exc:
+    except (CliError, AuditLogError) as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 2
     except (KeyboardInterrupt, EOFError):
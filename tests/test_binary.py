@@ -0,0 +1,175 @@
+"""Binary ledger records and conversion to and from JSON lines."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+from llm_audit_trail import (
+    AuditLogError,
+    AuditLogger,
+    convert_ledger,
+    iter_events,
+    read_head,
+    verify_log,
+    write_anchor,
+)
+from llm_audit_trail.binary import MAGIC, decode_body, encode_body
+from llm_audit_trail_cli.main import main
+
+
+def _fill(log, n=5):
+    for i in range(n):
+        log.emit("InferenceRequest", {"i": i, "text": "ü"}, deployment_id="prod")
+
+
+def test_binary_ledger_chains_and_verifies(tmp_path):
+    path = str(tmp_path / "audit.alog")
+    log = AuditLogger(path=path, system="svc")
+    _fill(log)
+    assert log.submit("Approval", {"owner": "MRC"}).result()["seq"] == 5
+
+    with open(path, "rb") as fh:
+        assert fh.read(len(MAGIC)) == MAGIC
+    events = list(iter_events(path))
+    assert [e["seq"] for e in events] == list(range(6))
+    assert events[0]["hash_alg"] == "sha256-bin"
+    assert events[0]["details"] == {"i": 0, "text": "ü"}
+    assert events[1]["prev_hash"] == events[0]["curr_hash"]
+
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 6
+    assert read_head(path) == report["head"] == log.head()
+
+
+def test_records_are_smaller_than_json_lines(tmp_path):
+    _fill(AuditLogger(path=str(tmp_path / "audit.jsonl")), 50)
+    _fill(AuditLogger(path=str(tmp_path / "audit.alog")), 50)
+    jsonl = os.path.getsize(tmp_path / "audit.jsonl")
+    assert os.path.getsize(tmp_path / "audit.alog") < jsonl * 0.7
+
+
+def test_body_round_trips_any_event():
+    odd = {
+        "seq": "7",
+        "timestamp": "yesterday",
+        "prev_hash": "ABC",
+        "event_id": "not-a-uuid",
+        "hash_alg": "sha256",
+        "event_type": "Custom",
+        "actor": None,
+        "model_id": 3,
+        "details": {"x": [1.5, None]},
+        "extra": True,
+    }
+    assert decode_body(encode_body(odd)) == odd
+    assert encode_body(decode_body(encode_body(odd))) == encode_body(odd)
+
+
+def test_tampering_is_detected(tmp_path):
+    path = str(tmp_path / "audit.alog")
+    _fill(AuditLogger(path=path))
+    data = bytearray(open(path, "rb").read())
+    at = data.index(b'"i":3')
+    data[at + 4 : at + 5] = b"9"
+    open(path, "wb").write(bytes(data))
+
+    ok, report = verify_log(path)
+    assert not ok and report["error"] == "hash_mismatch" and report["line"] > 0
+
+
+def test_torn_record_is_pending_then_recovered(tmp_path):
+    path = str(tmp_path / "audit.alog")
+    log = AuditLogger(path=path)
+    _fill(log, 3)
+    with open(path, "ab") as fh:
+        fh.write(b"\x40\x00\x00\x00partial")
+
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 3 and report["pending_bytes"] == 11
+    assert read_head(path)["seq"] == 2
+    with pytest.raises(Exception, match="incomplete"):
+        log.emit("Tick")
+
+    recovery = log.recover()
+    assert recovery["event_type"] == "RecoveryPerformed"
+    assert recovery["details"]["bytes"] == 11
+    assert log.recover() is None
+    assert AuditLogger(path=path, auto_recover=True).emit("Tick")["seq"] == 4
+    assert verify_log(path)[0]
+
+
+@pytest.mark.parametrize("damage", ["trailing_length", "leading_length"])
+def test_damaged_final_record_is_not_quarantined(tmp_path, damage):
+    path = str(tmp_path / "audit.alog")
+    log = AuditLogger(path=path)
+    _fill(log, 3)
+    data = bytearray(open(path, "rb").read())
+    last = len(data) - 4 - int.from_bytes(data[-4:], "little") - 36
+    if damage == "trailing_length":
+        data[-4:] = (int.from_bytes(data[-4:], "little") + 1).to_bytes(4, "little")
+    else:  # claims more bytes than the file holds
+        data[last : last + 4] = (len(data)).to_bytes(4, "little")
+    open(path, "wb").write(bytes(data))
+
+    with pytest.raises(AuditLogError, match="not a torn write"):
+        log.recover()
+    with pytest.raises(AuditLogError, match="not a torn write"):
+        AuditLogger(path=path, auto_recover=True).emit("Tick")
+    assert open(path, "rb").read() == bytes(data)
+    assert not os.path.exists(f"{path}.torn-{last}")
+    ok, report = verify_log(path)
+    assert not ok and report["error"] == "malformed_record" and report["line"] == last
+
+
+def test_concurrent_appends_stay_chained(tmp_path):
+    path = str(tmp_path / "audit.alog")
+    loggers = [AuditLogger(path=path) for _ in range(4)]
+
+    def worker(log):
+        for i in range(25):
+            log.emit("Tick", {"i": i})
+
+    threads = [threading.Thread(target=worker, args=(log,)) for log in loggers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 100
+
+
+def test_convert_round_trip_keeps_hashes(tmp_path):
+    source = str(tmp_path / "audit.jsonl")
+    _fill(AuditLogger(path=source))
+    binary = str(tmp_path / "audit.alog")
+    back = str(tmp_path / "back.jsonl")
+
+    assert convert_ledger(source, binary) == 5
+    anchor = write_anchor(source)
+    assert verify_log(binary, expected_head=anchor)[0]
+    assert convert_ledger(binary, back) == 5
+    with open(source, "rb") as a, open(back, "rb") as b:
+        assert a.read() == b.read()
+
+    # binary-chained events verify once converted to JSON lines, too
+    AuditLogger(path=binary).emit("Tick")
+    assert convert_ledger(binary, str(tmp_path / "mixed.jsonl")) == 6
+    ok, report = verify_log(str(tmp_path / "mixed.jsonl"))
+    assert ok and report["head"] == read_head(binary)
+
+
+def test_sampling_is_refused_and_cli_converts(tmp_path, capsys):
+    path = str(tmp_path / "audit.alog")
+    _fill(AuditLogger(path=path), 2)
+    with pytest.raises(ValueError):
+        verify_log(path, sample=1)
+
+    target = str(tmp_path / "audit.jsonl")
+    assert main(["convert", path, target]) == 0
+    assert "copied 2 events" in capsys.readouterr().err
+    assert main(["--log-path", path, "verify", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["events"] == 2
@@ -0,0 +1,97 @@
+"""Large details kept out of line in a content-addressed blob store."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from llm_audit_trail import AuditLogger, BlobError, BlobStore, iter_events, verify_log
+from llm_audit_trail_cli.main import main
+
+BIG = {"training_args": {f"arg_{i}": i for i in range(200)}}
+
+
+def _logger(tmp_path, **kwargs):
+    return AuditLogger(
+        path=str(tmp_path / "audit.jsonl"),
+        blob_dir=str(tmp_path / "blobs"),
+        blob_threshold=256,
+        **kwargs,
+    )
+
+
+def test_large_details_are_replaced_by_a_reference(tmp_path):
+    log = _logger(tmp_path)
+    small = log.emit("Evaluation", {"accuracy": 0.9})
+    big = log.emit("FineTuneStart", BIG)
+
+    assert small["details"] == {"accuracy": 0.9}
+    ref = big["details"]
+    assert ref["$blob"].startswith("sha256:") and ref["bytes"] > 256
+    line = (tmp_path / "audit.jsonl").read_text().splitlines()[1]
+    assert "arg_199" not in line
+    assert verify_log(log.path)[0]
+
+
+def test_identical_payloads_are_stored_once(tmp_path):
+    log = _logger(tmp_path)
+    first = log.emit("FineTuneStart", BIG)
+    second = log.emit("FineTuneStart", dict(BIG))
+    assert first["details"] == second["details"]
+    stored = [f for _, _, files in os.walk(tmp_path / "blobs") for f in files]
+    assert len(stored) == 1
+
+
+def test_concurrent_writers_of_one_payload(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    data = json.dumps(BIG).encode()
+    for trial in range(20):
+        store = BlobStore(str(tmp_path / f"blobs-{trial}"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            digests = set(pool.map(lambda _: store.put(data), range(8)))
+        assert len(digests) == 1
+        assert store.get(digests.pop()) == data
+        stored = [f for _, _, files in os.walk(store.root) for f in files]
+        assert len(stored) == 1  # no temporary files left behind
+
+
+def test_iter_events_resolves_blobs_on_request(tmp_path):
+    log = _logger(tmp_path)
+    log.emit("FineTuneStart", BIG)
+    (raw,) = iter_events(log.path)
+    assert "$blob" in raw["details"]
+    (resolved,) = iter_events(log.path, blobs=str(tmp_path / "blobs"))
+    assert resolved["details"] == BIG
+    assert resolved["curr_hash"] == raw["curr_hash"]
+
+
+def test_verify_checks_blob_contents_when_given_the_store(tmp_path):
+    log = _logger(tmp_path)
+    event = log.emit("FineTuneStart", BIG)
+    store = BlobStore(str(tmp_path / "blobs"))
+    path = store.path_for(event["details"]["$blob"])
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"training_args": {}}, fh)
+
+    assert verify_log(log.path)[0]  # the chain alone still links
+    ok, report = verify_log(log.path, blobs=store)
+    assert not ok and report["error"] == "blob_mismatch"
+    with pytest.raises(BlobError):
+        list(iter_events(log.path, blobs=store))
+
+    os.unlink(path)
+    ok, report = verify_log(log.path, blobs=store, mode="all")
+    assert not ok and report["errors"][0]["error"] == "blob_missing"
+
+
+def test_cli_events_and_verify_with_blobs(tmp_path, capsys):
+    log = _logger(tmp_path)
+    log.emit("FineTuneStart", BIG)
+    blobs = str(tmp_path / "blobs")
+
+    assert main(["--log-path", log.path, "events", "--blobs", blobs]) == 0
+    assert json.loads(capsys.readouterr().out)["details"] == BIG
+    assert main(["--log-path", log.path, "verify", "--blobs", blobs]) == 0
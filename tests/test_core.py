@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import base64
 import json
+import struct
 import subprocess
 import sys
 import threading
 
 import pytest
 
-from llm_audit_trail import AuditLogError, AuditLogger, iter_events, verify_log
+from llm_audit_trail import (
+    AuditLogError,
+    AuditLogger,
+    Durability,
+    iter_events,
+    read_anchor,
+    read_head,
+    verify_log,
+)
 from llm_audit_trail.core import GENESIS
 
 
@@ -81,6 +91,51 @@ def test_non_json_values_are_coerced_rather_than_crashing(tmp_path):
     assert isinstance(details["note"], str)
 
 
+class _ArrayLike:
+    """Stands in for a 2x2 little-endian float32 numpy array."""
+
+    ndim = 2
+    shape = (2, 2)
+
+    class dtype:
+        kind = "f"
+        byteorder = "="
+        str = "<f4"
+
+    def tobytes(self, order="C"):
+        assert order == "C"
+        return struct.pack("<4f", 1.0, 2.0, 3.0, 4.0)
+
+    def item(self):  # numpy raises here for arrays of more than one element
+        raise ValueError("can only convert an array of size 1")
+
+
+def test_arrays_are_encoded_as_typed_base64_buffers(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    AuditLogger(path=path).emit("Evaluation", {"confusion": _ArrayLike()})
+
+    assert verify_log(path)[0]
+    encoded = next(iter_events(path))["details"]["confusion"]["__ndarray__"]
+    assert encoded["dtype"] == "<f4" and encoded["shape"] == [2, 2]
+    assert base64.b64decode(encoded["data"]) == struct.pack("<4f", 1.0, 2.0, 3.0, 4.0)
+
+
+def test_arrays_round_trip_through_iter_events(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "audit.jsonl")
+    matrix = np.arange(6, dtype=">i8").reshape(2, 3).T  # big-endian, not C-contiguous
+    log = AuditLogger(path=path)
+    log.emit("Evaluation", {"confusion": matrix, "accuracy": np.float32(0.5)})
+    log.emit("Evaluation", {"confusion": matrix.astype("<i8")})
+
+    first, second = iter_events(path, decode_arrays=True)
+    np.testing.assert_array_equal(first["details"]["confusion"], matrix)
+    assert first["details"]["accuracy"] == 0.5
+    # byte order and layout do not change the stored (hashed) form
+    raw = [e["details"]["confusion"] for e in iter_events(path)]
+    assert raw[0] == raw[1]
+
+
 # --------------------------------------------------------------------------
 # concurrency
 # --------------------------------------------------------------------------
@@ -128,19 +183,21 @@ def test_separate_logger_instances_do_not_race(tmp_path):
 _CHILD = """
 import sys
 from llm_audit_trail import AuditLogger
-log = AuditLogger(path=sys.argv[1])
+log = AuditLogger(path=sys.argv[1], shared_head=sys.argv[3] == "shared")
 for i in range(30):
     log.emit("E", {"pid": sys.argv[2], "i": i})
 """
 
 
-def test_concurrent_processes_keep_the_chain_intact(tmp_path):
+@pytest.mark.parametrize("head", ["file", "shared"])
+def test_concurrent_processes_keep_the_chain_intact(tmp_path, head):
     path = str(tmp_path / "audit.jsonl")
     script = tmp_path / "child.py"
     script.write_text(_CHILD)
 
     children = [
-        subprocess.Popen([sys.executable, str(script), path, str(n)]) for n in range(4)
+        subprocess.Popen([sys.executable, str(script), path, str(n), head])
+        for n in range(4)
     ]
     for child in children:
         assert child.wait(timeout=120) == 0
@@ -150,6 +207,108 @@ def test_concurrent_processes_keep_the_chain_intact(tmp_path):
     assert report["events"] == 120
 
 
+# --------------------------------------------------------------------------
+# pipelined submission
+# --------------------------------------------------------------------------
+
+
+def test_submit_resolves_to_the_chained_event(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+
+    futures = [log.submit("E", {"i": i}, model_id="m1") for i in range(50)]
+    assert log.flush(timeout=30)
+
+    events = [future.result() for future in futures]
+    assert [e["seq"] for e in events] == list(range(50))
+    assert [e["details"]["i"] for e in events] == list(range(50))
+    assert events[0]["model_id"] == "m1"
+    assert list(iter_events(path)) == events
+
+    ok, report = verify_log(path)
+    assert ok, report
+    log.close()
+
+
+def test_submit_interleaves_with_emit(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+
+    log.emit("E", {"via": "emit"})
+    log.submit("E", {"via": "submit"})
+    assert log.flush(timeout=30)
+    log.emit("E", {"via": "emit"})
+
+    ok, report = verify_log(path)
+    assert ok, report
+    assert report["events"] == 3
+    log.close()
+
+
+def test_anchored_durability_writes_an_anchor_covering_the_event(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    anchor_path = str(tmp_path / "head.json")
+    log = AuditLogger(path=path, anchor_path=anchor_path)
+
+    event = log.submit("E", {}, durability=Durability.ANCHORED).result(timeout=30)
+
+    anchor = read_anchor(anchor_path)
+    assert anchor["seq"] >= event["seq"]
+    ok, report = verify_log(path, expected_head=anchor)
+    assert ok, report
+    log.close()
+
+
+def test_unknown_durability_is_rejected_up_front(tmp_path):
+    log = AuditLogger(path=str(tmp_path / "audit.jsonl"))
+    with pytest.raises(ValueError, match="durability"):
+        log.submit("E", {}, durability="eventually")
+    log.close()
+
+
+def test_failed_batches_surface_through_the_future(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    path.write_text(json.dumps({"event_type": "E"}) + "\n")
+    log = AuditLogger(path=str(path))
+
+    future = log.submit("E", {})
+    with pytest.raises(AuditLogError, match="curr_hash"):
+        future.result(timeout=30)
+    assert log.flush(timeout=30)
+    log.close()
+
+
+def test_exit_flush_is_shared_and_bounded(tmp_path, monkeypatch):
+    import threading
+
+    import llm_audit_trail.core as core
+
+    loggers = [AuditLogger(path=str(tmp_path / "audit.jsonl")) for _ in range(3)]
+    for log in loggers:
+        log.submit("E", {}).result(timeout=30)
+    writers = [log._writer for log in loggers]
+    assert all(writer in core._LIVE_WRITERS for writer in writers)
+    for log in loggers:
+        log.close()
+    # closed writers no longer flush at exit
+    assert not any(writer in core._LIVE_WRITERS for writer in writers)
+
+    # a hung append holds the exit handler only for EXIT_FLUSH_TIMEOUT
+    release = threading.Event()
+    real_append = AuditLogger._append
+    monkeypatch.setattr(
+        AuditLogger, "_append", lambda self, *a: release.wait(10) and real_append(self, *a)
+    )
+    monkeypatch.setattr(core, "EXIT_FLUSH_TIMEOUT", 0.1)
+    log = AuditLogger(path=str(tmp_path / "audit.jsonl"))
+    future = log.submit("E", {})
+    core._flush_at_exit()
+    assert not future.done()
+    release.set()
+    assert future.result(timeout=30)["seq"] == 3
+    log.close()
+
+
 # --------------------------------------------------------------------------
 # corrupt ledgers
 # --------------------------------------------------------------------------
@@ -184,3 +343,391 @@ def test_trailing_newlines_do_not_break_appends(tmp_path):
     ok, report = verify_log(str(path))
     assert ok, report
     assert report["events"] == 2
+
+
+def test_torn_final_write_is_refused_with_a_recovery_hint(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path))
+    log.emit("E", {})
+    path.write_bytes(path.read_bytes() + b'{"schema_version":"0.2.0","se')
+
+    with pytest.raises(AuditLogError, match="llm-audit recover"):
+        log.emit("E", {})
+
+
+def test_recover_quarantines_a_torn_write_and_records_it(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path))
+    log.emit("E", {"i": 0})
+    committed = path.stat().st_size
+    torn = b'{"schema_version":"0.2.0","se' + b"\x00" * 16
+    path.write_bytes(path.read_bytes() + torn)
+
+    event = log.recover()
+    assert event["event_type"] == "RecoveryPerformed"
+    assert event["details"]["offset"] == committed
+    assert event["details"]["bytes"] == len(torn)
+    with open(event["details"]["quarantine_path"], "rb") as fh:
+        assert fh.read() == torn
+
+    log.emit("E", {"i": 1})
+    ok, report = verify_log(str(path))
+    assert ok, report
+    assert report["events"] == 3
+    assert log.recover() is None
+
+
+def test_auto_recover_keeps_writers_available(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    AuditLogger(path=str(path)).emit("E", {"i": 0})
+    path.write_bytes(path.read_bytes() + b'{"partial": tru')
+
+    event = AuditLogger(path=str(path), auto_recover=True).emit("E", {"i": 1})
+
+    assert event["seq"] == 2
+    types = [e["event_type"] for e in iter_events(str(path))]
+    assert types == ["E", "RecoveryPerformed", "E"]
+    ok, report = verify_log(str(path))
+    assert ok, report
+
+
+def test_recovery_never_touches_a_committed_corrupt_line(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path), auto_recover=True)
+    log.emit("E", {})
+    path.write_text(path.read_text() + '{"partial": tru\n')
+
+    assert log.recover() is None
+    with pytest.raises(AuditLogError, match="corrupt ledger"):
+        log.emit("E", {})
+
+
+def test_unterminated_complete_record_is_continued_not_glued(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path))
+    log.emit("E", {"i": 0})
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+
+    log.emit("E", {"i": 1})
+    ok, report = verify_log(str(path))
+    assert ok, report
+    assert report["events"] == 2
+
+
+# --------------------------------------------------------------------------
+# I/O modes
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("sync_method", ["fsync", "fdatasync", "o_dsync"])
+def test_every_sync_method_writes_a_verifiable_chain(tmp_path, sync_method):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path, fsync=True, sync_method=sync_method)
+    for i in range(3):
+        log.emit("E", {"i": i})
+
+    ok, report = verify_log(path)
+    assert ok, report
+    assert report["events"] == 3
+
+
+def test_unknown_sync_method_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="sync_method"):
+        AuditLogger(path=str(tmp_path / "audit.jsonl"), sync_method="fsync-ish")
+
+
+def test_batches_larger_than_one_gather_write(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path, max_batch=5000)
+    futures = [log.submit("E", {"i": i}) for i in range(3000)]
+    assert log.flush(timeout=60)
+
+    assert futures[-1].result()["seq"] == 2999
+    ok, report = verify_log(path)
+    assert ok, report
+    log.close()
+
+
+# --------------------------------------------------------------------------
+# metrics
+# --------------------------------------------------------------------------
+
+
+def test_metrics_count_events_bytes_and_phases(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path), fsync=True)
+    for i in range(4):
+        log.emit("E", {"i": i})
+
+    snapshot = log.metrics()
+    assert snapshot["events"] == 4
+    assert snapshot["appends"] == 4
+    assert snapshot["bytes"] == path.stat().st_size
+    assert snapshot["queue_depth"] == 0
+    for phase in ("lock_wait", "tail_read", "serialise", "hash", "write", "fsync"):
+        assert snapshot["phases"][phase]["count"] == 4, phase
+        assert snapshot["phases"][phase]["p99"] is not None
+
+
+@pytest.mark.parametrize("name", ["audit.db", "audit.alog"])
+def test_metrics_time_every_phase_on_other_backends(tmp_path, name):
+    log = AuditLogger(path=str(tmp_path / name), fsync=True)
+    for i in range(3):
+        log.emit("E", {"i": i})
+    phases = log.metrics()["phases"]
+    for phase in ("write", "fsync"):
+        assert phases[phase]["count"] == 3, phase
+        assert 0 <= phases[phase]["sum"] < 60, phase  # durations, not clock readings
+
+
+def test_metrics_count_failed_appends(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    path.write_text(json.dumps({"event_type": "E"}) + "\n")
+    log = AuditLogger(path=str(path))
+
+    with pytest.raises(AuditLogError):
+        log.emit("E", {})
+    assert log.metrics()["errors"] == 1
+    assert log.metrics()["events"] == 0
+
+
+def test_prometheus_rendering_is_well_formed(tmp_path):
+    from llm_audit_trail.metrics import render_prometheus
+
+    log = AuditLogger(path=str(tmp_path / "audit.jsonl"))
+    log.emit("E", {})
+    text = render_prometheus(log.metrics(), ledger="audit.jsonl")
+
+    assert 'llm_audit_events_total{ledger="audit.jsonl"} 1' in text
+    assert '# TYPE llm_audit_append_phase_seconds histogram' in text
+    assert 'phase="write",le="+Inf"} 1' in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.rsplit(" ", 1)) == 2
+
+
+# --------------------------------------------------------------------------
+# tracing hooks
+# --------------------------------------------------------------------------
+
+
+def test_tracer_sees_every_append_phase(tmp_path):
+    from llm_audit_trail.tracing import RecordingTracer
+
+    tracer = RecordingTracer()
+    log = AuditLogger(path=str(tmp_path / "audit.jsonl"), fsync=True, tracer=tracer)
+    log.emit("E", {})
+
+    names = [name for name, _, _ in tracer.spans]
+    assert names[-1] == "audit.append"
+    for phase in ("audit.lock_wait", "audit.tail_read", "audit.serialise",
+                  "audit.digest", "audit.write", "audit.fsync"):
+        assert phase in names, phase
+    stages = [attrs["stage"] for name, _, attrs in tracer.spans if name == "audit.serialise"]
+    assert stages == ["body", "line"] and names.count("audit.digest") == 1
+
+
+def test_tracer_sees_each_verified_line(tmp_path):
+    from llm_audit_trail.tracing import RecordingTracer
+
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+    for i in range(3):
+        log.emit("E", {"i": i})
+
+    tracer = RecordingTracer()
+    ok, _ = verify_log(path, tracer=tracer)
+    assert ok
+    lines = [attrs["line"] for name, _, attrs in tracer.spans if name == "audit.verify_line"]
+    assert lines == [1, 2, 3]
+    assert set(tracer.totals()) == {"audit.verify", "audit.verify_line"}
+
+
+def test_opentelemetry_adapter_is_a_no_op_without_otel(tmp_path):
+    from llm_audit_trail.tracing import OpenTelemetryTracer
+
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path, tracer=OpenTelemetryTracer())
+    log.emit("E", {})
+    ok, report = log.verify()
+    assert ok, report
+
+
+# --------------------------------------------------------------------------
+# time-range reads
+# --------------------------------------------------------------------------
+
+
+def _timed_ledger(tmp_path, monkeypatch, count):
+    from datetime import datetime, timedelta, timezone
+
+    import llm_audit_trail.core as core
+
+    start = datetime(2026, 3, 3, 0, 0, tzinfo=timezone.utc)
+    stamps = iter(
+        (start + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        for i in range(count)
+    )
+    monkeypatch.setattr(core, "_now", lambda: next(stamps))
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+    for i in range(count):
+        log.emit("Tick", {"i": i, "pad": "x" * (i % 7) * 40})
+    return path
+
+
+def test_time_window_matches_a_full_scan(tmp_path, monkeypatch):
+    path = _timed_ledger(tmp_path, monkeypatch, 300)
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("\n")
+
+    window = iter_events(path, since="2026-03-03T02:00:00Z", until="2026-03-03T03:00:00Z")
+    assert [e["details"]["i"] for e in window] == list(range(120, 180))
+
+    from datetime import datetime
+
+    naive = datetime(2026, 3, 3, 4, 55)  # taken as UTC
+    assert [e["details"]["i"] for e in iter_events(path, since=naive)] == list(
+        range(295, 300)
+    )
+    assert list(iter_events(path, since="2026-03-04")) == []
+    assert len(list(iter_events(path, until="2026-03-03T00:00:00.000001+00:00"))) == 1
+
+
+def test_time_window_seeks_instead_of_scanning(tmp_path, monkeypatch):
+    import llm_audit_trail.core as core
+
+    path = _timed_ledger(tmp_path, monkeypatch, 1000)
+    parsed = []
+    real_loads = json.loads
+
+    def counting_loads(text, **kwargs):
+        parsed.append(text)
+        return real_loads(text, **kwargs)
+
+    monkeypatch.setattr(core.json, "loads", counting_loads)
+
+    events = list(iter_events(path, since="2026-03-03T16:00:00Z"))
+    assert events[0]["details"]["i"] == 960 and len(events) == 40
+    assert len(parsed) < 40 + 60  # the window plus a few probes per halving
+
+
+def test_unparseable_time_bound_is_rejected(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    AuditLogger(path=path).emit("Tick")
+    with pytest.raises(ValueError, match="ISO 8601"):
+        list(iter_events(path, since="last tuesday"))
+
+
+# --------------------------------------------------------------------------
+# projection and lazy events
+# --------------------------------------------------------------------------
+
+
+def _scoped_ledger(tmp_path, suffix="jsonl"):
+    path = str(tmp_path / f"audit.{suffix}")
+    log = AuditLogger(path=path)
+    for i in range(6):
+        log.emit(
+            "Tick",
+            {"i": i, "nested": {"event_id": "decoy", "details": [i]}},
+            model_id="a" if i % 2 else "b",
+        )
+    return path
+
+
+@pytest.mark.parametrize("suffix", ["jsonl", "alog", "db"])
+def test_projection_matches_a_full_scan(tmp_path, suffix):
+    path = _scoped_ledger(tmp_path, suffix)
+    full = list(iter_events(path))
+    picked = list(iter_events(path, fields=["seq", "model_id"], where={"model_id": "a"}))
+    assert picked == [
+        {"seq": e["seq"], "model_id": "a"} for e in full if e["model_id"] == "a"
+    ]
+    assert list(iter_events(path, where=lambda e: e["seq"] > 3)) == full[4:]
+    assert list(iter_events(path, lazy=True)) == full
+
+
+def test_projection_leaves_details_undecoded(tmp_path, monkeypatch):
+    import llm_audit_trail.events as events
+
+    path = _scoped_ledger(tmp_path)
+    decoded = []
+    real_loads = json.loads
+
+    def counting_loads(text, **kwargs):
+        decoded.append(text)
+        return real_loads(text, **kwargs)
+
+    monkeypatch.setattr(events.json, "loads", counting_loads)
+    list(iter_events(path, fields=["event_type", "seq"]))
+    assert decoded and not any(b'"nested"' in text for text in decoded)
+
+    (event,) = iter_events(path, where={"seq": 2}, lazy=True)
+    assert "details" in event and len(event) == len(list(event))
+    assert event.details == {"i": 2, "nested": {"event_id": "decoy", "details": [2]}}
+    assert json.loads(json.dumps(event.to_dict()))["event_id"] == event["event_id"]
+
+
+def test_lazy_event_falls_back_for_unusual_lines():
+    from llm_audit_trail import Event
+
+    line = b'{"a":{"x":1,"details":2},"details":{"event_id":3},"event_id":"e"}'
+    event = Event.from_line(line)
+    assert event == json.loads(line)
+    with pytest.raises(ValueError):
+        Event.from_line(b"[1, 2]")
+
+
+# --------------------------------------------------------------------------
+# shared head cell
+# --------------------------------------------------------------------------
+
+
+def test_shared_head_skips_the_tail_read(tmp_path, monkeypatch):
+    import llm_audit_trail.core as core
+
+    path = str(tmp_path / "audit.jsonl")
+    first = AuditLogger(path=path, shared_head=True)
+    first.emit("E", {"i": 0})
+    second = AuditLogger(path=path, shared_head=True)  # as another process would
+
+    def no_tail_reads(*args, **kwargs):
+        raise AssertionError("ledger tail was read")
+
+    monkeypatch.setattr(core, "_read_last_record", no_tail_reads)
+    second.emit("E", {"i": 1})
+    first.emit("E", {"i": 2})
+    assert read_head(path)["seq"] == 2
+    monkeypatch.undo()
+
+    ok, report = verify_log(path)
+    assert ok and report["head"] == read_head(path)
+
+
+def test_stale_head_cell_falls_back_to_the_ledger(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    shared = AuditLogger(path=path, shared_head=True)
+    shared.emit("E")
+    AuditLogger(path=path).emit("E")  # does not maintain the cell
+
+    assert read_head(path)["seq"] == 1
+    shared.emit("E")
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 3
+
+
+def test_head_cell_reads_are_consistent_snapshots(tmp_path):
+    from llm_audit_trail.headcell import HeadCell
+
+    cell_path = str(tmp_path / "audit.jsonl.head")
+    assert HeadCell.open(cell_path) is None
+    with HeadCell(cell_path, writable=True) as writer:
+        assert writer.read() is None
+        writer.write(120, 4, "ab" * 32, "2026-01-02T09:15:04.123456Z")
+        with HeadCell.open(cell_path) as reader:
+            assert reader.read() == (120, 4, "ab" * 32, "2026-01-02T09:15:04.123456Z")
+            # a writer that died mid-update leaves an odd generation behind
+            writer._map[8] |= 1
+            assert reader.read() is None
+            writer.write(240, 5, "cd" * 32, "2026-01-02T09:15:05.000000Z")
+            assert reader.read().seq == 5
@@ -0,0 +1,167 @@
+"""Materialised governance state and its incremental refresh."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+
+from llm_audit_trail import (
+    AuditLogger,
+    governance_state,
+    record_approval,
+    record_attestation,
+    record_waiver,
+)
+from llm_audit_trail_cli.main import main
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _decisions(path):
+    log = AuditLogger(path=path)
+    record_approval(log, owner="MRC", rationale="clears thresholds",
+                    scope={"model_id": "m1", "deployment_id": "prod"})
+    log.emit("InferenceRequest", {"tokens": 3}, deployment_id="prod")
+    record_waiver(log, owner="MRC", rationale="pilot", scope={"deployment_id": "prod"},
+                  waived_controls=["SLO:latency_p95"], time_bound_until="2026-05-31")
+    record_waiver(log, owner="MRC", rationale="pilot", scope={"deployment_id": "canary"},
+                  waived_controls=["SLO:error_rate"], time_bound_until="2026-07-01")
+    record_attestation(log, owner="Legal", statement="licensed", scope={"model_id": "m1"})
+    return log
+
+
+def test_state_answers_per_scope(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    _decisions(path)
+
+    prod = governance_state(path, {"deployment_id": "prod"}, now=NOW)
+    assert prod["approved"] and not prod["ok"]
+    assert [w["waived_controls"] for w in prod["expired_waivers"]] == [["SLO:latency_p95"]]
+    # a bare date holds for the whole of that day
+    assert governance_state(
+        path, {"deployment_id": "prod"}, now=datetime(2026, 5, 31, 23, 59)
+    )["ok"]
+
+    canary = governance_state(path, {"deployment_id": "canary"}, now=NOW)
+    assert not canary["approved"] and len(canary["waivers"]) == 1
+
+    model = governance_state(path, {"model_id": "m1"}, now=NOW)
+    assert model["ok"] and len(model["attestations"]) == 1
+    assert governance_state(path, now=NOW)["seq"] == 4
+
+
+def test_state_is_persisted_and_only_new_bytes_are_read(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUDIT_HMAC_KEY", "governance-key")
+    path = str(tmp_path / "audit.jsonl")
+    log = _decisions(path)
+    governance_state(path)
+    with open(path + ".governance.json", encoding="utf-8") as fh:
+        saved = json.load(fh)
+    assert saved["offset"] == os.path.getsize(path) and saved["seq"] == 4
+
+    # replaying from the start would now fail to parse: only the tail is read
+    with open(path, "r+b") as fh:
+        fh.write(b"X")
+    record_approval(log, owner="MRC", rationale="second look",
+                    scope={"deployment_id": "canary"})
+    assert governance_state(path, {"deployment_id": "canary"}, now=NOW)["ok"]
+
+
+def test_unkeyed_state_is_reread_from_the_ledger(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    state_path = path + ".governance.json"
+    log = _decisions(path)
+    governance_state(path)
+    with open(state_path, encoding="utf-8") as fh:
+        saved = json.load(fh)
+    assert "mac" not in saved and saved["offset"] == os.path.getsize(path)
+
+    # forged summaries are ignored: decisions come from the lines pointed at
+    saved["decisions"] = [dict(d, scope={"deployment_id": "canary"}, event_type="Approval")
+                          for d in saved["decisions"]]
+    with open(state_path, "w", encoding="utf-8") as fh:
+        json.dump(saved, fh)
+    assert not governance_state(path, {"deployment_id": "canary"}, now=NOW)["approved"]
+
+    # only the decision lines and the new bytes are read
+    with open(path, "r+b") as fh:
+        fh.seek(saved["positions"][1] - 2)  # inside the InferenceRequest line
+        fh.write(b"X")
+    record_approval(log, owner="MRC", rationale="second look",
+                    scope={"deployment_id": "canary"})
+    assert governance_state(path, {"deployment_id": "canary"}, now=NOW)["ok"]
+
+    # a position that is not a decision line forces a replay
+    with open(state_path, encoding="utf-8") as fh:
+        saved = json.load(fh)
+    saved["positions"][0] = saved["positions"][1] - 1
+    with open(state_path, "w", encoding="utf-8") as fh:
+        json.dump(saved, fh)
+    state = governance_state(path, {"deployment_id": "canary"}, now=NOW)
+    assert state["seq"] == 5
+
+
+def test_unreadable_details_are_flagged_not_fatal(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path, blob_dir=str(tmp_path / "blobs"), blob_threshold=0)
+    log.emit("Approval", {"decision": "approved", "owner": "MRC"}, deployment_id="prod")
+    log.emit("RiskWaiver", {"waived_controls": ["SLO"]}, deployment_id="prod")
+
+    state = governance_state(path, {"deployment_id": "prod"}, now=NOW)
+    assert state["approved"] and not state["ok"]
+    assert state["approvals"][0]["details_unreadable"]
+    assert state["expired_waivers"][0]["details_unreadable"]
+
+
+def test_edited_sealed_state_is_not_trusted(tmp_path, monkeypatch):
+    path = str(tmp_path / "audit.jsonl")
+    state_path = path + ".governance.json"
+    _decisions(path)
+    monkeypatch.setenv("AUDIT_HMAC_KEY", "governance-key")
+    assert not governance_state(path, {"deployment_id": "prod"}, now=NOW)["ok"]
+    with open(state_path, encoding="utf-8") as fh:
+        saved = json.load(fh)
+    # drop the lapsed waiver and grant the canary an approval
+    forged = dict(saved["decisions"][0], scope={"deployment_id": "canary"})
+    saved["decisions"] = [d for d in saved["decisions"] if d["seq"] != 2] + [forged]
+    with open(state_path, "w", encoding="utf-8") as fh:
+        json.dump(saved, fh)
+    assert not governance_state(path, {"deployment_id": "prod"}, now=NOW)["ok"]
+    assert not governance_state(path, {"deployment_id": "canary"}, now=NOW)["approved"]
+
+    # a state sealed under another key is replayed, not trusted
+    monkeypatch.setenv("AUDIT_HMAC_KEY", "other-key")
+    assert not governance_state(path, {"deployment_id": "canary"}, now=NOW)["approved"]
+
+
+def test_rewritten_ledger_forces_a_rebuild(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    _decisions(path)
+    assert governance_state(path, {"deployment_id": "prod"})["approved"]
+
+    os.remove(path)
+    log = AuditLogger(path=path)
+    for _ in range(6):
+        log.emit("Ping")
+    state = governance_state(path, {"deployment_id": "prod"})
+    assert not state["approved"] and state["seq"] == 5
+
+
+def test_check_gate_exit_codes(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("llm_audit_trail.config.SEARCH_PATHS", [])
+    path = str(tmp_path / "audit.jsonl")
+    _decisions(path)
+
+    assert main(["--log-path", path, "check", "--model-id", "m1"]) == 0
+    assert main(["--log-path", path, "check", "--deployment-id", "prod"]) == 1
+    assert "lapsed 2026-05-31" in capsys.readouterr().err
+    assert main(["--log-path", path, "check"]) == 2
+    assert main(["--log-path", path, "status", "--json"]) == 0
+
+    db = str(tmp_path / "audit.db")
+    AuditLogger(path=db).emit("Ping")
+    capsys.readouterr()
+    assert main(["--log-path", db, "status"]) == 2
+    assert main(["--log-path", db, "check", "--model-id", "m1"]) == 2
+    assert "JSONL ledgers only" in capsys.readouterr().err
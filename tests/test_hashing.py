@@ -0,0 +1,203 @@
+"""Dataset digests: determinism, row counts, caching, the pool and manifests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from llm_audit_trail import hash_dataset
+from llm_audit_trail.hashing import (
+    build_manifest,
+    diff_manifests,
+    hash_file,
+    load_manifest,
+    write_manifest,
+)
+from llm_audit_trail_cli.main import main
+
+
+def _tree(root):
+    (root / "shards").mkdir(parents=True)
+    (root / "shards" / "a.jsonl").write_text('{"x": 1}\n{"x": 2}\n')
+    (root / "shards" / "b.jsonl").write_text('{"x": 3}')  # no trailing newline
+    (root / "meta.csv").write_text("id,label\n1,pos\n2,neg\n")
+    (root / "README").write_text("not counted as rows\n")
+    return root
+
+
+def test_single_file_hash_matches_sha256sum(tmp_path):
+    path = tmp_path / "data.bin"
+    payload = os.urandom(300_000)
+    path.write_bytes(payload)
+
+    entry = hash_file(str(path), chunk_size=4096)
+    assert entry["sha256"] == "sha256:" + hashlib.sha256(payload).hexdigest()
+    assert entry["bytes"] == len(payload)
+    assert entry["rows"] is None
+
+    digest = hash_dataset(str(path), workers=1)
+    assert digest["content_hash"] == entry["sha256"]
+
+
+def test_rows_are_counted_in_the_same_pass(tmp_path):
+    digest = hash_dataset(str(_tree(tmp_path / "ds")), workers=1)
+    assert digest["rows"] == 2 + 1 + 2
+    assert digest["files"] == 4
+    assert digest["file_hashes"]["shards/b.jsonl"]["rows"] == 1
+
+
+def test_empty_files_hash_cleanly(tmp_path):
+    (tmp_path / "empty.jsonl").write_bytes(b"")
+    entry = hash_file(str(tmp_path / "empty.jsonl"))
+    assert entry["sha256"] == "sha256:" + hashlib.sha256(b"").hexdigest()
+    assert entry["rows"] == 0
+
+
+def test_directory_digest_is_deterministic_and_content_sensitive(tmp_path):
+    root = _tree(tmp_path / "ds")
+    first = hash_dataset(str(root), workers=1)
+    assert hash_dataset(str(root), workers=2) == first
+
+    (root / "shards" / "b.jsonl").write_text('{"x": 4}')
+    assert hash_dataset(str(root), workers=1)["content_hash"] != first["content_hash"]
+
+
+def test_renaming_a_file_changes_the_digest(tmp_path):
+    root = _tree(tmp_path / "ds")
+    before = hash_dataset(str(root), workers=1)["content_hash"]
+    os.rename(root / "README", root / "README.txt")
+    assert hash_dataset(str(root), workers=1)["content_hash"] != before
+
+
+def test_cache_skips_unchanged_files(tmp_path, monkeypatch):
+    root = _tree(tmp_path / "ds")
+    cache = str(root / ".hash-cache.json")  # inside the tree: must be ignored
+    first = hash_dataset(str(root), workers=1, cache_path=cache)
+
+    def _no_rehash(*_args, **_kwargs):
+        raise AssertionError("an unchanged file was read again")
+
+    monkeypatch.setattr("llm_audit_trail.hashing.hash_file", _no_rehash)
+    assert hash_dataset(str(root), workers=1, cache_path=cache) == first
+
+
+def test_cli_prints_a_register_ready_digest(tmp_path, capsys):
+    root = _tree(tmp_path / "ds")
+    assert main(["dataset", "hash", str(root), "--workers", "1"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["content_hash"].startswith("sha256:")
+    assert out["rows"] == 5
+    assert "file_hashes" not in out
+
+
+# --------------------------------------------------------------------------
+# Merkle manifests
+# --------------------------------------------------------------------------
+
+
+def test_manifest_root_covers_every_shard(tmp_path):
+    root = _tree(tmp_path / "ds")
+    first = build_manifest(str(root), workers=1)
+    assert first["files"] == 4
+    assert first["rows"] == 5
+    assert build_manifest(str(root), workers=1)["root"] == first["root"]
+
+    (root / "shards" / "a.jsonl").write_text('{"x": 9}\n')
+    assert build_manifest(str(root), workers=1)["root"] != first["root"]
+
+
+def test_new_version_reuses_unchanged_leaves(tmp_path, monkeypatch):
+    root = _tree(tmp_path / "ds")
+    v1 = build_manifest(str(root), workers=1)
+    (root / "shards" / "c.jsonl").write_text('{"x": 5}\n')
+
+    read = []
+    real = hash_file
+
+    def _spy(path, *args, **kwargs):
+        read.append(os.path.basename(path))
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr("llm_audit_trail.hashing.hash_file", _spy)
+    v2 = build_manifest(str(root), previous=v1, workers=1)
+
+    assert read == ["c.jsonl"]
+    assert v2["reused"] == 4
+    assert v2["root"] == build_manifest(str(root), workers=1)["root"]
+
+
+def test_diff_reports_added_removed_and_changed_shards(tmp_path):
+    root = _tree(tmp_path / "ds")
+    v1 = build_manifest(str(root), workers=1)
+
+    (root / "shards" / "a.jsonl").write_text('{"x": 10}\n')
+    (root / "shards" / "b.jsonl").unlink()
+    (root / "extra").mkdir()
+    (root / "extra" / "d.jsonl").write_text("{}\n")
+    v2 = build_manifest(str(root), workers=1)
+
+    assert diff_manifests(v1, v2) == {
+        "added": ["extra/d.jsonl"],
+        "removed": ["shards/b.jsonl"],
+        "changed": ["shards/a.jsonl"],
+    }
+    assert diff_manifests(v2, v2) == {"added": [], "removed": [], "changed": []}
+
+
+def test_tampered_manifest_is_rejected_on_load(tmp_path):
+    root = _tree(tmp_path / "ds")
+    path = write_manifest(build_manifest(str(root), workers=1), str(tmp_path / "m.json"))
+    assert load_manifest(path)["files"] == 4
+
+    manifest = json.loads((tmp_path / "m.json").read_text())
+    manifest["tree"]["entries"]["README"]["hash"] = "sha256:" + "0" * 64
+    (tmp_path / "m.json").write_text(json.dumps(manifest))
+    with pytest.raises(ValueError, match="root"):
+        load_manifest(path)
+
+
+def test_cli_manifest_then_diff(tmp_path, capsys):
+    root = _tree(tmp_path / "ds")
+    v1, v2 = str(tmp_path / "v1.json"), str(tmp_path / "v2.json")
+    assert main(["dataset", "manifest", str(root), "--out", v1, "--workers", "1"]) == 0
+    capsys.readouterr()
+    (root / "README").write_text("changed\n")
+    assert main(
+        ["dataset", "manifest", str(root), "--out", v2, "--previous", v1, "--workers", "1"]
+    ) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["reused"] == 3
+
+    assert main(["dataset", "diff", v1, v2]) == 0
+    assert json.loads(capsys.readouterr().out)["changed"] == ["README"]
+
+
+def test_cli_diffs_registered_versions(tmp_path, capsys):
+    from llm_audit_trail import AuditLogger, register_dataset
+
+    root = _tree(tmp_path / "ds")
+    ledger = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=ledger)
+    for version in ("v1", "v2"):
+        if version == "v2":
+            (root / "README").write_text("changed\n")
+        manifest = build_manifest(str(root), workers=1)
+        write_manifest(manifest, str(tmp_path / f"{version}.json"))
+        register_dataset(
+            log, dataset_id="ds", version=version, source="local", rows=manifest["rows"],
+            content_hash=manifest["root"], manifest_root=manifest["root"],
+            manifest_path=f"{version}.json",  # relative to the ledger
+        )
+
+    args = ["--log-path", ledger, "dataset", "diff", "--dataset-id", "ds", "v1", "v2"]
+    assert main(args) == 0
+    assert json.loads(capsys.readouterr().out)["changed"] == ["README"]
+
+    # a manifest swapped after registration no longer matches the chain
+    write_manifest(build_manifest(str(root), workers=1), str(tmp_path / "v1.json"))
+    assert main(args) == 2
+    assert "manifest_root" in capsys.readouterr().err
+    assert main(["--log-path", ledger, "dataset", "diff", "--dataset-id", "ds", "v1", "v9"]) == 2
@@ -141,6 +141,166 @@ def test_unknown_schema_names_the_alternatives():
         load_schema("NoSuchEvent")
 
 
+# --------------------------------------------------------------------------
+# hugging face trainer callback
+# --------------------------------------------------------------------------
+
+
+def _hf_state(**kwargs):
+    from types import SimpleNamespace
+
+    fields = {"epoch": 1.0, "global_step": 10, "log_history": [{"loss": 0.5}]}
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+class _FakeDist:
+    """Stands in for ``torch.distributed`` with the other ranks' summaries."""
+
+    def __init__(self, rank, peers):
+        self.rank = rank
+        self.peers = peers
+        self.gathers = 0
+
+    def get_rank(self):
+        return self.rank
+
+    def get_world_size(self):
+        return len(self.peers) + 1
+
+    def all_gather_object(self, out, obj):
+        self.gathers += 1
+        out[:] = list(self.peers)
+        out.insert(self.rank, obj)
+
+
+@pytest.mark.skipif(not _HAS_TRANSFORMERS, reason="transformers is not installed")
+def test_hf_callback_writes_from_the_world_main_process_only(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    import llm_audit_trail.hf as hf
+
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+    args = SimpleNamespace(output_dir=None, learning_rate=1e-4)
+    for is_main in (False, True):
+        callback = hf.AuditTrailCallback(log, model_id="m1")
+        state = _hf_state(is_world_process_zero=is_main)
+        callback.on_train_begin(args, state, None)
+        callback.on_epoch_end(args, state, None)
+        callback.on_evaluate(args, state, None, metrics={"eval_loss": 0.4})
+    events = list(iter_events(path))
+    assert [e["event_type"] for e in events] == ["FineTuneStart", "EpochEnd", "Evaluation"]
+
+    # without a Trainer state, the launcher's environment decides
+    monkeypatch.setattr(hf, "_distributed", lambda: None)
+    monkeypatch.setenv("RANK", "3")
+    monkeypatch.setenv("WORLD_SIZE", "4")
+    hf.AuditTrailCallback(log).on_train_begin(args, None, None)
+    assert len(list(iter_events(path))) == 3
+    monkeypatch.setenv("RANK", "0")
+    hf.AuditTrailCallback(log).on_train_begin(args, None, None)
+    assert list(iter_events(path))[-1]["details"]["world_size"] == 4
+
+
+@pytest.mark.skipif(not _HAS_TRANSFORMERS, reason="transformers is not installed")
+def test_hf_rank_summary_is_gathered_and_written_once(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    import llm_audit_trail.hf as hf
+
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+    args = SimpleNamespace(output_dir=None)
+    slow_peer = {
+        "rank": 0,
+        "steps": 2,
+        "mean_step_seconds": 5.0,
+        "max_step_seconds": 6.0,
+        "steps_per_second": 0.2,
+    }
+    gathers = 0
+    for rank in (1, 0):
+        peer = dict(slow_peer, rank=1 - rank)
+        dist = _FakeDist(rank, [peer])
+        monkeypatch.setattr(hf, "_distributed", lambda: dist)
+        callback = hf.AuditTrailCallback(log, aggregate_ranks=True)
+        state = _hf_state(is_world_process_zero=rank == 0)
+        for _ in range(2):
+            callback.on_step_begin(args, state, None)
+            callback.on_step_end(args, state, None)
+        callback.on_epoch_end(args, state, None)
+        gathers += dist.gathers
+    assert gathers == 2  # every rank joins the collective
+
+    summaries = [e for e in iter_events(path) if e["event_type"] == EventTypes.RANK_SUMMARY]
+    assert len(summaries) == 1
+    details = summaries[0]["details"]
+    assert details["world_size"] == 2 and details["slowest_rank"] == 1
+    assert [r["rank"] for r in details["ranks"]] == [0, 1]
+    assert details["ranks"][0]["steps"] == 2
+
+
+@pytest.mark.skipif(not _HAS_TRANSFORMERS, reason="transformers is not installed")
+def test_hf_checkpoints_are_hashed_in_the_background_when_asked(tmp_path):
+    from types import SimpleNamespace
+
+    from llm_audit_trail import hf_audit_callback
+
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path)
+    out = tmp_path / "out"
+    (out / "checkpoint-10").mkdir(parents=True)
+    (out / "checkpoint-10" / "model.safetensors").write_bytes(b"weights")
+    args = SimpleNamespace(output_dir=str(out))
+
+    hf_audit_callback(logger=log).on_save(args, _hf_state(is_world_process_zero=True), None)
+    assert [e["event_type"] for e in iter_events(path)] == ["Checkpoint"]  # off by default
+
+    callback = hf_audit_callback(logger=log, hash_checkpoints=True)
+    callback.on_save(args, _hf_state(is_world_process_zero=True, global_step=10), None)
+    # rotated away by save_total_limit before the hasher reached it
+    callback.on_save(args, _hf_state(is_world_process_zero=True, global_step=20), None)
+    assert callback.wait_for_hashes(timeout=10)
+
+    events = list(iter_events(path))
+    saved = {e["details"]["global_step"]: e for e in events if e["event_type"] == "Checkpoint"}
+    hashed = [e for e in events if e["event_type"] == EventTypes.CHECKPOINT_HASHED]
+    assert [h["details"]["checkpoint_event_id"] for h in hashed] == [
+        saved[10]["event_id"],
+        saved[20]["event_id"],
+    ]
+    assert hashed[0]["details"]["files"] == 1 and hashed[0]["details"]["content_hash"]
+    assert hashed[1]["details"]["error"].startswith("FileNotFoundError")
+    assert "content_hash" not in hashed[1]["details"]
+
+
+@pytest.mark.skipif(not _HAS_TRANSFORMERS, reason="transformers is not installed")
+def test_hf_wait_for_hashes_times_out_and_reraises(tmp_path, monkeypatch):
+    import threading
+    from types import SimpleNamespace
+
+    import llm_audit_trail.hf as hf
+
+    release = threading.Event()
+
+    def slow_hash(path, workers):
+        release.wait(10)
+        raise RuntimeError("disk went away")
+
+    monkeypatch.setattr(hf, "hash_dataset", slow_hash)
+    log = AuditLogger(path=str(tmp_path / "audit.jsonl"))
+    callback = hf.AuditTrailCallback(log, hash_checkpoints=True)
+    args = SimpleNamespace(output_dir=str(tmp_path))
+    callback.on_save(args, _hf_state(is_world_process_zero=True), None)
+
+    assert callback.wait_for_hashes(timeout=0.05) is False
+    release.set()
+    with pytest.raises(RuntimeError, match="disk went away"):
+        callback.wait_for_hashes(timeout=10)
+    assert callback.wait_for_hashes(timeout=0)  # reported once
+
+
 # --------------------------------------------------------------------------
 # fastapi middleware
 # --------------------------------------------------------------------------
@@ -264,3 +424,29 @@ def test_streaming_responses_are_not_buffered(tmp_path):
     events = list(iter_events(path))
     assert events[1]["details"]["streamed"] is True
     assert events[1]["details"]["resp_hash"] is None
+
+
+@pytest.mark.skipif(not _HAS_STARLETTE, reason="starlette is not installed")
+def test_middleware_serves_writer_metrics_without_auditing_the_scrape(tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from llm_audit_trail import AuditMiddleware
+
+    path = str(tmp_path / "audit.jsonl")
+    app = FastAPI()
+    app.add_middleware(
+        AuditMiddleware, logger=AuditLogger(path=path), metrics_path="/metrics"
+    )
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    client = TestClient(app)
+    client.get("/ping")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "llm_audit_events_total" in response.text
+    assert len(list(iter_events(path))) == 2
@@ -0,0 +1,142 @@
+"""Incremental replication to a verified mirror."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from llm_audit_trail import AuditLogger, replicate, verify_log
+from llm_audit_trail_cli.main import main
+
+
+def _fill(log, n, start=0):
+    for i in range(start, start + n):
+        log.emit("Tick", {"i": i})
+
+
+@pytest.mark.parametrize("name", ["audit.jsonl", "audit.alog"])
+def test_replication_copies_only_what_was_appended(tmp_path, name):
+    path = str(tmp_path / name)
+    mirror_dir = str(tmp_path / "mirror")
+    log = AuditLogger(path=path)
+    _fill(log, 3)
+
+    ok, report = replicate(path, mirror_dir)
+    assert ok and report["events"] == 3 and report["head"]["seq"] == 2
+    ok, report = replicate(path, mirror_dir)
+    assert ok and report["events"] == 0 and report["bytes"] == 0
+
+    _fill(log, 2, start=3)
+    before = report["offset"]
+    ok, report = replicate(path, mirror_dir, full_check=True)
+    assert ok and report["events"] == 2
+    assert report["bytes"] == os.path.getsize(path) - before
+
+    mirror = report["mirror"]
+    with open(path, "rb") as a, open(mirror, "rb") as b:
+        assert a.read() == b.read()
+    ok, verified = verify_log(mirror)
+    assert ok and verified["head"] == verify_log(path)[1]["head"]
+
+
+def test_tampered_appends_are_not_copied(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    mirror_dir = str(tmp_path / "mirror")
+    log = AuditLogger(path=path)
+    _fill(log, 2)
+    replicate(path, mirror_dir)
+    _fill(log, 3, start=2)
+
+    with open(path, "rb") as fh:
+        lines = fh.readlines()
+    lines[3] = lines[3].replace(b'"i":3', b'"i":7')
+    with open(path, "wb") as fh:
+        fh.writelines(lines)
+
+    ok, report = replicate(path, mirror_dir)
+    assert not ok and report["error"] == "hash_mismatch" and report["line"] == 4
+    assert report["events"] == 1  # seq 2 verified and was copied
+    mirror = report["mirror"]
+    assert verify_log(mirror)[1]["head"]["seq"] == 2
+    assert b'"i":7' not in open(mirror, "rb").read()
+
+
+def test_rewritten_or_truncated_prefix_is_refused(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    mirror_dir = str(tmp_path / "mirror")
+    _fill(AuditLogger(path=path), 3)
+    replicate(path, mirror_dir)
+    original = open(path, "rb").read()
+
+    # the same ledger re-chained from scratch: same size, different hashes
+    os.unlink(path)
+    _fill(AuditLogger(path=path), 3)
+    ok, report = replicate(path, mirror_dir)
+    assert not ok and report["error"] == "prefix_changed" and report["events"] == 0
+
+    with open(path, "wb") as fh:
+        fh.write(original[: len(original) // 2])
+    ok, report = replicate(path, mirror_dir)
+    assert not ok and report["error"] == "prefix_changed"
+
+    # an in-place edit of an earlier event only shows up in a full check
+    edited = original.replace(b'"i":0', b'"i":5')
+    with open(path, "wb") as fh:
+        fh.write(edited)
+    assert replicate(path, mirror_dir)[0]
+    ok, report = replicate(path, mirror_dir, full_check=True)
+    assert not ok and report["error"] == "prefix_changed"
+    assert edited[report["at_byte"]] != original[report["at_byte"]]
+
+
+def test_interrupted_run_is_repeated(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    mirror_dir = tmp_path / "mirror"
+    _fill(AuditLogger(path=path), 2)
+    replicate(path, str(mirror_dir))
+    with open(mirror_dir / "audit.jsonl", "ab") as fh:
+        fh.write(b'{"half a line')  # died before the state was saved
+
+    assert replicate(path, str(mirror_dir))[0]
+    assert open(mirror_dir / "audit.jsonl", "rb").read() == open(path, "rb").read()
+
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "audit.jsonl").write_text("not ours\n")
+    ok, report = replicate(path, str(tmp_path / "other"))
+    assert not ok and report["error"] == "mirror_mismatch"
+
+
+def test_cli_replicate(tmp_path, capsys):
+    path = str(tmp_path / "audit.jsonl")
+    _fill(AuditLogger(path=path), 2)
+    mirror_dir = str(tmp_path / "mirror")
+
+    assert main(["--log-path", path, "replicate", "--to", mirror_dir]) == 0
+    assert "2 new events" in capsys.readouterr().out
+    assert main(["--log-path", path, "replicate", "--to", mirror_dir, "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["events"] == 0
+
+
+def test_empty_binary_mirror_keeps_its_state(tmp_path):
+    from llm_audit_trail import BinaryStorage
+
+    path = str(tmp_path / "audit.alog")
+    mirror_dir = str(tmp_path / "mirror")
+    BinaryStorage(path, create=True)
+    ok, report = replicate(path, mirror_dir)
+    assert ok and report["events"] == 0 and report["head"] is None
+    assert os.path.exists(report["mirror"] + ".replica.json")
+
+    _fill(AuditLogger(path=path), 2)
+    ok, report = replicate(path, mirror_dir)
+    assert ok and report["events"] == 2
+
+    # a mirror left holding only the file marker by an older run is reused
+    os.unlink(report["mirror"] + ".replica.json")
+    with open(report["mirror"], "wb") as fh:
+        fh.write(open(path, "rb").read(8))
+    ok, report = replicate(path, mirror_dir)
+    assert ok and report["events"] == 2
+    assert open(report["mirror"], "rb").read() == open(path, "rb").read()
@@ -0,0 +1,202 @@
+"""SQLite storage backend and conversion to and from JSONL."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from llm_audit_trail import (
+    AuditLogger,
+    convert_ledger,
+    iter_events,
+    read_head,
+    verify_log,
+    write_anchor,
+)
+from llm_audit_trail.core import _chain_hash, _stable_json
+from llm_audit_trail_cli.main import main
+
+
+def _fill(log, n=5):
+    for i in range(n):
+        log.emit("InferenceRequest", {"i": i}, deployment_id="prod")
+
+
+def test_sqlite_ledger_chains_like_jsonl(tmp_path):
+    path = str(tmp_path / "audit.db")
+    log = AuditLogger(path=path, system="svc")
+    _fill(log)
+    assert log.submit("Approval", {"owner": "MRC"}).result()["seq"] == 5
+
+    events = list(iter_events(path))
+    assert [e["seq"] for e in events] == list(range(6))
+    prev = "GENESIS"
+    for event in events:
+        body = {k: v for k, v in event.items() if k != "curr_hash"}
+        assert event["prev_hash"] == prev
+        assert event["curr_hash"] == _chain_hash(prev, _stable_json(body), None)
+        prev = event["curr_hash"]
+
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 6
+    assert read_head(path) == report["head"] == log.head()
+    assert log.recover() is None
+
+
+def test_sqlite_stores_the_canonical_line(tmp_path):
+    path = str(tmp_path / "audit.sqlite")
+    event = AuditLogger(path=path).emit("X", {"b": 1, "a": [1.5, "ü"]}, model_id="m")
+    with sqlite3.connect(path) as db:
+        line, model_id, seq = db.execute(
+            "SELECT line, model_id, seq FROM events"
+        ).fetchone()
+    assert bytes(line) == _stable_json(event).encode("utf-8")
+    assert (model_id, seq) == ("m", 0)
+
+
+def test_sqlite_tampering_is_detected(tmp_path):
+    path = str(tmp_path / "audit.db")
+    _fill(AuditLogger(path=path))
+    with sqlite3.connect(path) as db:
+        line = bytes(db.execute("SELECT line FROM events WHERE pos = 3").fetchone()[0])
+        db.execute(
+            "UPDATE events SET line = ? WHERE pos = 3",
+            (line.replace(b'"i":2', b'"i":9'),),
+        )
+    ok, report = verify_log(path)
+    assert not ok and report["error"] == "hash_mismatch" and report["line"] == 3
+
+
+def test_sqlite_concurrent_appends_stay_chained(tmp_path):
+    path = str(tmp_path / "audit.db")
+    loggers = [AuditLogger(path=path) for _ in range(4)]
+
+    def worker(log):
+        for i in range(25):
+            log.emit("Tick", {"i": i})
+
+    threads = [threading.Thread(target=worker, args=(log,)) for log in loggers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    ok, report = verify_log(path)
+    assert ok and report["events"] == 100
+
+
+def test_sqlite_time_window_uses_the_index(tmp_path):
+    path = str(tmp_path / "audit.db")
+    log = AuditLogger(path=path)
+    _fill(log, 3)
+    middle = datetime.now(timezone.utc)
+    _fill(log, 3)
+    window = list(iter_events(path, since=middle))
+    assert [e["seq"] for e in window] == [3, 4, 5]
+    assert list(iter_events(path, until=middle - timedelta(days=1))) == []
+
+
+def test_sqlite_where_filters_use_the_indexed_columns(tmp_path):
+    from llm_audit_trail import SQLiteStorage
+    from llm_audit_trail.providers.base import JSONLLocalProvider
+
+    path = str(tmp_path / "audit.db")
+    log = AuditLogger(path=path)
+    _fill(log, 3)
+    log.emit("Approval", {"owner": "MRC"}, model_id="m1", deployment_id="canary")
+    log.emit("InferenceRequest", {"i": 9}, deployment_id="canary")
+
+    storage = SQLiteStorage(path)
+    try:
+        picked = [json.loads(line) for _, line in storage.lines(match={"deployment_id": "canary"})]
+    finally:
+        storage.close()
+    assert [e["seq"] for e in picked] == [3, 4]
+
+    canary = iter_events(path, where={"deployment_id": "canary", "event_type": "Approval"})
+    assert [e["seq"] for e in canary] == [3]
+    assert [e["seq"] for e in iter_events(path, where={"model_id": None, "seq": 4})] == [4]
+    # a value no column holds as such is still filtered, just not by SQLite
+    assert list(iter_events(path, where={"seq": "4"})) == []
+
+    assert JSONLLocalProvider(path).recent() == {
+        "models": ["m1"],
+        "datasets": [],
+        "deployments": ["canary", "prod"],
+    }
+
+
+def test_closing_the_logger_releases_the_connection(tmp_path):
+    path = str(tmp_path / "audit.db")
+    with AuditLogger(path=path) as log:
+        _fill(log, 2)
+        log.submit("Ping").result()
+    assert log._storage._conn is None
+    log.emit("Ping")  # reconnects
+    log.close()
+    assert verify_log(path)[1]["events"] == 4
+
+
+def test_sqlite_anchor_detects_truncation(tmp_path):
+    path = str(tmp_path / "audit.db")
+    _fill(AuditLogger(path=path))
+    anchor = write_anchor(path)
+    with sqlite3.connect(path) as db:
+        db.execute("DELETE FROM events WHERE pos = (SELECT MAX(pos) FROM events)")
+    ok, report = verify_log(path, expected_head=anchor)
+    assert not ok and report["error"] == "anchor_missing"
+
+
+def test_missing_sqlite_ledger_is_unreadable(tmp_path):
+    path = str(tmp_path / "absent.db")
+    ok, report = verify_log(path)
+    assert not ok and report["error"] == "unreadable"
+    assert read_head(path) is None
+
+
+def test_convert_round_trip_is_byte_identical(tmp_path):
+    source = str(tmp_path / "audit.jsonl")
+    _fill(AuditLogger(path=source))
+    db = str(tmp_path / "audit.db")
+    back = str(tmp_path / "back.jsonl")
+
+    assert convert_ledger(source, db) == 5
+    assert verify_log(db)[1]["head"] == verify_log(source)[1]["head"]
+    assert convert_ledger(db, back) == 5
+    with open(source, "rb") as a, open(back, "rb") as b:
+        assert a.read() == b.read()
+
+    # the converted ledger keeps chaining where the original left off
+    assert AuditLogger(path=db).emit("Tick")["seq"] == 5
+    assert verify_log(db)[0]
+
+    with pytest.raises(FileExistsError):
+        convert_ledger(source, back)
+
+
+def test_cli_convert(tmp_path, capsys):
+    source = str(tmp_path / "audit.jsonl")
+    target = str(tmp_path / "audit.sqlite3")
+    _fill(AuditLogger(path=source), 2)
+
+    assert main(["convert", source, target]) == 0
+    assert "copied 2 events" in capsys.readouterr().err
+    assert main(["--log-path", target, "verify", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["events"] == 2
+    assert main(["convert", source, target]) == 2
+
+
+def test_sqlite_spot_check(tmp_path):
+    path = str(tmp_path / "audit.db")
+    _fill(AuditLogger(path=path), 8)
+    anchor = write_anchor(path)
+    ok, report = verify_log(path, sample=4, expected_head=anchor)
+    assert ok and report["head"]["seq"] == 7
+
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE events SET line = replace(line, '\"i\":', '\"j\":')")
+    ok, report = verify_log(path, sample=1)
+    assert not ok and report["error"] == "hash_mismatch"
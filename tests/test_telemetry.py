@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from llm_audit_trail.telemetry import StepTelemetry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_window_closes_after_every_steps_with_min_max_mean_last():
+    telemetry = StepTelemetry(every_steps=3, clock=FakeClock())
+    assert telemetry.observe(1, {"loss": 2.0, "epoch": 0.1}) is None
+    assert telemetry.observe(2, {"loss": 9.0}) is None
+    summary = telemetry.observe(3, {"loss": 1.0, "learning_rate": 1e-5})
+
+    loss = summary["metrics"]["loss"]
+    assert (loss["min"], loss["max"], loss["last"], loss["count"]) == (1.0, 9.0, 1.0, 3)
+    assert loss["mean"] == pytest.approx(4.0)
+    assert summary["metrics"]["learning_rate"]["count"] == 1
+    assert (summary["first_step"], summary["last_step"], summary["epoch"]) == (0, 3, 0.1)
+    assert "epoch" not in summary["metrics"]
+
+    # the next window starts where this one ended
+    assert telemetry.observe(4, {"loss": 0.5}) is None
+    assert telemetry.flush()["first_step"] == 3
+
+
+def test_window_closes_on_wall_time_and_reports_throughput():
+    clock = FakeClock()
+    telemetry = StepTelemetry(every_seconds=10, clock=clock)
+    telemetry.start(tokens_seen=0)
+    for step in range(1, 5):
+        telemetry.add_step_time(step / 10)
+        clock.now = step * 2.0
+        assert telemetry.observe(step, {"loss": 1.0}, tokens_seen=step * 100) is None
+    clock.now = 10.0
+    summary = telemetry.observe(5, {"loss": 1.0}, tokens_seen=500)
+
+    assert summary["tokens_per_second"] == pytest.approx(50.0)
+    steps = summary["step_seconds"]
+    assert steps["count"] == 4 and steps["max"] == pytest.approx(0.4)
+    assert steps["p50"] == pytest.approx(0.2)
+
+
+def test_nonfinite_values_are_counted_without_poisoning_the_stats():
+    telemetry = StepTelemetry(every_steps=100)
+    telemetry.observe(1, {"loss": 1.0, "note": "text", "flag": True})
+    telemetry.observe(2, {"loss": math.nan})
+    loss = telemetry.flush()["metrics"]["loss"]
+    assert (loss["max"], loss["nonfinite"], loss["last"]) == (1.0, 1, "nan")
+
+
+def test_empty_window_flushes_nothing_and_a_window_is_required():
+    assert StepTelemetry(every_steps=5).flush() is None
+    with pytest.raises(ValueError):
+        StepTelemetry()
@@ -0,0 +1,74 @@
+"""Merging several ledgers into one timeline."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from llm_audit_trail import AuditLogger, ChainError, merge_events
+from llm_audit_trail_cli.main import main
+
+
+@pytest.fixture()
+def ledgers(tmp_path, monkeypatch):
+    """Three ledgers (JSONL, binary, SQLite) written in interleaved order."""
+    import llm_audit_trail.core as core
+
+    start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    stamps = iter(
+        (start + timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%fZ") for i in range(100)
+    )
+    monkeypatch.setattr(core, "_now", lambda: next(stamps))
+    paths = [str(tmp_path / name) for name in ("trainer.jsonl", "api.alog", "gov.db")]
+    loggers = [AuditLogger(path=path) for path in paths]
+    for i in range(12):
+        loggers[(i * 7) % 3].emit("Tick", {"i": i}, model_id="m1" if i % 4 else "m2")
+    return paths
+
+
+def test_merge_orders_events_across_ledgers(ledgers):
+    merged = list(merge_events(ledgers))
+    assert [event["details"]["i"] for _, event in merged] == list(range(12))
+    assert {path for path, _ in merged} == set(ledgers)
+    assert all(event["curr_hash"] for _, event in merged)
+
+
+def test_merge_filters_and_keeps_the_window(ledgers):
+    picked = merge_events(
+        ledgers,
+        where={"model_id": "m2"},
+        since="2026-05-01T00:00:01Z",
+        until="2026-05-01T00:00:09Z",
+    )
+    assert [event["details"]["i"] for _, event in picked] == [4, 8]
+
+    by_seq = [event["seq"] for _, event in merge_events(ledgers, key="seq")]
+    assert by_seq == sorted(by_seq)
+
+
+def test_merge_verifies_each_chain_as_it_streams(ledgers):
+    assert len(list(merge_events(ledgers, verify=True))) == 12
+
+    with open(ledgers[0], "rb") as fh:
+        lines = fh.readlines()
+    lines[2] = lines[2].replace(b'"i":', b'"j":')
+    with open(ledgers[0], "wb") as fh:
+        fh.writelines(lines)
+    assert len(list(merge_events(ledgers))) == 12
+    with pytest.raises(ChainError) as caught:
+        list(merge_events(ledgers, verify=True))
+    assert caught.value.path == ledgers[0]
+    assert caught.value.report["error"] == "hash_mismatch"
+
+
+def test_cli_timeline(ledgers, capsys):
+    assert main(["timeline", "--model-id", "m2", *ledgers]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3 and lines[0].startswith("2026-05-01T00:00:00")
+
+    assert main(["timeline", "--json", "--verify", *ledgers]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["event"]["details"]["i"] for r in records] == list(range(12))
+    assert records[0]["ledger"] == ledgers[0]
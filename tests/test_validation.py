@@ -0,0 +1,100 @@
+"""Compiled schema validators and validate-on-emit."""
+
+from __future__ import annotations
+
+import pytest
+
+from llm_audit_trail import (
+    AuditLogger,
+    SchemaValidationError,
+    iter_events,
+    record_approval,
+    register_dataset,
+    validate_log,
+)
+from llm_audit_trail.registry import available_schemas, load_schema
+from llm_audit_trail.validation import compile_schema, validator_for
+
+
+def test_every_bundled_schema_compiles_once():
+    for event_type in available_schemas():
+        assert validator_for(event_type) is validator_for(event_type)
+    assert validator_for("Ping") is None
+
+
+def test_compiled_validator_reports_paths():
+    validate = validator_for("RiskWaiver")
+    errors = validate(
+        {"decision": "approved", "rationale": "ok", "owner": "MRC",
+         "waived_controls": ["SLO", 7]}
+    )
+    assert errors == [
+        'details.decision: must be "waived"',
+        "details.rationale: shorter than 3",
+        "details.waived_controls[1]: expected string",
+    ]
+    assert validate(
+        {"decision": "waived", "rationale": "pilot", "owner": "MRC",
+         "waived_controls": ["SLO"], "time_bound_until": None}
+    ) == []
+
+
+def test_compiler_covers_closed_objects_and_bounds():
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {"score": {"type": "number", "maximum": 1}},
+            "additionalProperties": {"type": "integer", "minimum": 0},
+        }
+    )
+    assert validate({"score": 0.5, "rows": 3, "shards": 2.0}) == []
+    assert validate({"score": 2, "rows": -1, "flag": True}) == [
+        "details.score: violates maximum 1",
+        "details.rows: violates minimum 0",
+        "details.flag: expected integer",
+    ]
+    with pytest.raises(ValueError, match="unsupported"):
+        compile_schema({"oneOf": []})
+
+
+def test_validating_logger_rejects_before_chaining(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    log = AuditLogger(path=path, validate=True)
+    with pytest.raises(SchemaValidationError) as raised:
+        log.emit("Attestation", {"owner": "Compliance"})
+    assert raised.value.errors == ["details: missing required 'statement'"]
+    with pytest.raises(SchemaValidationError):
+        log.submit("Approval", {})
+
+    record_approval(log, owner="MRC", rationale="clears thresholds",
+                    scope={"model_id": "m"})
+    register_dataset(log, dataset_id="d", version="1", source="s", rows=10,
+                     content_hash="sha256:x", preprocessing={})
+    log.emit("Ping", {"anything": "goes"})
+    log.flush()
+    assert [e["event_type"] for e in iter_events(path)] == [
+        "Approval", "DatasetRegistered", "Ping"
+    ]
+    assert validate_log(path)["invalid"] == 0
+
+
+def test_load_schema_returns_independent_copies():
+    load_schema("Approval")["required"].clear()
+    assert load_schema("Approval")["required"]
+
+
+def test_non_string_event_type_is_a_violation_not_a_crash(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLogger(path=str(path))
+    log.emit("Ping")
+    log.flush()
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('{"event_type": ["Approval"], "details": {}}\n')
+        fh.write('{"event_type": {"a": 1}, "details": {}}\n')
+
+    report = validate_log(str(path), workers=2)
+    assert (report["events"], report["invalid"]) == (3, 2)
+    assert report["by_type"]['["Approval"]'] == {"events": 1, "invalid": 1}
+    assert [e["errors"] for e in report["examples"]] == [
+        ["event_type must be a string"]
+    ] * 2
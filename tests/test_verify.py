@@ -5,7 +5,17 @@ from __future__ import annotations
 import hashlib
 import json
 
-from llm_audit_trail import AuditLogger, read_head, verify_log, write_anchor
+import pytest
+
+from llm_audit_trail import (
+    AuditLogger,
+    iter_events,
+    iter_verification,
+    read_head,
+    verify_log,
+    write_anchor,
+)
+from llm_audit_trail import core
 from llm_audit_trail.core import GENESIS, _stable_json
 
 
@@ -264,3 +274,270 @@ def test_logger_verify_helper_reuses_its_own_key(tmp_path):
     log = _seed(path, count=2, key="s3cret")
     ok, report = log.verify()
     assert ok, report
+
+
+# --------------------------------------------------------------------------
+# canonical lines are hashed as stored
+# --------------------------------------------------------------------------
+
+
+def test_canonical_lines_verify_without_re_encoding(tmp_path, monkeypatch):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, key="k")
+
+    def refuse(obj):
+        raise AssertionError("canonical lines should not be re-encoded")
+
+    monkeypatch.setattr(core, "_stable_json", refuse)
+    ok, report = verify_log(str(path), key="k")
+    assert ok and report["events"] == 5
+
+
+def test_reformatted_lines_fall_back_to_re_encoding(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path)
+    records = [json.loads(line) for line in _lines(path)]
+    # same content, not canonical bytes: spaces and raw unicode
+    records[1]["details"]["note"] = "caf\u00e9"
+    _rechain(records)
+    path.write_text(
+        "".join(json.dumps(r, indent=None, ensure_ascii=False) + "\n" for r in records),
+        encoding="utf-8",
+    )
+
+    ok, report = verify_log(str(path))
+    assert ok and report["events"] == 5
+
+
+def test_spliced_body_is_the_hashed_body():
+    event = {"actor": None, "details": {"curr_hash": "x"}, "seq": 0}
+    body = _stable_json(event).encode()
+    line = _stable_json(dict(event, curr_hash="ab")).encode()
+    assert core._spliced_body(line, "ab") == body
+    first = _stable_json({"curr_hash": "ab", "z": 1}).encode()
+    assert core._spliced_body(first, "ab") == b'{"z":1}'
+    assert core._spliced_body(line, "cd") is None
+
+
+# --------------------------------------------------------------------------
+# collect-all-errors mode
+# --------------------------------------------------------------------------
+
+
+def test_all_mode_reports_every_break_in_one_pass(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=10)
+    lines = _lines(path)
+    edited = json.loads(lines[2])
+    edited["details"]["i"] = 999
+    lines[2] = _stable_json(edited) + "\n"
+    del lines[6]  # the event at seq 6
+    lines[8] = "{not json\n"
+    path.write_text("".join(lines))
+
+    ok, report = verify_log(str(path), mode="all")
+    assert not ok
+    assert report["error"] == "hash_mismatch"
+    assert [(e["error"], e["line"]) for e in report["errors"]] == [
+        ("hash_mismatch", 3),
+        ("broken_link", 7),
+        ("malformed_json", 9),
+    ]
+    assert [(d["first_line"], d["last_line"]) for d in report["damage"]] == [
+        (3, 3), (7, 7), (9, 9)
+    ]
+    # everything else still links once the chain is resumed past each break
+    assert report["events"] == 6
+    assert report["head"]["seq"] == 8
+
+
+def test_all_mode_groups_contiguous_damage(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=6)
+    lines = _lines(path)
+    lines[2:4] = ["garbage\n", "more garbage\n"]
+    path.write_text("".join(lines))
+
+    records = list(iter_verification(str(path)))
+    assert [r["type"] for r in records] == ["error", "error", "damage", "summary"]
+    assert records[2]["first_line"] == 3 and records[2]["last_line"] == 4
+    assert records[2]["codes"] == ["malformed_json"]
+    summary = records[-1]
+    assert (summary["ok"], summary["errors"], summary["damaged_ranges"]) == (False, 2, 1)
+    json.dumps(records)  # streamable as JSON lines
+
+
+def test_all_mode_reports_a_missing_prev_hash_after_resync(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=5)
+    lines = _lines(path)
+    lines[1] = "garbage\n"
+    record = json.loads(lines[2])
+    del record["prev_hash"]
+    lines[2] = _stable_json(record) + "\n"
+    path.write_text("".join(lines))
+
+    ok, report = verify_log(str(path), mode="all")
+    assert not ok
+    assert [(e["error"], e["line"]) for e in report["errors"]] == [
+        ("malformed_json", 2),
+        ("broken_link", 3),
+    ]
+    assert report["head"]["seq"] == 4
+    records = list(iter_verification(str(path)))
+    assert records[-1]["errors"] == 2
+
+
+def test_all_mode_stops_when_a_key_is_required(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=3, key="s3cret")
+
+    ok, report = verify_log(str(path), mode="all")
+    assert not ok
+    assert [e["error"] for e in report["errors"]] == ["key_required"]
+
+
+def test_all_mode_agrees_with_first_mode_on_a_clean_ledger(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=3)
+    anchor = write_anchor(str(path))
+    assert verify_log(str(path), mode="all", expected_head=anchor) == verify_log(
+        str(path), expected_head=anchor
+    )
+
+
+# --------------------------------------------------------------------------
+# spot checks
+# --------------------------------------------------------------------------
+
+
+def test_sample_passes_a_clean_ledger_and_reports_confidence(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=20)
+    ok, report = verify_log(str(path), sample=10)
+    assert ok
+    assert 1 <= report["sampled_events"] <= 10
+    assert report["head"] == read_head(str(path))
+    n = report["sampled_events"]
+    assert report["detection_probability"]["0.01"] == pytest.approx(1 - 0.99**n)
+
+
+def test_sample_catches_widespread_edits(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=10)
+    records = [json.loads(line) for line in _lines(path)]
+    for record in records[:-1]:
+        record["details"]["i"] += 100
+    _rewrite(path, records)
+
+    ok, report = verify_log(str(path), sample=3)
+    assert not ok and report["error"] == "hash_mismatch"
+    assert "offset" in report and "line" not in report
+
+
+def test_sample_always_checks_the_head_and_the_anchor(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=10)
+    anchor = write_anchor(str(path))
+    records = [json.loads(line) for line in _lines(path)]
+    records[-1]["details"]["i"] = -1
+    _rewrite(path, records)
+    ok, report = verify_log(str(path), sample=1)
+    assert not ok and report["error"] == "hash_mismatch"
+
+    _rewrite(path, records[:-1])  # tail truncated
+    ok, report = verify_log(str(path), sample=1, expected_head=anchor)
+    assert not ok and report["error"] == "anchor_missing"
+
+
+def test_sample_finds_the_anchored_event_by_seq(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = _seed(path, count=10)
+    anchor = write_anchor(str(path))
+    for i in range(10):
+        log.emit("E", {"i": i})
+    assert verify_log(str(path), sample=2, expected_head=anchor)[0]
+    forged = dict(anchor, hash="0" * 64)
+    ok, report = verify_log(str(path), sample=2, expected_head=forged)
+    assert not ok and report["error"] == "anchor_mismatch"
+
+
+def test_sample_reports_an_anchored_event_without_prev_hash(tmp_path, monkeypatch):
+    path = tmp_path / "audit.jsonl"
+    log = _seed(path, count=5)
+    anchor = write_anchor(str(path))
+    for i in range(5):
+        log.emit("E", {"i": i})
+    records = [json.loads(line) for line in _lines(path)]
+    del records[4]["prev_hash"]
+    _rewrite(path, records)
+
+    class FirstEvent:  # spot-check the first event, leaving the anchor to catch it
+        def randrange(self, lo, hi):
+            return lo
+
+    monkeypatch.setattr(core.random, "SystemRandom", FirstEvent)
+
+    ok, report = verify_log(str(path), sample=1, expected_head=anchor)
+    assert not ok and report["error"] == "broken_link"
+    assert "offset" in report
+
+
+def test_sample_rejects_bad_arguments(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=1)
+    with pytest.raises(ValueError):
+        verify_log(str(path), sample=0)
+    with pytest.raises(ValueError):
+        verify_log(str(path), sample=3, mode="all")
+
+
+# --------------------------------------------------------------------------
+# readers and in-flight writes
+# --------------------------------------------------------------------------
+
+
+def test_readers_stop_at_the_last_committed_line(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=3)
+    committed = read_head(str(path))
+    in_flight = _lines(path)[-1][:40]  # a write caught half way
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(in_flight)
+
+    assert read_head(str(path)) == committed
+    ok, report = verify_log(str(path))
+    assert ok and report["events"] == 3
+    assert report["pending_bytes"] == 40
+    assert verify_log(str(path), mode="all")[1]["pending_bytes"] == 40
+    assert [e["seq"] for e in iter_events(str(path))] == [0, 1, 2]
+
+
+def test_pending_bytes_are_only_reported_when_present(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=2)
+    assert "pending_bytes" not in verify_log(str(path))[1]
+
+
+def test_read_head_does_not_wait_for_the_writer_lock(tmp_path):
+    import threading
+
+    from llm_audit_trail.core import _file_lock
+
+    path = tmp_path / "audit.jsonl"
+    _seed(path, count=2)
+    held, release = threading.Event(), threading.Event()
+
+    def writer():
+        with open(path, "ab") as fh, _file_lock(fh):
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        held.wait(5)
+        assert read_head(str(path))["seq"] == 1
+    finally:
+        release.set()
+        thread.join()